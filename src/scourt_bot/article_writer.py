@@ -1,14 +1,25 @@
 from __future__ import annotations
 
+import logging
 import re
+import time
 from datetime import datetime
+from typing import Iterable, Iterator
 from zoneinfo import ZoneInfo
 
 from .config import Settings
 from .models import ArticleDraft, NoticeDetail, NoticeSummary
+from .summarizer import rank_sentences, resolve_engine
+
+LOGGER = logging.getLogger(__name__)
 
 KEYWORDS = ("대법원", "판결", "선고", "사건", "상고", "기각", "인용", "파기", "확정")
 CARD_BODY_LIMIT = 1000
+PDF_POINT_LIMIT = 8
+# 키워드 두 개, 또는 키워드 하나와 긴 문장이면 요약 후보로 충분하다고 본다.
+STRONG_POINT_SCORE = 4
+# TF-IDF 요약이 모으는 최대 문장 수. 이보다 긴 문서는 앞부분만 본다.
+SUMMARY_MAX_SENTENCES = 4000
 
 
 def _clean(text: str) -> str:
@@ -42,36 +53,72 @@ def _headline_from_title(title: str) -> str:
     return cleaned
 
 
-def _is_noise(sentence: str) -> bool:
-    checks = (
-        "공보관실",
-        "전화",
-        "☎",
-        "문의",
-        "보도자료",
-        "판결 결과 ▣",
-        "선고일자",
-        "사건개요",
-        "쟁점 및 판단",
-        "참조조문",
-        "참조판례",
-        "공소사실의 요지",
-        "판단 내용",
-        "쟁점(",
-        "▣",
-        "●",
-        "- 2 -",
-        "- 3 -",
-    )
-    if any(token in sentence for token in checks):
-        return True
+NOISE_TOKENS = (
+    "공보관실",
+    "전화",
+    "☎",
+    "문의",
+    "보도자료",
+    "판결 결과 ▣",
+    "선고일자",
+    "사건개요",
+    "쟁점 및 판단",
+    "참조조문",
+    "참조판례",
+    "공소사실의 요지",
+    "판단 내용",
+    "쟁점(",
+    "▣",
+    "●",
+    "- 2 -",
+    "- 3 -",
+)
+SENTENCE_ENDINGS = ("다.", "입니다.", "였습니다.", "하였습니다.", "습니다.", "였음.")
+
+
+def _alternation(tokens: Iterable[str]) -> re.Pattern[str]:
+    # 긴 토큰을 앞에 두어 같은 위치에서는 긴 쪽이 매칭되게 한다.
+    ordered = sorted(tokens, key=len, reverse=True)
+    return re.compile("|".join(re.escape(token) for token in ordered))
+
 
-    has_ending = sentence.endswith(
-        ("다.", "입니다.", "였습니다.", "하였습니다.", "습니다.", "였음.")
-    )
-    if len(sentence) < 40 and not has_ending:
+def _overlaps(token: str, other: str) -> bool:
+    # token 이 먼저 매칭되면 other 를 가릴 수 있는지(other 를 품거나 끝이 other 의 앞과 겹침)
+    if other in token:
         return True
-    return False
+    return any(token.endswith(other[:size]) for size in range(1, len(other)))
+
+
+class SentenceMatcher:
+    # 키워드와 잡음 토큰을 각각 정규식 하나로 찾는다. 잡음은 하나라도 있는지만 보면 되므로
+    # search 한 번이면 된다. 키워드는 서로 다른 개수를 세야 하는데 정규식 매칭은 겹치지
+    # 않으므로, 먼저 매칭된 키워드에 가려질 수 있는 키워드(예: "파기각"의 "기각")를 미리
+    # 구해 두고 그 키워드가 나왔을 때만 따로 확인한다.
+    def __init__(self, keywords: Iterable[str], noise_tokens: Iterable[str]):
+        keywords = tuple(dict.fromkeys(keywords))
+        self._keywords = _alternation(keywords)
+        self._noise = _alternation(noise_tokens)
+        self._shadowed = tuple(
+            (token, others)
+            for token in keywords
+            if (others := tuple(o for o in keywords if o != token and _overlaps(token, o)))
+        )
+
+    def scan(self, sentence: str) -> tuple[int, bool]:
+        # (찾은 서로 다른 키워드 수, 잡음 토큰 포함 여부)
+        found = set(self._keywords.findall(sentence))
+        for token, others in self._shadowed:
+            if token in found:
+                found.update(other for other in others if other in sentence)
+        return len(found), self._noise.search(sentence) is not None
+
+
+def _analyze(matcher: SentenceMatcher, sentence: str) -> tuple[int, bool]:
+    # (점수, 잡음 여부). 키워드마다 2점, 40자마다 1점(최대 2점).
+    hits, noise = matcher.scan(sentence)
+    if not noise and len(sentence) < 40 and not sentence.endswith(SENTENCE_ENDINGS):
+        noise = True
+    return hits * 2 + min(len(sentence) // 40, 2), noise
 
 
 def _compose_body(primary: list[str], secondary: list[str], limit: int) -> str:
@@ -106,22 +153,12 @@ def _compose_body(primary: list[str], secondary: list[str], limit: int) -> str:
     return body
 
 
-def _pick_key_points(text: str, limit: int = 3) -> list[str]:
-    candidates = _split_sentences(text)
-    if not candidates:
-        return []
-
-    scored = []
-    for sentence in candidates:
-        score = sum(2 for keyword in KEYWORDS if keyword in sentence)
-        score += min(len(sentence) // 40, 2)
-        scored.append((score, sentence))
-
-    scored.sort(key=lambda item: item[0], reverse=True)
+def _select_points(scored: list[tuple[int, bool, str]], limit: int) -> list[str]:
+    scored = sorted(scored, key=lambda item: item[0], reverse=True)
     selected: list[str] = []
     seen = set()
-    for _, sentence in scored:
-        if _is_noise(sentence):
+    for _, noise, sentence in scored:
+        if noise:
             continue
         if sentence in seen:
             continue
@@ -132,25 +169,112 @@ def _pick_key_points(text: str, limit: int = 3) -> list[str]:
     return selected
 
 
+def _iter_page_sentences(pages: Iterable[str]) -> Iterator[list[str]]:
+    # 페이지마다 그 페이지에서 끝난 문장들을 넘긴다. 페이지 경계에 걸친 문장은
+    # 다음 페이지와 이어 붙이고, 마지막에 남은 조각을 따로 한 번 더 넘긴다.
+    carry = ""
+    for page in pages:
+        chunks = re.split(r"(?<=[.!?])\s+", _clean(f"{carry} {page}"))
+        carry = "" if chunks[-1].endswith((".", "!", "?")) else chunks.pop()
+        yield _split_sentences("\n".join(chunks))
+    yield _split_sentences(carry)
+
+
+def _pick_key_points(
+    matcher: SentenceMatcher,
+    pages: Iterable[str],
+    limit: int = 3,
+) -> list[str]:
+    # 페이지를 하나씩 당겨 오고, 점수가 충분한 비잡음 문장이 limit 개 모이면 나머지
+    # 페이지는 읽지 않는다.
+    scored: list[tuple[int, bool, str]] = []
+    strong = 0
+    for sentences in _iter_page_sentences(pages):
+        for sentence in sentences:
+            score, noise = _analyze(matcher, sentence)
+            scored.append((score, noise, sentence))
+            if score >= STRONG_POINT_SCORE and not noise:
+                strong += 1
+        if strong >= limit:
+            break
+    return _select_points(scored, limit)
+
+
+def _rank_key_points(
+    matcher: SentenceMatcher,
+    pages: Iterable[str],
+    limit: int,
+    budget_seconds: float,
+) -> list[str]:
+    # 문서 전체의 TF-IDF 중심성과 MMR 로 고른다. 페이지는 SUMMARY_MAX_SENTENCES 문장까지
+    # 읽는다. 시계가 아니라 문장 수로 멈춰야 같은 문서에서 항상 같은 페이지까지 읽으므로
+    # 저장해 둔 추출 텍스트를 재사용해도 결과가 같다. 시간 예산은 순위 계산에만 쓰고,
+    # 넘기면 모은 문장을 키워드 점수로 고른다.
+    scored: list[tuple[int, bool, str]] = []
+    for sentences in _iter_page_sentences(pages):
+        scored.extend((*_analyze(matcher, sentence), sentence) for sentence in sentences)
+        if len(scored) >= SUMMARY_MAX_SENTENCES:
+            break
+    deadline = time.monotonic() + budget_seconds
+
+    candidates: dict[str, int] = {}
+    for score, noise, sentence in scored[:SUMMARY_MAX_SENTENCES]:
+        if not noise:
+            candidates.setdefault(sentence, score)
+    if len(candidates) <= limit:
+        return _select_points(scored, limit)
+
+    sentences = list(candidates)
+    order = rank_sentences(sentences, list(candidates.values()), limit, deadline=deadline)
+    if order is None:
+        LOGGER.info(
+            "요약 시간 예산 초과(%.1fs, %s문장): 키워드 점수 방식으로 대체합니다.",
+            budget_seconds,
+            len(sentences),
+        )
+        return _select_points(scored, limit)
+    return [_trim_sentence(sentences[index]) for index in order]
+
+
 class ArticleWriter:
     def __init__(self, settings: Settings):
         self.settings = settings
+        self.matcher = SentenceMatcher(KEYWORDS, NOISE_TOKENS)
+        self.summarizer = resolve_engine(settings.summarizer)
 
-    def build(
-        self,
-        summary: NoticeSummary,
-        detail: NoticeDetail,
-        pdf_text: str,
-    ) -> ArticleDraft:
+    def detail_body(self, detail: NoticeDetail) -> str:
         detail_points = []
         for sentence in _split_sentences(detail.body_text):
-            if _is_noise(sentence):
+            if _analyze(self.matcher, sentence)[1]:
                 continue
             detail_points.append(_trim_sentence(sentence))
+        return _compose_body(detail_points, [], CARD_BODY_LIMIT)
+
+    def needs_pdf_text(self, detail: NoticeDetail) -> bool:
+        return not self.detail_body(detail)
 
-        pdf_points = _pick_key_points(pdf_text, limit=8)
-        body = _compose_body(detail_points, [], CARD_BODY_LIMIT)
+    def key_points(self, pages: Iterable[str], limit: int = PDF_POINT_LIMIT) -> list[str]:
+        if self.summarizer == "tfidf":
+            return _rank_key_points(
+                self.matcher,
+                pages,
+                limit,
+                self.settings.summary_budget_seconds,
+            )
+        return _pick_key_points(self.matcher, pages, limit=limit)
+
+    def build(
+        self,
+        summary: NoticeSummary,
+        detail: NoticeDetail,
+        pdf_pages: Iterable[str] | str = (),
+    ) -> ArticleDraft:
+        # PDF 는 상세 본문이 비었을 때만 읽고, 그때도 필요한 페이지까지만 당겨 온다.
+        body = self.detail_body(detail)
         if not body:
+            if isinstance(pdf_pages, str):
+                pdf_pages = [pdf_pages]
+            pdf_points = self.key_points(pdf_pages)
             body = _compose_body([], pdf_points, CARD_BODY_LIMIT)
         if not body:
             body = _trim_sentence(detail.body_text or summary.title, max_len=CARD_BODY_LIMIT)
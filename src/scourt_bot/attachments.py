@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import logging
+import posixpath
+import re
+import zipfile
+from typing import Iterator
+from xml.etree import ElementTree
+
+from .pdf_extract import PdfSource, open_source
+
+LOGGER = logging.getLogger(__name__)
+
+OLE_MAGIC = b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1"
+ZIP_MAGIC = b"PK\x03\x04"
+HWPX_MIMETYPE = b"application/hwp+zip"
+HWPX_SECTION_RE = re.compile(r"^Contents/section(\d+)\.xml$", re.IGNORECASE)
+TEXT_SUFFIXES = (".txt", ".csv")
+
+# 압축 폭탄을 막기 위한 ZIP 멤버 한도
+MAX_MEMBER_BYTES = 64 * 1024 * 1024
+MAX_MEMBERS = 50
+
+
+def sniff_kind(data: PdfSource, name: str = "") -> str:
+    # URL 이 attachdownload?file=... 형태라 확장자를 믿을 수 없으므로 내용 앞부분으로 판단한다.
+    with open_source(data) as stream:
+        head = stream.read(1024)
+    # ZIP 안에 압축 없이 든 PDF 도 앞부분에 %PDF- 가 보이므로 컨테이너 서명을 먼저 본다.
+    if head.startswith(ZIP_MAGIC):
+        return "hwpx" if _is_hwpx(data) else "zip"
+    if head.startswith(OLE_MAGIC):
+        # HWP 5.x 바이너리(OLE 복합 문서). 텍스트 추출기는 없고 해시만 쓴다.
+        return "hwp"
+    if b"%PDF-" in head:
+        return "pdf"
+    if name.lower().endswith(TEXT_SUFFIXES):
+        return "text"
+    return "unknown"
+
+
+def _is_hwpx(data: PdfSource) -> bool:
+    try:
+        with open_source(data) as stream, zipfile.ZipFile(stream) as archive:
+            names = archive.namelist()
+            if "mimetype" in names and archive.read("mimetype").strip() == HWPX_MIMETYPE:
+                return True
+            return any(HWPX_SECTION_RE.match(name) for name in names)
+    except (zipfile.BadZipFile, OSError, KeyError):
+        return False
+
+
+def iter_hwpx_sections(source: PdfSource, issues: list[str]) -> Iterator[str]:
+    # HWPX 는 zip 안의 Contents/sectionN.xml 에 본문이 있다. 구역 하나를 한 페이지로 본다.
+    try:
+        with open_source(source) as stream, zipfile.ZipFile(stream) as archive:
+            sections = sorted(
+                (
+                    (int(match.group(1)), name)
+                    for name in archive.namelist()
+                    if (match := HWPX_SECTION_RE.match(name))
+                ),
+            )
+            for _, name in sections:
+                with archive.open(name) as handle:
+                    text = _xml_paragraphs(handle)
+                if text:
+                    yield text
+    except (zipfile.BadZipFile, ElementTree.ParseError, OSError) as exc:
+        issues.append(f"HWPX 추출 실패: {exc}")
+
+
+def _xml_paragraphs(handle) -> str:
+    # <hp:p> 단위로 줄을 나누고 <hp:t> 글자만 모은다.
+    paragraphs: list[str] = []
+    current: list[str] = []
+    for _, element in ElementTree.iterparse(handle, events=("end",)):
+        tag = element.tag.rsplit("}", 1)[-1]
+        if tag == "t" and element.text:
+            current.append(element.text)
+        elif tag == "p":
+            line = "".join(current).strip()
+            if line:
+                paragraphs.append(line)
+            current = []
+            element.clear()
+    return "\n".join(paragraphs)
+
+
+def iter_zip_members(source: PdfSource, issues: list[str]) -> Iterator[tuple[str, bytes]]:
+    # 멤버를 하나씩 풀어서 넘긴다. 전체를 한꺼번에 풀어 두지 않는다.
+    try:
+        with open_source(source) as stream, zipfile.ZipFile(stream) as archive:
+            members = [info for info in archive.infolist() if not info.is_dir()]
+            if len(members) > MAX_MEMBERS:
+                issues.append(f"ZIP 멤버가 많아 앞의 {MAX_MEMBERS}개만 읽습니다.")
+            for info in members[:MAX_MEMBERS]:
+                if info.file_size > MAX_MEMBER_BYTES:
+                    issues.append(f"ZIP 멤버가 너무 커서 건너뜁니다: {info.filename}")
+                    continue
+                with archive.open(info) as handle:
+                    data = handle.read(MAX_MEMBER_BYTES + 1)
+                if len(data) > MAX_MEMBER_BYTES:
+                    issues.append(f"ZIP 멤버가 너무 커서 건너뜁니다: {info.filename}")
+                    continue
+                yield posixpath.basename(info.filename), data
+    except (zipfile.BadZipFile, OSError, RuntimeError) as exc:
+        # RuntimeError: 암호가 걸린 멤버
+        issues.append(f"ZIP 추출 실패: {exc}")
+
+
+def decode_text(data: bytes) -> str:
+    for encoding in ("utf-8", "cp949"):
+        try:
+            return data.decode(encoding)
+        except UnicodeDecodeError:
+            continue
+    return data.decode("utf-8", errors="replace")
@@ -0,0 +1,395 @@
+from __future__ import annotations
+
+import argparse
+import functools
+import random
+import sqlite3
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Iterator
+
+from .article_writer import (
+    KEYWORDS,
+    NOISE_TOKENS,
+    SENTENCE_ENDINGS,
+    SUMMARY_MAX_SENTENCES,
+    SentenceMatcher,
+    _analyze,
+    _pick_key_points,
+    _rank_key_points,
+    _split_sentences,
+)
+from .pdf_archive import PdfArchive
+from .pdf_extract import (
+    ExtractionStats,
+    PdfSource,
+    iter_page_texts,
+    pdfplumber_pages,
+    pypdf_pages,
+    text_quality,
+)
+from .storage import StateStore
+from .summarizer import np, rank_sentences
+
+PageBackend = Callable[[PdfSource, int, list[str]], Iterator[str]]
+
+
+@dataclass
+class ExtractorResult:
+    name: str
+    documents: int = 0
+    pages: int = 0
+    empty_pages: int = 0
+    seconds: float = 0.0
+    quality_sum: float = 0.0
+    escalations: int = 0
+    errors: int = 0
+
+    @property
+    def ms_per_page(self) -> float:
+        return self.seconds * 1000 / self.pages if self.pages else 0.0
+
+    @property
+    def avg_quality(self) -> float:
+        non_empty = self.pages - self.empty_pages
+        return self.quality_sum / non_empty if non_empty else 0.0
+
+
+def _adaptive_pages(stats: ExtractionStats) -> PageBackend:
+    def run(source: PdfSource, max_pages: int, issues: list[str]) -> Iterator[str]:
+        return iter_page_texts(source, max_pages, issues, stats)
+
+    return run
+
+
+def benchmark_pdf_extractors(
+    sources: list[PdfSource], max_pages: int
+) -> list[ExtractorResult]:
+    adaptive_stats = ExtractionStats()
+    backends: dict[str, PageBackend] = {
+        "pypdf": pypdf_pages,
+        "pdfplumber": pdfplumber_pages,
+        "adaptive": _adaptive_pages(adaptive_stats),
+    }
+
+    results = []
+    for name, backend in backends.items():
+        result = ExtractorResult(name=name)
+        for source in sources:
+            issues: list[str] = []
+            pages_before = adaptive_stats.pages
+            started = time.perf_counter()
+            texts = list(backend(source, max_pages, issues))
+            result.seconds += time.perf_counter() - started
+            result.documents += 1
+            result.errors += len(issues)
+
+            if name == "adaptive":
+                # adaptive 는 빈 페이지를 건너뛰므로 페이지 수는 통계에서 가져온다.
+                page_count = adaptive_stats.pages - pages_before
+            else:
+                page_count = len(texts)
+            result.pages += page_count
+            non_empty = [text for text in texts if text]
+            result.empty_pages += page_count - len(non_empty)
+            result.quality_sum += sum(text_quality(text) for text in non_empty)
+        if name == "adaptive":
+            result.escalations = adaptive_stats.escalations
+        results.append(result)
+    return results
+
+
+def archived_pdf_sources(directory: Path, limit: int | None = None) -> list[PdfSource]:
+    # 보관소(<sha[:2]>/<sha>.pdf[.gz])와 예전 최상위 <notice_id>.pdf 를 함께 쓴다.
+    # .gz 는 여기서 미리 풀어 두어 압축 해제 시간이 추출 시간에 섞이지 않게 한다.
+    archive = PdfArchive(directory)
+    sources: list[PdfSource] = []
+    for sha256 in sorted(archive.scan()):
+        if limit and len(sources) >= limit:
+            return sources
+        source = archive.source(sha256)
+        if source is not None:
+            sources.append(source)
+    for path in sorted(archive.legacy_files()):
+        if limit and len(sources) >= limit:
+            break
+        sources.append(path)
+    return sources
+
+
+def _run_pdf(args: argparse.Namespace) -> int:
+    directory = Path(args.directory)
+    sources = archived_pdf_sources(directory, args.limit)
+    if not sources:
+        print(f"PDF 파일이 없습니다: {directory}")
+        return 1
+
+    results = benchmark_pdf_extractors(sources, args.max_pages)
+    print(f"documents={len(sources)} max_pages={args.max_pages}")
+    print(
+        f"{'backend':<12}{'pages':>7}{'empty':>7}{'ms/page':>10}"
+        f"{'quality':>9}{'escalated':>11}{'errors':>8}"
+    )
+    for item in results:
+        print(
+            f"{item.name:<12}{item.pages:>7}{item.empty_pages:>7}{item.ms_per_page:>10.1f}"
+            f"{item.avg_quality:>9.3f}{item.escalations:>11}{item.errors:>8}"
+        )
+    return 0
+
+
+def synthetic_judgment(pages: int, seed: int = 0) -> str:
+    # 판결문 비슷한 단어 분포로 만든 본문. 한 페이지 약 1,800자.
+    rng = random.Random(seed)
+    words = (
+        "원고 피고 원심 법원 계약 손해 배상 청구 이유 주장 증거 사실 인정 법리 오해 "
+        "위법 소송 당사자 채권 채무 해지 효력 판단 관련 규정 적용 해석 범위"
+    ).split() + list(KEYWORDS)
+    endings = ("하였다.", "이다.", "할 수 없다.", "인정된다.", "타당하다.")
+    lines = []
+    for page in range(pages):
+        chars = 0
+        while chars < 1800:
+            sentence = " ".join(rng.choice(words) for _ in range(rng.randint(4, 22)))
+            sentence = f"{sentence} {rng.choice(endings)}"
+            if rng.random() < 0.05:
+                sentence = f"{rng.choice(NOISE_TOKENS)} {sentence}"
+            lines.append(sentence)
+            chars += len(sentence)
+        lines.append(f"- {page + 2} -")
+    return "\n".join(lines)
+
+
+def _baseline_analyze(sentence: str) -> tuple[int, bool]:
+    # 토큰마다 문장을 다시 훑던 이전 방식. 비교 기준으로만 남겨 둔다.
+    score = sum(2 for keyword in KEYWORDS if keyword in sentence)
+    score += min(len(sentence) // 40, 2)
+    noise = any(token in sentence for token in NOISE_TOKENS)
+    if not noise and len(sentence) < 40 and not sentence.endswith(SENTENCE_ENDINGS):
+        noise = True
+    return score, noise
+
+
+def benchmark_writer(text: str, repeat: int = 3) -> dict[str, float]:
+    # 이전 방식(baseline)과 미리 컴파일한 SentenceMatcher(compiled)의 문장/s.
+    # 두 방식의 점수/잡음 판정이 같은지 먼저 확인하고, 반복 중 가장 빠른 값을 쓴다.
+    sentences = _split_sentences(text)
+    matcher = SentenceMatcher(KEYWORDS, NOISE_TOKENS)
+    compiled = [_analyze(matcher, sentence) for sentence in sentences]
+    baseline = [_baseline_analyze(sentence) for sentence in sentences]
+    if compiled != baseline:
+        mismatches = sum(1 for a, b in zip(compiled, baseline) if a != b)
+        raise AssertionError(f"점수/잡음 판정 불일치: {mismatches}건")
+
+    rates = {"sentences": float(len(sentences))}
+    for name, analyze in (
+        ("baseline", _baseline_analyze),
+        ("compiled", functools.partial(_analyze, matcher)),
+    ):
+        best = float("inf")
+        for _ in range(repeat):
+            started = time.perf_counter()
+            for sentence in sentences:
+                analyze(sentence)
+            best = min(best, time.perf_counter() - started)
+        rates[name] = len(sentences) / best if best > 0 else 0.0
+    return rates
+
+
+def _run_writer(args: argparse.Namespace) -> int:
+    if args.text:
+        text = Path(args.text).read_text(encoding="utf-8")
+        label = args.text
+    else:
+        text = synthetic_judgment(args.pages)
+        label = f"synthetic {args.pages} pages"
+    rates = benchmark_writer(text, repeat=args.repeat)
+    print(f"text={label} sentences={int(rates['sentences'])}")
+    print(f"{'matcher':<12}{'sentences/s':>14}")
+    for name in ("baseline", "compiled"):
+        print(f"{name:<12}{rates[name]:>14,.0f}")
+    if rates["baseline"]:
+        print(f"speedup={rates['compiled'] / rates['baseline']:.2f}x")
+    return 0
+
+
+def benchmark_summary(text: str, budget_seconds: float) -> dict[str, float]:
+    matcher = SentenceMatcher(KEYWORDS, NOISE_TOKENS)
+    timings: dict[str, float] = {}
+
+    started = time.perf_counter()
+    _pick_key_points(matcher, [text], limit=8)
+    timings["heuristic"] = time.perf_counter() - started
+
+    candidates: dict[str, int] = {}
+    for sentence in _split_sentences(text)[:SUMMARY_MAX_SENTENCES]:
+        score, noise = _analyze(matcher, sentence)
+        if not noise:
+            candidates.setdefault(sentence, score)
+    timings["sentences"] = float(len(candidates))
+    if np is None:
+        return timings
+
+    started = time.perf_counter()
+    rank_sentences(list(candidates), list(candidates.values()), 8, deadline=float("inf"))
+    timings["tfidf_unbounded"] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    _rank_key_points(matcher, [text], 8, budget_seconds)
+    timings["tfidf_budget"] = time.perf_counter() - started
+    return timings
+
+
+def _run_summary(args: argparse.Namespace) -> int:
+    if args.text:
+        text = Path(args.text).read_text(encoding="utf-8")
+        label = args.text
+    else:
+        text = synthetic_judgment(args.pages)
+        label = f"synthetic {args.pages} pages"
+    timings = benchmark_summary(text, args.budget)
+    print(f"text={label} candidates={int(timings.pop('sentences'))} budget={args.budget:.1f}s")
+    if np is None:
+        print("numpy 미설치: tfidf 엔진은 측정하지 않습니다.")
+    print(f"{'engine':<18}{'seconds':>10}")
+    for name, seconds in timings.items():
+        print(f"{name:<18}{seconds:>10.3f}")
+    return 0
+
+
+def _baseline_store_write(db_path: Path, notice_id: str, timestamp_iso: str) -> None:
+    # 호출마다 연결을 새로 열고 커밋하던 이전 방식(기본 저널, synchronous=FULL).
+    with sqlite3.connect(str(db_path)) as conn:
+        conn.execute(
+            """
+            INSERT INTO notices (
+                notice_id, title, posted_date, detail_url, content_hash,
+                article_text, created_at, updated_at
+            )
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(notice_id) DO UPDATE SET updated_at = excluded.updated_at
+            """,
+            (
+                notice_id,
+                f"보도자료 {notice_id}",
+                "2026-01-01",
+                f"https://example.invalid/{notice_id}",
+                notice_id,
+                "본문 " * 200,
+                timestamp_iso,
+                timestamp_iso,
+            ),
+        )
+        conn.commit()
+    with sqlite3.connect(str(db_path)) as conn:
+        conn.execute(
+            "UPDATE notices SET sent_at = ?, updated_at = ? WHERE notice_id = ?",
+            (timestamp_iso, timestamp_iso, notice_id),
+        )
+        conn.commit()
+
+
+def benchmark_store(count: int, batch_size: int) -> dict[str, float]:
+    # 글마다 upsert 와 mark_sent 를 한 번씩 한다. persistent 는 mark_sent 가 즉시 커밋하므로
+    # 전송까지 하는 경우이고, persistent_unsent 는 전송 없는 저장(백필/dry-run)이다.
+    timestamp_iso = "2026-01-01T00:00:00+09:00"
+    seconds: dict[str, float] = {}
+    with tempfile.TemporaryDirectory(prefix="scourt-bench-") as tmp:
+        baseline_path = Path(tmp) / "baseline.db"
+        StateStore(baseline_path).close()
+        # StateStore 가 WAL 로 바꿔 두므로 이전 방식 측정용 DB 는 기본 저널로 되돌린다.
+        with sqlite3.connect(str(baseline_path)) as conn:
+            conn.execute("PRAGMA journal_mode=DELETE")
+        started = time.perf_counter()
+        for index in range(count):
+            _baseline_store_write(baseline_path, str(index), timestamp_iso)
+        seconds["baseline"] = time.perf_counter() - started
+
+        for name, send in (("persistent", True), ("persistent_unsent", False)):
+            store = StateStore(Path(tmp) / f"{name}.db")
+            started = time.perf_counter()
+            with store.unit_of_work(batch_size=batch_size):
+                for index in range(count):
+                    notice_id = str(index)
+                    store.upsert_notice(
+                        notice_id=notice_id,
+                        title=f"보도자료 {notice_id}",
+                        posted_date="2026-01-01",
+                        detail_url=f"https://example.invalid/{notice_id}",
+                        pdf_url=None,
+                        pdf_hash=None,
+                        content_hash=notice_id,
+                        article_text="본문 " * 200,
+                        timestamp_iso=timestamp_iso,
+                    )
+                    if send:
+                        store.mark_sent(notice_id, timestamp_iso)
+            seconds[name] = time.perf_counter() - started
+            store.close()
+    return seconds
+
+
+def _run_store(args: argparse.Namespace) -> int:
+    seconds = benchmark_store(args.count, args.batch_size)
+    print(f"notices={args.count} batch_size={args.batch_size}")
+    print(f"{'store':<20}{'seconds':>10}{'notices/s':>12}")
+    for name, elapsed in seconds.items():
+        rate = args.count / elapsed if elapsed > 0 else 0.0
+        print(f"{name:<20}{elapsed:>10.3f}{rate:>12,.0f}")
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="scourt-benchmark",
+        description="Micro-benchmarks for the scourt bot hot paths.",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    pdf_parser = subparsers.add_parser(
+        "pdf",
+        help="PDF 추출기별 페이지당 시간과 텍스트 품질 점수 비교",
+    )
+    pdf_parser.add_argument("directory", nargs="?", default="data/pdfs", help="PDF 보관 디렉터리")
+    pdf_parser.add_argument("--max-pages", type=int, default=8, help="문서당 최대 페이지 수")
+    pdf_parser.add_argument("--limit", type=int, default=None, help="사용할 최대 문서 수")
+    pdf_parser.set_defaults(handler=_run_pdf)
+
+    writer_parser = subparsers.add_parser(
+        "writer",
+        help="기사 작성기의 문장 점수/잡음 판정 처리량(이전 방식 대비)",
+    )
+    writer_parser.add_argument("--pages", type=int, default=100, help="합성 본문 페이지 수")
+    writer_parser.add_argument("--text", default=None, help="합성 본문 대신 쓸 UTF-8 텍스트 파일")
+    writer_parser.add_argument("--repeat", type=int, default=3, help="반복 측정 횟수(최고값 사용)")
+    writer_parser.set_defaults(handler=_run_writer)
+
+    summary_parser = subparsers.add_parser(
+        "summary",
+        help="긴 문서 요약 시간(키워드 점수 방식 / TF-IDF 전체 / TF-IDF 예산 적용)",
+    )
+    summary_parser.add_argument("--pages", type=int, default=300, help="합성 본문 페이지 수")
+    summary_parser.add_argument("--text", default=None, help="합성 본문 대신 쓸 UTF-8 텍스트 파일")
+    summary_parser.add_argument("--budget", type=float, default=2.0, help="TF-IDF 요약 시간 예산(초)")
+    summary_parser.set_defaults(handler=_run_summary)
+
+    store_parser = subparsers.add_parser(
+        "store",
+        help="상태 DB 에 글 N건 저장/전송 기록 시간(호출별 연결 대비 지속 연결+묶음 커밋)",
+    )
+    store_parser.add_argument("--count", type=int, default=10000, help="저장할 글 수")
+    store_parser.add_argument("--batch-size", type=int, default=200, help="묶음 커밋 크기")
+    store_parser.set_defaults(handler=_run_store)
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -14,6 +14,13 @@ def _as_int(value: str, default: int) -> int:
         return default
 
 
+def _as_float(value: str, default: float) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return default
+
+
 def _as_bool(value: str | None, default: bool) -> bool:
     if value is None:
         return default
@@ -38,19 +45,55 @@ def _as_hours(value: str) -> tuple[int, ...]:
     return tuple(sorted(set(hours))) or (10, 18)
 
 
+def _as_list(value: str, default: tuple[str, ...]) -> tuple[str, ...]:
+    items: list[str] = []
+    for token in value.split(","):
+        token = token.strip()
+        if token and token not in items:
+            items.append(token)
+    return tuple(items) or default
+
+
 @dataclass(frozen=True)
 class Settings:
     list_url: str
-    gubun: str
+    gubuns: tuple[str, ...]
     max_pages: int
+    max_pages_cap: int
     timeout_seconds: int
     timezone: str
     schedule_hours: tuple[int, ...]
     db_path: Path
+    state_dir: Path
     pdf_dir: Path
+    http_cache_dir: Path
+    http_cache_max_mb: int
     teams_webhook_url: str | None
+    teams_digest_threshold: int
+    teams_digest_max_sections: int
     user_agent: str
+    html_parser: str
     bootstrap_skip_send: bool
+    workers: int
+    http_retries: int
+    http_backoff_seconds: float
+    http_rate_per_second: float
+    max_concurrency: int
+    pdf_workers: int
+    pdf_timeout_seconds: int
+    pdf_memory_mb: int
+    pdf_persist: bool
+    pdf_compress: bool
+    pdf_max_mb: int
+    pdf_max_age_days: int
+    db_compress: bool
+    db_article_retention_days: int
+    summarizer: str
+    summary_budget_seconds: float
+
+    @property
+    def gubun(self) -> str:
+        return self.gubuns[0]
 
     @classmethod
     def load(cls) -> "Settings":
@@ -58,33 +101,82 @@ class Settings:
 
         root = Path(os.getenv("SCOURT_ROOT_DIR", str(Path.cwd()))).resolve()
         db_path = Path(os.getenv("SCOURT_DB_PATH", "data/scourt_news.db"))
+        state_dir = Path(os.getenv("SCOURT_STATE_DIR", "data/state"))
         pdf_dir = Path(os.getenv("SCOURT_PDF_DIR", "data/pdfs"))
+        http_cache_dir = Path(os.getenv("SCOURT_HTTP_CACHE_DIR", "data/http_cache"))
         if not db_path.is_absolute():
             db_path = root / db_path
+        if not state_dir.is_absolute():
+            state_dir = root / state_dir
         if not pdf_dir.is_absolute():
             pdf_dir = root / pdf_dir
+        if not http_cache_dir.is_absolute():
+            http_cache_dir = root / http_cache_dir
 
         return cls(
             list_url=os.getenv(
                 "SCOURT_LIST_URL",
                 "https://www.scourt.go.kr/supreme/news/NewsListAction.work",
             ),
-            gubun=os.getenv("SCOURT_GUBUN", "702"),
+            gubuns=_as_list(os.getenv("SCOURT_GUBUN", "702"), ("702",)),
             max_pages=max(1, _as_int(os.getenv("SCOURT_MAX_PAGES", "2"), 2)),
+            max_pages_cap=max(1, _as_int(os.getenv("SCOURT_MAX_PAGES_CAP", "50"), 50)),
             timeout_seconds=max(
                 5, _as_int(os.getenv("SCOURT_TIMEOUT_SECONDS", "20"), 20)
             ),
             timezone=os.getenv("SCOURT_TIMEZONE", "Asia/Seoul"),
             schedule_hours=_as_hours(os.getenv("SCOURT_SCHEDULE_HOURS", "10,18")),
             db_path=db_path,
+            state_dir=state_dir,
             pdf_dir=pdf_dir,
+            http_cache_dir=http_cache_dir,
+            http_cache_max_mb=max(
+                0, _as_int(os.getenv("SCOURT_HTTP_CACHE_MAX_MB", "64"), 64)
+            ),
             teams_webhook_url=os.getenv("TEAMS_WEBHOOK_URL") or None,
+            teams_digest_threshold=max(
+                0, _as_int(os.getenv("SCOURT_TEAMS_DIGEST_THRESHOLD", "5"), 5)
+            ),
+            teams_digest_max_sections=max(
+                1, _as_int(os.getenv("SCOURT_TEAMS_DIGEST_MAX_SECTIONS", "10"), 10)
+            ),
             user_agent=os.getenv(
                 "SCOURT_USER_AGENT",
                 "scourt-news-bot/0.1 (+https://www.scourt.go.kr)",
             ),
+            html_parser=os.getenv("SCOURT_HTML_PARSER", "auto"),
             bootstrap_skip_send=_as_bool(
                 os.getenv("SCOURT_BOOTSTRAP_SKIP_SEND"),
                 True,
             ),
+            workers=max(1, _as_int(os.getenv("SCOURT_WORKERS", "1"), 1)),
+            http_retries=max(0, _as_int(os.getenv("SCOURT_HTTP_RETRIES", "3"), 3)),
+            http_backoff_seconds=max(
+                0.0, _as_float(os.getenv("SCOURT_HTTP_BACKOFF_SECONDS", "1.0"), 1.0)
+            ),
+            http_rate_per_second=max(
+                0.0, _as_float(os.getenv("SCOURT_HTTP_RATE_PER_SECOND", "5"), 5.0)
+            ),
+            max_concurrency=max(
+                1, _as_int(os.getenv("SCOURT_MAX_CONCURRENCY", "8"), 8)
+            ),
+            pdf_workers=max(0, _as_int(os.getenv("SCOURT_PDF_WORKERS", "2"), 2)),
+            pdf_timeout_seconds=max(
+                5, _as_int(os.getenv("SCOURT_PDF_TIMEOUT_SECONDS", "60"), 60)
+            ),
+            pdf_memory_mb=max(0, _as_int(os.getenv("SCOURT_PDF_MEMORY_MB", "1024"), 1024)),
+            pdf_persist=_as_bool(os.getenv("SCOURT_PDF_PERSIST"), True),
+            pdf_compress=_as_bool(os.getenv("SCOURT_PDF_COMPRESS"), False),
+            pdf_max_mb=max(0, _as_int(os.getenv("SCOURT_PDF_MAX_MB", "0"), 0)),
+            pdf_max_age_days=max(
+                0, _as_int(os.getenv("SCOURT_PDF_MAX_AGE_DAYS", "0"), 0)
+            ),
+            db_compress=_as_bool(os.getenv("SCOURT_DB_COMPRESS"), False),
+            db_article_retention_days=max(
+                0, _as_int(os.getenv("SCOURT_DB_ARTICLE_RETENTION_DAYS", "0"), 0)
+            ),
+            summarizer=os.getenv("SCOURT_SUMMARIZER", "heuristic"),
+            summary_budget_seconds=max(
+                0.1, _as_float(os.getenv("SCOURT_SUMMARY_BUDGET_SECONDS", "2.0"), 2.0)
+            ),
         )
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import logging
+import re
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+LOGGER = logging.getLogger(__name__)
+
+try:
+    import lxml  # noqa: F401
+except ImportError:  # pragma: no cover - optional at runtime
+    lxml = None
+
+
+def _class_pattern(*class_names: str) -> re.Pattern[str]:
+    # class 속성이 "tableVer x" 처럼 여러 값이어도 매칭되도록 공백 경계로 찾는다.
+    names = "|".join(re.escape(name) for name in class_names)
+    return re.compile(rf"(?:^|\s)(?:{names})(?:\s|$)")
+
+
+_LIST_CLASSES = _class_pattern("tableHor")
+_DETAIL_CLASSES = _class_pattern("tableVer", "contArea", "attTxt")
+
+
+class HtmlParserBackend:
+    name = "html.parser"
+
+    def parse_list(self, html: str) -> BeautifulSoup:
+        return BeautifulSoup(html, "html.parser")
+
+    def parse_detail(self, html: str) -> BeautifulSoup:
+        return BeautifulSoup(html, "html.parser")
+
+
+class LxmlParserBackend(HtmlParserBackend):
+    # 목록은 table.tableHor, 상세는 table.tableVer/td.contArea/td.attTxt 만 트리로 만든다.
+    name = "lxml"
+
+    def parse_list(self, html: str) -> BeautifulSoup:
+        return BeautifulSoup(
+            html,
+            "lxml",
+            parse_only=SoupStrainer("table", class_=_LIST_CLASSES),
+        )
+
+    def parse_detail(self, html: str) -> BeautifulSoup:
+        return BeautifulSoup(
+            html,
+            "lxml",
+            parse_only=SoupStrainer(["table", "td"], class_=_DETAIL_CLASSES),
+        )
+
+
+def get_parser_backend(name: str = "auto") -> HtmlParserBackend:
+    normalized = (name or "auto").strip().lower()
+    if normalized in {"auto", "lxml"}:
+        if lxml is not None:
+            return LxmlParserBackend()
+        if normalized == "lxml":
+            LOGGER.warning("lxml 미설치: html.parser 로 대체합니다.")
+        return HtmlParserBackend()
+    if normalized != HtmlParserBackend.name:
+        LOGGER.warning("알 수 없는 HTML 파서(%s): html.parser 를 사용합니다.", name)
+    return HtmlParserBackend()
@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+from urllib.parse import urlencode
+
+import requests
+
+LOGGER = logging.getLogger(__name__)
+
+_MAX_AGE_RE = re.compile(r"max-age=(\d+)")
+
+
+def fingerprint(body: bytes) -> str:
+    return hashlib.sha256(body).hexdigest()
+
+
+@dataclass
+class CacheEntry:
+    url: str
+    fingerprint: str
+    size: int
+    stored_at: float
+    etag: str | None = None
+    last_modified: str | None = None
+    expires_at: float | None = None
+    parsed: Any = None
+
+    def is_fresh(self, now: float | None = None) -> bool:
+        if self.expires_at is None:
+            return False
+        return (now or time.time()) < self.expires_at
+
+    def conditional_headers(self) -> dict[str, str]:
+        headers: dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+def entry_from_response(
+    response: requests.Response,
+    *,
+    body_fingerprint: str,
+    size: int,
+) -> CacheEntry | None:
+    cache_control = response.headers.get("Cache-Control", "").lower()
+    if "no-store" in cache_control:
+        return None
+
+    now = time.time()
+    expires_at = None
+    if "no-cache" not in cache_control:
+        match = _MAX_AGE_RE.search(cache_control)
+        if match:
+            expires_at = now + int(match.group(1))
+
+    return CacheEntry(
+        url=response.url,
+        fingerprint=body_fingerprint,
+        size=size,
+        stored_at=now,
+        etag=response.headers.get("ETag"),
+        last_modified=response.headers.get("Last-Modified"),
+        expires_at=expires_at,
+    )
+
+
+class HttpCache:
+    # 항목은 <key>.json(검증자, 본문 지문, 파싱 결과)과 선택적인 <key>.body 로 저장한다.
+    def __init__(self, cache_dir: Path, max_bytes: int):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._approx_bytes: int | None = None
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def key_for(url: str, params: dict[str, str] | None = None) -> str:
+        raw = url
+        if params:
+            raw = f"{url}?{urlencode(sorted(params.items()))}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _paths(self, key: str) -> tuple[Path, Path]:
+        shard = self.cache_dir / key[:2]
+        return shard / f"{key}.json", shard / f"{key}.body"
+
+    def get(self, key: str) -> CacheEntry | None:
+        meta_path, _ = self._paths(key)
+        try:
+            data = json.loads(meta_path.read_text(encoding="utf-8"))
+            entry = CacheEntry(**data)
+        except FileNotFoundError:
+            return None
+        except (OSError, TypeError, ValueError) as exc:
+            LOGGER.warning("HTTP 캐시 항목 손상 (%s): %s", key, exc)
+            self.delete(key)
+            return None
+        self._touch(meta_path)
+        return entry
+
+    def read_body(self, key: str) -> bytes | None:
+        _, body_path = self._paths(key)
+        try:
+            body = body_path.read_bytes()
+        except FileNotFoundError:
+            return None
+        self._touch(body_path)
+        return body
+
+    def put(self, key: str, entry: CacheEntry, body: bytes | None = None) -> None:
+        meta_path, body_path = self._paths(key)
+        with self._lock:
+            meta_path.parent.mkdir(parents=True, exist_ok=True)
+            written = 0
+            if body is not None:
+                _atomic_write(body_path, body)
+                written += len(body)
+            meta = json.dumps(asdict(entry), ensure_ascii=False).encode("utf-8")
+            _atomic_write(meta_path, meta)
+            written += len(meta)
+
+            # 디렉터리 전체 스캔은 누적 추정치가 한도를 넘을 때만 한다.
+            if self._approx_bytes is not None:
+                self._approx_bytes += written
+            if self.max_bytes > 0 and (
+                self._approx_bytes is None or self._approx_bytes > self.max_bytes
+            ):
+                self._approx_bytes = self._evict_locked()
+
+    def set_parsed(self, key: str, entry: CacheEntry, parsed: Any) -> None:
+        entry.parsed = parsed
+        self.put(key, entry)
+
+    def delete(self, key: str) -> None:
+        for path in self._paths(key):
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+
+    def _evict_locked(self) -> int:
+        # 항목(key) 단위로 최근 사용 시각과 크기를 모아 오래된 것부터 지운다.
+        entries: dict[str, list[float]] = {}
+        total = 0
+        for path in self.cache_dir.glob("*/*"):
+            if path.suffix not in {".json", ".body"}:
+                continue
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            usage = entries.setdefault(path.stem, [0.0, 0])
+            usage[0] = max(usage[0], stat.st_mtime)
+            usage[1] += stat.st_size
+            total += stat.st_size
+        if total <= self.max_bytes:
+            return total
+
+        for key, (_, size) in sorted(entries.items(), key=lambda item: item[1][0]):
+            if total <= self.max_bytes:
+                break
+            self.delete(key)
+            total -= size
+        return total
+
+    @staticmethod
+    def _touch(path: Path) -> None:
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
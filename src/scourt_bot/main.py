@@ -24,16 +24,209 @@ def _run_job(
     force: bool,
     dry_run: bool,
     max_pages: int | None,
+    workers: int | None = None,
 ) -> None:
     logger = logging.getLogger(__name__)
-    stats = pipeline.run_once(force=force, dry_run=dry_run, max_pages=max_pages)
+    stats = pipeline.run_once(
+        force=force,
+        dry_run=dry_run,
+        max_pages=max_pages,
+        workers=workers,
+    )
     logger.info(
-        "실행 완료: scanned=%s processed=%s sent=%s skipped=%s failed=%s",
+        "실행 완료: scanned=%s processed=%s sent=%s skipped=%s failed=%s unchanged=%s",
         stats.scanned,
         stats.processed,
         stats.sent,
         stats.skipped,
         stats.failed,
+        stats.unchanged,
+    )
+    logger.info(
+        "단계별 소요: elapsed=%.1fs %s",
+        stats.elapsed_seconds,
+        " ".join(f"{stage}={seconds:.1f}s" for stage, seconds in stats.stage_seconds.items()),
+    )
+    if len(stats.boards) > 1:
+        for gubun, board in stats.boards.items():
+            logger.info(
+                "게시판별 결과: gubun=%s scanned=%s processed=%s sent=%s skipped=%s "
+                "failed=%s unchanged=%s",
+                gubun,
+                board.scanned,
+                board.processed,
+                board.sent,
+                board.skipped,
+                board.failed,
+                board.unchanged,
+            )
+    concurrency = pipeline.limiter.snapshot()
+    logger.info(
+        "동시성: limit=%s peak=%s requests=%s errors=%s throttled=%s "
+        "latency_p50=%.0fms latency_p95=%.0fms",
+        concurrency.limit,
+        concurrency.peak_in_flight,
+        concurrency.requests,
+        concurrency.errors,
+        concurrency.throttled,
+        concurrency.latency_p50_ms,
+        concurrency.latency_p95_ms,
+    )
+
+
+def _run_backfill(
+    pipeline: ScourtPipeline,
+    *,
+    workers: int | None,
+    max_pages: int | None,
+    restart: bool,
+    gubun: str | None = None,
+) -> None:
+    logger = logging.getLogger(__name__)
+    boards = (gubun,) if gubun else pipeline.settings.gubuns
+    for board in boards:
+        stats = pipeline.backfill(
+            workers=workers,
+            max_pages=max_pages,
+            restart=restart,
+            gubun=board,
+        )
+        logger.info(
+            "백필 완료: gubun=%s start_page=%s pages=%s stored=%s skipped=%s failed=%s "
+            "elapsed=%.1fs throughput=%.2f건/s completed=%s",
+            board,
+            stats.start_page,
+            stats.pages,
+            stats.stored,
+            stats.skipped,
+            stats.failed,
+            stats.elapsed_seconds,
+            stats.notices_per_second,
+            stats.completed,
+        )
+
+
+def _run_gc(
+    pipeline: ScourtPipeline,
+    *,
+    max_mb: int | None,
+    max_age_days: int | None,
+    scan: bool,
+    dry_run: bool,
+) -> None:
+    stats = pipeline.gc_pdfs(
+        max_mb=max_mb,
+        max_age_days=max_age_days,
+        scan=scan,
+        dry_run=dry_run,
+    )
+    logging.getLogger(__name__).info(
+        "PDF 보관소 정리%s: scanned=%s removed=%s legacy_removed=%s indexed=%s "
+        "freed=%.1fMB kept=%s kept_size=%.1fMB",
+        " [DRY RUN]" if dry_run else "",
+        stats.scanned,
+        stats.removed,
+        stats.legacy_removed,
+        stats.indexed,
+        stats.freed_bytes / (1024 * 1024),
+        stats.kept,
+        stats.kept_bytes / (1024 * 1024),
+    )
+
+
+def _run_search(pipeline: ScourtPipeline, *, query: str, limit: int) -> None:
+    hits = pipeline.store.search(query, limit=limit)
+    if not hits:
+        print(f"검색 결과 없음: {query}")
+        return
+    for index, hit in enumerate(hits, start=1):
+        print(f"{index}. [{hit.posted_date}] {hit.title} (notice_id={hit.notice_id})")
+        print(f"   {hit.snippet}")
+        print(f"   {hit.detail_url}")
+
+
+def _run_history(pipeline: ScourtPipeline, *, limit: int) -> None:
+    runs = pipeline.store.recent_runs(limit)
+    if not runs:
+        print("실행 기록 없음")
+        return
+    for run in runs:
+        stages = " ".join(
+            f"{stage}={seconds:.1f}s" for stage, seconds in run["stage_seconds"].items()
+        )
+        print(
+            f"{run['started_at']} elapsed={run['elapsed_seconds']:.1f}s "
+            f"{'[DRY RUN] ' if run['dry_run'] else ''}boards={run['boards']} "
+            f"scanned={run['scanned']} processed={run['processed']} sent={run['sent']} "
+            f"skipped={run['skipped']} failed={run['failed']} unchanged={run['unchanged']} "
+            f"{stages}"
+        )
+
+
+def _run_unsent(pipeline: ScourtPipeline, *, limit: int) -> None:
+    notices = pipeline.store.list_unsent_notices(limit)
+    if not notices:
+        print("미전송 글 없음")
+        return
+    for notice in notices:
+        print(
+            f"[{notice['posted_date']}] {notice['title']} "
+            f"(notice_id={notice['notice_id']}, updated_at={notice['updated_at']})"
+        )
+        print(f"   {notice['detail_url']}")
+
+
+def _print_db_size(pipeline: ScourtPipeline) -> None:
+    report = pipeline.store.size_report()
+    mb = 1024 * 1024
+    print(
+        f"file={report.file_bytes / mb:.2f}MB wal={report.wal_bytes / mb:.2f}MB "
+        f"free={report.free_bytes / mb:.2f}MB"
+    )
+    print(
+        f"notices={report.notices} compressed_texts={report.compressed_texts} "
+        f"pruned={report.pruned} text={report.text_bytes / mb:.2f}MB"
+    )
+    for name, size in report.tables.items():
+        print(f"  {name:<32}{size / mb:>10.2f}MB")
+
+
+def _run_db_compact(
+    pipeline: ScourtPipeline,
+    *,
+    retention_days: int | None,
+    min_free_percent: float,
+) -> None:
+    stats = pipeline.compact_db(
+        retention_days=retention_days,
+        min_free_percent=min_free_percent,
+    )
+    logging.getLogger(__name__).info(
+        "상태 DB 정리: before=%.2fMB after=%.2fMB recoded=%s pruned=%s vacuumed=%s",
+        stats.before_bytes / (1024 * 1024),
+        stats.after_bytes / (1024 * 1024),
+        stats.recoded,
+        stats.pruned,
+        stats.vacuumed,
+    )
+
+
+def _run_state(pipeline: ScourtPipeline, args: argparse.Namespace) -> None:
+    if args.state_command == "export":
+        stats = pipeline.export_state(full=args.full, include_text=args.with_text)
+        action = "내보내기"
+    else:
+        stats = pipeline.import_state()
+        action = "가져오기"
+    logging.getLogger(__name__).info(
+        "상태 스냅숏 %s: dir=%s files=%s skipped_files=%s notices=%s metas=%s size=%.1fKB",
+        action,
+        pipeline.settings.state_dir,
+        stats.files,
+        stats.skipped_files,
+        stats.notices,
+        stats.metas,
+        stats.bytes / 1024,
     )
 
 
@@ -48,6 +241,7 @@ def _build_parser() -> argparse.ArgumentParser:
     run_parser.add_argument("--dry-run", action="store_true", help="Teams 전송 없이 실행")
     run_parser.add_argument("--force", action="store_true", help="기존 전송 건도 재전송")
     run_parser.add_argument("--max-pages", type=int, default=None, help="수집 페이지 수")
+    run_parser.add_argument("--workers", type=int, default=None, help="상세/PDF 병렬 수집 작업자 수")
 
     schedule_parser = subparsers.add_parser("schedule", help="10시/18시 스케줄 실행")
     schedule_parser.add_argument(
@@ -57,6 +251,117 @@ def _build_parser() -> argparse.ArgumentParser:
     )
     schedule_parser.add_argument("--run-now", action="store_true", help="스케줄 등록 전 1회 즉시 실행")
     schedule_parser.add_argument("--max-pages", type=int, default=None, help="수집 페이지 수")
+    schedule_parser.add_argument("--workers", type=int, default=None, help="상세/PDF 병렬 수집 작업자 수")
+
+    backfill_parser = subparsers.add_parser(
+        "backfill",
+        help="전체 과거 보도자료를 전송 없이 병렬 수집/저장(중단 시 이어서 진행)",
+    )
+    backfill_parser.add_argument("--workers", type=int, default=None, help="병렬 수집 작업자 수")
+    backfill_parser.add_argument(
+        "--max-pages",
+        type=int,
+        default=None,
+        help="이번 실행에서 처리할 최대 페이지 수(기본: 목록 끝까지)",
+    )
+    backfill_parser.add_argument(
+        "--restart",
+        action="store_true",
+        help="저장된 체크포인트를 무시하고 1페이지부터 다시 시작",
+    )
+    backfill_parser.add_argument(
+        "--gubun",
+        default=None,
+        help="백필할 게시판 gubun (기본: SCOURT_GUBUN 의 모든 게시판을 차례로)",
+    )
+
+    gc_parser = subparsers.add_parser(
+        "gc",
+        help="PDF 보관소를 용량/기간 한도 안으로 정리(오래 안 쓴 파일부터 삭제)",
+    )
+    gc_parser.add_argument(
+        "--max-mb",
+        type=int,
+        default=None,
+        help="보관소 최대 용량 MB (기본: SCOURT_PDF_MAX_MB, 0 이면 제한 없음)",
+    )
+    gc_parser.add_argument(
+        "--max-age-days",
+        type=int,
+        default=None,
+        help="마지막 사용 후 보관 일수 (기본: SCOURT_PDF_MAX_AGE_DAYS, 0 이면 제한 없음)",
+    )
+    gc_parser.add_argument(
+        "--scan",
+        action="store_true",
+        help="색인에 없는 파일도 찾아 색인에 추가한 뒤 정리",
+    )
+    gc_parser.add_argument("--dry-run", action="store_true", help="삭제 없이 결과만 출력")
+
+    search_parser = subparsers.add_parser(
+        "search",
+        help="저장된 보도자료의 제목/기사 전문 검색(관련도 순, PDF 텍스트는 저장된 일부만)",
+    )
+    search_parser.add_argument("query", help="검색어(공백으로 나눈 단어를 모두 포함)")
+    search_parser.add_argument("--limit", type=int, default=20, help="최대 결과 수")
+
+    subparsers.add_parser(
+        "reindex",
+        help="전문 검색 색인을 상태 DB 전체로 다시 만들기",
+    )
+
+    runs_parser = subparsers.add_parser("runs", help="최근 실행 기록(건수, 단계별 소요 시간)")
+    runs_parser.add_argument("--limit", type=int, default=30, help="출력할 실행 수")
+
+    unsent_parser = subparsers.add_parser(
+        "unsent",
+        help="저장됐지만 전송 기록이 없는 글(dry-run, 백필, 전송 실패), 최근 게시 순",
+    )
+    unsent_parser.add_argument("--limit", type=int, default=50, help="출력할 글 수")
+
+    db_parser = subparsers.add_parser("db", help="상태 DB 관리")
+    db_subparsers = db_parser.add_subparsers(dest="db_command", required=True)
+    compact_parser = db_subparsers.add_parser(
+        "compact",
+        help="본문 압축 형식 맞추기, 오래된 기사 본문 비우기, VACUUM",
+    )
+    compact_parser.add_argument(
+        "--retention-days",
+        type=int,
+        default=None,
+        help="전송 후 본문을 남길 일수 (기본: SCOURT_DB_ARTICLE_RETENTION_DAYS, 0 이면 모두 보존)",
+    )
+    compact_parser.add_argument(
+        "--min-free-percent",
+        type=float,
+        default=0.0,
+        help="빈 공간이 DB 파일의 이 비율(%%) 이상일 때만 VACUUM/색인 재구성 (기본 0: 항상)",
+    )
+    db_subparsers.add_parser("size", help="상태 DB 크기 보고(테이블/색인별)")
+
+    state_parser = subparsers.add_parser(
+        "state",
+        help="상태 DB 를 증분 스냅숏 파일(SCOURT_STATE_DIR)로 내보내기/가져오기",
+    )
+    state_subparsers = state_parser.add_subparsers(dest="state_command", required=True)
+    export_parser = state_subparsers.add_parser(
+        "export",
+        help="마지막 스냅숏 이후 바뀐 글/메타데이터를 새 스냅숏 파일로 추가",
+    )
+    export_parser.add_argument(
+        "--full",
+        action="store_true",
+        help="기존 스냅숏을 지우고 전체 상태를 스냅숏 하나로 다시 쓰기",
+    )
+    export_parser.add_argument(
+        "--with-text",
+        action="store_true",
+        help="기사/PDF 본문도 포함(기본: 중복 판정에 필요한 해시/전송 기록만)",
+    )
+    state_subparsers.add_parser(
+        "import",
+        help="아직 넣지 않은 스냅숏을 체크섬 확인 후 상태 DB 에 반영",
+    )
 
     return parser
 
@@ -68,16 +373,79 @@ def main(argv: list[str] | None = None) -> int:
 
     settings = Settings.load()
     pipeline = ScourtPipeline(settings)
+    try:
+        return _dispatch(args, settings, pipeline)
+    finally:
+        # WAL 을 DB 파일에 합쳐 두고 끝낸다(Actions 캐시는 DB 파일만 저장한다).
+        pipeline.store.close()
 
+
+def _dispatch(
+    args: argparse.Namespace,
+    settings: Settings,
+    pipeline: ScourtPipeline,
+) -> int:
     if args.command == "run":
         _run_job(
             pipeline,
             force=args.force,
             dry_run=args.dry_run,
             max_pages=args.max_pages,
+            workers=args.workers,
+        )
+        return 0
+
+    if args.command == "backfill":
+        _run_backfill(
+            pipeline,
+            workers=args.workers,
+            max_pages=args.max_pages,
+            restart=args.restart,
+            gubun=args.gubun,
+        )
+        return 0
+
+    if args.command == "gc":
+        _run_gc(
+            pipeline,
+            max_mb=args.max_mb,
+            max_age_days=args.max_age_days,
+            scan=args.scan,
+            dry_run=args.dry_run,
         )
         return 0
 
+    if args.command == "search":
+        _run_search(pipeline, query=args.query, limit=args.limit)
+        return 0
+
+    if args.command == "reindex":
+        count = pipeline.store.rebuild_search_index()
+        logging.getLogger(__name__).info("전문 검색 색인 재생성: notices=%s", count)
+        return 0
+
+    if args.command == "runs":
+        _run_history(pipeline, limit=args.limit)
+        return 0
+
+    if args.command == "unsent":
+        _run_unsent(pipeline, limit=args.limit)
+        return 0
+
+    if args.command == "state":
+        _run_state(pipeline, args)
+        return 0
+
+    if args.command == "db":
+        if args.db_command == "compact":
+            _run_db_compact(
+                pipeline,
+                retention_days=args.retention_days,
+                min_free_percent=args.min_free_percent,
+            )
+        _print_db_size(pipeline)
+        return 0
+
     scheduler = BlockingScheduler(timezone=ZoneInfo(settings.timezone))
     schedule_hours = ",".join(str(hour) for hour in settings.schedule_hours)
     scheduler.add_job(
@@ -90,6 +458,7 @@ def main(argv: list[str] | None = None) -> int:
             "force": False,
             "dry_run": args.dry_run,
             "max_pages": args.max_pages,
+            "workers": args.workers,
         },
         id="scourt_news_job",
         replace_existing=True,
@@ -107,6 +476,7 @@ def main(argv: list[str] | None = None) -> int:
             force=False,
             dry_run=args.dry_run,
             max_pages=args.max_pages,
+            workers=args.workers,
         )
 
     try:
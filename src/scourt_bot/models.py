@@ -1,7 +1,8 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Generator, Iterator
 
 
 @dataclass
@@ -25,9 +26,38 @@ class NoticeDetail:
 
 @dataclass
 class PdfResult:
-    path: Path
+    # 보관소(<pdf_dir>/<sha256[:2]>/<sha256>.pdf[.gz]) 경로. 사본이 없으면 None
+    path: Path | None
     sha256: str
     text: str
+    size: int = 0
+    etag: str | None = None
+    reused: bool = False
+    extracted: bool = True
+    stored_size: int | None = None
+    # 내용으로 판별한 첨부 종류: pdf, hwpx, zip, hwp, text, unknown
+    kind: str = "pdf"
+    # 아직 추출하지 않은 페이지. 끝까지 읽거나 close() 하면 text/extracted 가 채워진다.
+    pages: Generator[str, None, None] | None = field(default=None, repr=False)
+
+    def iter_pages(self) -> Iterator[str]:
+        if self.pages is None:
+            if self.text:
+                yield self.text
+            return
+        yield from self.pages
+
+    def close(self) -> None:
+        if self.pages is not None:
+            self.pages.close()
+
+
+@dataclass
+class PdfRecord:
+    sha256: str
+    text: str | None
+    size: int | None = None
+    etag: str | None = None
 
 
 @dataclass
@@ -37,6 +67,106 @@ class RunStats:
     sent: int = 0
     skipped: int = 0
     failed: int = 0
+    # 상세 본문/첨부 신호가 이전과 같아 첨부 수집·기사 생성 전에 건너뛴 건수
+    unchanged: int = 0
+    boards: dict[str, "RunStats"] = field(default_factory=dict)
+    # 단계(list/prepare/store/send)별 누적 소요 시간(초). 게시판이 동시에 돌면 합산된다.
+    stage_seconds: dict[str, float] = field(default_factory=dict)
+    started_at: str = ""
+    finished_at: str = ""
+    elapsed_seconds: float = 0.0
+
+    def add(self, other: "RunStats") -> None:
+        self.scanned += other.scanned
+        self.processed += other.processed
+        self.sent += other.sent
+        self.skipped += other.skipped
+        self.failed += other.failed
+        self.unchanged += other.unchanged
+        for stage, seconds in other.stage_seconds.items():
+            self.add_stage(stage, seconds)
+
+    def add_stage(self, stage: str, seconds: float) -> None:
+        self.stage_seconds[stage] = self.stage_seconds.get(stage, 0.0) + seconds
+
+
+@dataclass
+class BackfillStats:
+    start_page: int = 1
+    pages: int = 0
+    stored: int = 0
+    skipped: int = 0
+    failed: int = 0
+    elapsed_seconds: float = 0.0
+    completed: bool = False
+
+    @property
+    def notices_per_second(self) -> float:
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.stored / self.elapsed_seconds
+
+
+@dataclass
+class GcStats:
+    scanned: int = 0
+    removed: int = 0
+    freed_bytes: int = 0
+    kept: int = 0
+    kept_bytes: int = 0
+    indexed: int = 0
+    legacy_removed: int = 0
+
+
+@dataclass
+class DbSizeReport:
+    file_bytes: int = 0
+    wal_bytes: int = 0
+    # VACUUM 으로 돌려받을 수 있는 빈 페이지 크기
+    free_bytes: int = 0
+    notices: int = 0
+    # zlib 으로 저장된 article_text/pdf_text 값 수
+    compressed_texts: int = 0
+    # 보존 기간이 지나 본문을 비운 글 수
+    pruned: int = 0
+    text_bytes: int = 0
+    # 테이블/색인별 크기(dbstat 이 없으면 비어 있다)
+    tables: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def total_bytes(self) -> int:
+        return self.file_bytes + self.wal_bytes
+
+
+@dataclass
+class CompactStats:
+    before_bytes: int = 0
+    after_bytes: int = 0
+    recoded: int = 0
+    pruned: int = 0
+    vacuumed: bool = False
+
+
+@dataclass
+class SnapshotStats:
+    files: int = 0
+    notices: int = 0
+    metas: int = 0
+    bytes: int = 0
+    # import 때 이미 넣은 것으로 기록돼 건너뛴 파일 수
+    skipped_files: int = 0
+
+
+@dataclass
+class SearchHit:
+    notice_id: str
+    title: str
+    posted_date: str
+    detail_url: str
+    # 일치 부분을 [ ] 로 감싼 본문 발췌
+    snippet: str
+    # bm25 점수(작을수록 관련도가 높다). 전문 검색 색인 없이 찾은 결과는 0
+    rank: float = 0.0
 
 
 @dataclass
@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import gzip
+import logging
+import os
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+
+from .pdf_extract import PdfSource
+
+LOGGER = logging.getLogger(__name__)
+
+PLAIN_SUFFIX = ".pdf"
+COMPRESSED_SUFFIX = ".pdf.gz"
+
+
+@dataclass
+class StoredPdf:
+    sha256: str
+    path: Path
+    size: int
+    stored_size: int
+    compressed: bool
+
+
+class PdfArchive:
+    # sha256 이름으로 저장하는 내용 주소 방식 보관소. 같은 첨부가 다시 올라와도 한 벌만 둔다.
+    # <root>/<sha256[:2]>/<sha256>.pdf(.gz) 로 나눠 두어 디렉터리당 파일 수를 작게 유지한다.
+    def __init__(self, root: Path, *, compress: bool = False):
+        self.root = root
+        self.compress = compress
+
+    def _shard(self, sha256: str) -> Path:
+        return self.root / sha256[:2]
+
+    def find(self, sha256: str) -> Path | None:
+        shard = self._shard(sha256)
+        for suffix in (PLAIN_SUFFIX, COMPRESSED_SUFFIX):
+            path = shard / f"{sha256}{suffix}"
+            if path.exists():
+                return path
+        return None
+
+    def exists(self, sha256: str) -> bool:
+        return self.find(sha256) is not None
+
+    def put(self, sha256: str, body: bytes | bytearray | memoryview) -> StoredPdf:
+        size = memoryview(body).nbytes
+        existing = self.find(sha256)
+        if existing is not None:
+            return StoredPdf(
+                sha256=sha256,
+                path=existing,
+                size=size,
+                stored_size=existing.stat().st_size,
+                compressed=existing.name.endswith(COMPRESSED_SUFFIX),
+            )
+
+        suffix = COMPRESSED_SUFFIX if self.compress else PLAIN_SUFFIX
+        path = self._shard(sha256) / f"{sha256}{suffix}"
+        data = gzip.compress(body, compresslevel=6, mtime=0) if self.compress else body
+        _atomic_write(path, data)
+        return StoredPdf(
+            sha256=sha256,
+            path=path,
+            size=size,
+            stored_size=memoryview(data).nbytes,
+            compressed=self.compress,
+        )
+
+    def source(self, sha256: str) -> PdfSource | None:
+        # 압축하지 않은 파일은 경로를 넘겨 추출기가 mmap 으로 읽게 하고,
+        # 압축 파일은 메모리에 풀어서 넘긴다.
+        path = self.find(sha256)
+        if path is None:
+            return None
+        if path.name.endswith(COMPRESSED_SUFFIX):
+            try:
+                return gzip.decompress(path.read_bytes())
+            except (OSError, EOFError) as exc:
+                LOGGER.warning("손상된 PDF 보관 파일 삭제: %s (%s)", path, exc)
+                path.unlink(missing_ok=True)
+                return None
+        return path
+
+    def delete(self, sha256: str) -> int:
+        freed = 0
+        shard = self._shard(sha256)
+        for suffix in (PLAIN_SUFFIX, COMPRESSED_SUFFIX):
+            path = shard / f"{sha256}{suffix}"
+            try:
+                freed += path.stat().st_size
+                path.unlink()
+            except FileNotFoundError:
+                continue
+        return freed
+
+    def scan(self) -> dict[str, StoredPdf]:
+        # 색인(pdf_files)에 없는 파일을 찾을 때만 쓴다. 평소 목록/용량 계산은 DB 로 한다.
+        found: dict[str, StoredPdf] = {}
+        if not self.root.exists():
+            return found
+        for shard in os.scandir(self.root):
+            if not shard.is_dir() or len(shard.name) != 2:
+                continue
+            for entry in os.scandir(shard.path):
+                name = entry.name
+                compressed = name.endswith(COMPRESSED_SUFFIX)
+                if not compressed and not name.endswith(PLAIN_SUFFIX):
+                    continue
+                sha256 = name[: -len(COMPRESSED_SUFFIX if compressed else PLAIN_SUFFIX)]
+                stat = entry.stat()
+                found[sha256] = StoredPdf(
+                    sha256=sha256,
+                    path=Path(entry.path),
+                    size=stat.st_size,
+                    stored_size=stat.st_size,
+                    compressed=compressed,
+                )
+        return found
+
+    def legacy_files(self) -> list[Path]:
+        # 이전 버전이 <notice_id>.pdf 로 남긴 파일. 더 이상 읽지 않는다.
+        if not self.root.exists():
+            return []
+        return [
+            Path(entry.path)
+            for entry in os.scandir(self.root)
+            if entry.is_file() and entry.name.endswith(PLAIN_SUFFIX)
+        ]
+
+
+def _atomic_write(path: Path, data: bytes | bytearray | memoryview) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
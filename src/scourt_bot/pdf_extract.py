@@ -0,0 +1,358 @@
+from __future__ import annotations
+
+import io
+import logging
+import mmap
+import multiprocessing
+import os
+import re
+import tempfile
+import threading
+import time
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO, Iterator, Union
+
+LOGGER = logging.getLogger(__name__)
+
+try:
+    import pdfplumber
+except ImportError:  # pragma: no cover - optional at runtime
+    pdfplumber = None
+
+try:
+    from pypdf import PdfReader
+except ImportError:  # pragma: no cover - optional at runtime
+    PdfReader = None
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - not available on Windows
+    resource = None
+
+
+class ExtractionError(Exception):
+    pass
+
+
+class ExtractionTimeout(ExtractionError):
+    pass
+
+
+HANGUL_RE = re.compile(r"[가-힣]")
+LETTER_RE = re.compile(r"[가-힣A-Za-z]")
+MIN_PAGE_CHARS = 20
+QUALITY_THRESHOLD = 0.6
+
+
+# 디스크의 PDF 경로 또는 내려받은 본문 버퍼
+PdfSource = Union[Path, bytes, bytearray, memoryview]
+
+
+@dataclass
+class ExtractionStats:
+    pages: int = 0
+    escalations: int = 0
+
+
+def clean_text(text: str) -> str:
+    return " ".join(text.split())
+
+
+def text_quality(text: str) -> float:
+    # 0~1 점수: 한글 비율이 낮거나, 띄어쓰기가 사라졌거나(어절이 지나치게 길다),
+    # 글자 단위로 쪼개진(한 글자 토큰이 많다) 페이지는 낮게 본다.
+    stripped = text.strip()
+    if len(stripped) < MIN_PAGE_CHARS:
+        return 0.0
+    letters = len(LETTER_RE.findall(stripped))
+    if not letters:
+        return 0.0
+    hangul_ratio = len(HANGUL_RE.findall(stripped)) / letters
+
+    tokens = stripped.split()
+    avg_token_len = sum(len(token) for token in tokens) / len(tokens)
+    single_char_ratio = sum(1 for token in tokens if len(token) == 1) / len(tokens)
+
+    spacing = 1.0
+    if avg_token_len > 12:
+        spacing *= max(0.0, 1 - (avg_token_len - 12) / 12)
+    if single_char_ratio > 0.3:
+        spacing *= max(0.0, 1 - (single_char_ratio - 0.3) / 0.7)
+    return round(min(1.0, hangul_ratio / 0.5) * spacing, 3)
+
+
+def source_name(source: PdfSource) -> str:
+    if isinstance(source, Path):
+        return source.name
+    return f"<memory {memoryview(source).nbytes} bytes>"
+
+
+@contextmanager
+def open_source(source: PdfSource) -> Iterator[BinaryIO]:
+    # 파일은 mmap 으로 열어 페이지 캐시를 그대로 읽고, 버퍼는 BytesIO 로 감싼다.
+    # 리더마다 위치가 따로 필요하므로 호출할 때마다 새 스트림을 돌려준다.
+    if not isinstance(source, Path):
+        yield io.BytesIO(source)
+        return
+    with source.open("rb") as handle:
+        try:
+            mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):  # 빈 파일 등은 mmap 할 수 없다
+            yield handle
+            return
+        with mapped:
+            yield mapped
+
+
+def pypdf_pages(source: PdfSource, max_pages: int, issues: list[str]) -> Iterator[str]:
+    if PdfReader is None:
+        return
+    with open_source(source) as stream:
+        try:
+            reader = PdfReader(stream)
+            pages = reader.pages[:max_pages]
+        except Exception as exc:  # pragma: no cover - depends on source PDFs
+            issues.append(f"pypdf 추출 실패 ({source_name(source)}): {exc}")
+            return
+        for page in pages:
+            try:
+                yield (page.extract_text() or "").strip()
+            except Exception as exc:  # pragma: no cover - depends on source PDFs
+                issues.append(f"pypdf 페이지 추출 실패 ({source_name(source)}): {exc}")
+                yield ""
+
+
+def pdfplumber_pages(
+    source: PdfSource, max_pages: int, issues: list[str]
+) -> Iterator[str]:
+    if pdfplumber is None:
+        return
+    with open_source(source) as stream:
+        try:
+            with pdfplumber.open(stream) as pdf:
+                for page in pdf.pages[:max_pages]:
+                    yield (page.extract_text() or "").strip()
+        except Exception as exc:  # pragma: no cover - depends on source PDFs
+            issues.append(f"pdfplumber 추출 실패 ({source_name(source)}): {exc}")
+
+
+class _LazyPlumber:
+    # 품질이 낮은 페이지가 나올 때만 pdfplumber 로 문서를 연다.
+    def __init__(self, source: PdfSource):
+        self.source = source
+        self._stack = ExitStack()
+        self._pdf = None
+        self._failed = pdfplumber is None
+
+    def page_text(self, index: int, issues: list[str]) -> str:
+        if self._failed:
+            return ""
+        try:
+            if self._pdf is None:
+                stream = self._stack.enter_context(open_source(self.source))
+                self._pdf = self._stack.enter_context(pdfplumber.open(stream))
+            return (self._pdf.pages[index].extract_text() or "").strip()
+        except Exception as exc:  # pragma: no cover - depends on source PDFs
+            issues.append(f"pdfplumber 추출 실패 ({source_name(self.source)}): {exc}")
+            self._failed = True
+            return ""
+
+    def close(self) -> None:
+        self._pdf = None
+        self._stack.close()
+
+
+def iter_page_texts(
+    source: PdfSource,
+    max_pages: int,
+    issues: list[str],
+    stats: ExtractionStats | None = None,
+) -> Iterator[str]:
+    # 빠른 pypdf 로 먼저 뽑고, 품질 기준에 못 미치는 페이지만 pdfplumber 로 다시 뽑는다.
+    stats = stats if stats is not None else ExtractionStats()
+    plumber = _LazyPlumber(source)
+    try:
+        if PdfReader is not None:
+            fast_pages = pypdf_pages(source, max_pages, issues)
+        else:
+            fast_pages = pdfplumber_pages(source, max_pages, issues)
+
+        produced = False
+        for index, text in enumerate(fast_pages):
+            produced = True
+            stats.pages += 1
+            quality = text_quality(text)
+            if quality < QUALITY_THRESHOLD and PdfReader is not None:
+                fallback = plumber.page_text(index, issues)
+                stats.escalations += 1
+                if fallback and text_quality(fallback) > quality:
+                    text = fallback
+            if text:
+                yield text
+
+        if not produced and PdfReader is not None:
+            # pypdf 가 문서를 아예 열지 못한 경우
+            for text in pdfplumber_pages(source, max_pages, issues):
+                stats.pages += 1
+                if text:
+                    yield text
+    finally:
+        plumber.close()
+
+
+def extract_text(source: PdfSource, max_pages: int, issues: list[str]) -> str:
+    return clean_text("\n".join(iter_page_texts(source, max_pages, issues)))
+
+
+def _current_address_space() -> int:
+    try:
+        with open("/proc/self/statm", encoding="ascii") as handle:
+            pages = int(handle.read().split()[0])
+        return pages * resource.getpagesize()
+    except (OSError, ValueError, IndexError):
+        return 0
+
+
+def _limit_memory(memory_bytes: int) -> None:
+    if resource is None or memory_bytes <= 0:
+        return
+    # 이미 잡혀 있는 주소 공간 위에 문서당 한도를 더한다.
+    limit = _current_address_space() + memory_bytes
+    try:
+        _, hard = resource.getrlimit(resource.RLIMIT_AS)
+        if hard != resource.RLIM_INFINITY:
+            limit = min(limit, hard)
+        resource.setrlimit(resource.RLIMIT_AS, (limit, hard))
+    except (ValueError, OSError):  # pragma: no cover - platform dependent
+        pass
+
+
+def _worker_main(conn, pdf_path: str, max_pages: int, memory_bytes: int) -> None:
+    # 페이지는 나오는 대로 보내서 부모가 필요한 만큼만 받고 멈출 수 있게 한다.
+    issues: list[str] = []
+    try:
+        _limit_memory(memory_bytes)
+        for text in iter_page_texts(Path(pdf_path), max_pages, issues):
+            conn.send(("page", text, []))
+        conn.send(("ok", None, issues))
+    except BaseException as exc:  # noqa: BLE001 - 워커 실패는 부모에 전달
+        try:
+            conn.send(("error", f"{exc.__class__.__name__}: {exc}", issues))
+        except Exception:
+            pass
+    finally:
+        conn.close()
+
+
+def _spill(source: PdfSource) -> Path:
+    # 메모리 버퍼는 임시 파일로 넘긴다. 파이프로 보내면 작업자가 받기 전에 죽거나
+    # 멈췄을 때 send_bytes 가 시간 제한 없이 막힐 수 있다.
+    fd, name = tempfile.mkstemp(prefix="scourt-", suffix=".pdf")
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(source)
+    except BaseException:
+        Path(name).unlink(missing_ok=True)
+        raise
+    return Path(name)
+
+
+def _context() -> multiprocessing.context.BaseContext:
+    # 작업 스레드가 도는 프로세스에서 fork 하지 않도록 forkserver 를 우선 쓴다.
+    methods = multiprocessing.get_all_start_methods()
+    if "forkserver" in methods:
+        ctx = multiprocessing.get_context("forkserver")
+        ctx.set_forkserver_preload([__name__])
+        return ctx
+    return multiprocessing.get_context("spawn")
+
+
+class ExtractionPool:
+    # 문서마다 짧게 사는 프로세스를 띄우고 동시 실행 수를 workers 로 제한한다.
+    # 멈춘 문서는 해당 프로세스만 죽이면 되므로 다른 문서에 영향이 없다.
+    def __init__(self, *, workers: int, timeout_seconds: float, memory_mb: int):
+        self.workers = workers
+        self.timeout_seconds = timeout_seconds
+        self.memory_bytes = max(0, memory_mb) * 1024 * 1024
+        self._slots = threading.BoundedSemaphore(max(1, workers))
+        self._ctx = _context() if workers > 0 else None
+
+    def extract(self, source: PdfSource, max_pages: int) -> str:
+        return clean_text("\n".join(self.iter_pages(source, max_pages)))
+
+    def iter_pages(self, source: PdfSource, max_pages: int) -> Iterator[str]:
+        # 호출자가 중간에 멈추고 close() 하면 남은 페이지는 추출하지 않는다.
+        if self._ctx is None:
+            issues: list[str] = []
+            try:
+                yield from iter_page_texts(source, max_pages, issues)
+            finally:
+                _log_issues(issues)
+            return
+
+        with self._slots:
+            yield from self._iter_in_process(source, max_pages)
+
+    def _iter_in_process(self, source: PdfSource, max_pages: int) -> Iterator[str]:
+        assert self._ctx is not None
+        name = source_name(source)
+        spilled = None if isinstance(source, Path) else _spill(source)
+        try:
+            yield from self._run_worker(spilled or source, name, max_pages)
+        finally:
+            if spilled is not None:
+                spilled.unlink(missing_ok=True)
+
+    def _run_worker(self, pdf_path: Path, name: str, max_pages: int) -> Iterator[str]:
+        assert self._ctx is not None
+        parent_conn, child_conn = self._ctx.Pipe(duplex=False)
+        process = self._ctx.Process(
+            target=_worker_main,
+            args=(child_conn, str(pdf_path), max_pages, self.memory_bytes),
+            daemon=True,
+        )
+        process.start()
+        child_conn.close()
+        # 제한 시간은 페이지를 기다린 시간만 센다. 호출자가 yield 에서 멈춰 있는
+        # 동안(요약 등)은 작업자 탓이 아니므로 빼고 계산한다.
+        remaining = self.timeout_seconds
+        finished = False
+        try:
+            while True:
+                waited_from = time.monotonic()
+                ready = parent_conn.poll(max(0.0, remaining))
+                remaining -= time.monotonic() - waited_from
+                if not ready:
+                    raise ExtractionTimeout(
+                        f"{name}: {self.timeout_seconds:.0f}초 안에 추출되지 않았습니다."
+                    )
+                try:
+                    status, payload, issues = parent_conn.recv()
+                except (EOFError, OSError) as exc:
+                    # 작업자가 보내는 도중 죽으면(RLIMIT_AS 초과, OOM kill 등) EOF 대신
+                    # ConnectionResetError 가 날 수 있다.
+                    raise ExtractionError(
+                        f"{name}: 추출 프로세스가 비정상 종료했습니다."
+                    ) from exc
+                if status == "page":
+                    yield payload
+                    continue
+                finished = True
+                _log_issues(issues)
+                if status != "ok":
+                    raise ExtractionError(f"{name}: {payload}")
+                return
+        finally:
+            parent_conn.close()
+            if finished:
+                process.join(1)
+            if process.is_alive():
+                process.kill()
+            process.join()
+
+
+def _log_issues(issues: list[str]) -> None:
+    for issue in issues:
+        LOGGER.warning(issue)
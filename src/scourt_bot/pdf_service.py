@@ -2,78 +2,374 @@ from __future__ import annotations
 
 import hashlib
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Callable, Generator, Iterator
 
 import requests
 
+from .attachments import decode_text, iter_hwpx_sections, iter_zip_members, sniff_kind
 from .config import Settings
-from .models import PdfResult
+from .http_cache import CacheEntry, HttpCache, entry_from_response
+from .models import PdfRecord, PdfResult
+from .pdf_archive import PdfArchive
+from .pdf_extract import ExtractionError, ExtractionPool, PdfSource, clean_text
 
 LOGGER = logging.getLogger(__name__)
 
-try:
-    import pdfplumber
-except ImportError:  # pragma: no cover - optional at runtime
-    pdfplumber = None
+READ_CHUNK_BYTES = 256 * 1024
+ATTACHMENT_WORKERS = 4
 
-try:
-    from pypdf import PdfReader
-except ImportError:  # pragma: no cover - optional at runtime
-    PdfReader = None
 
+def _content_length(response: requests.Response) -> int | None:
+    # 압축 전송이면 Content-Length 가 풀린 본문 크기와 다르므로 쓰지 않는다.
+    if response.headers.get("Content-Encoding", "identity").lower() != "identity":
+        return None
+    try:
+        length = int(response.headers.get("Content-Length", ""))
+    except ValueError:
+        return None
+    return length if length > 0 else None
 
-def _clean(text: str) -> str:
-    return " ".join(text.split())
+
+def _read_body(response: requests.Response, sha256) -> memoryview:
+    # Content-Length 크기로 한 번 잡은 버퍼에 바로 읽어 들이면서 해시한다.
+    # 길이를 모르거나 더 길게 오면 남은 본문을 덧붙인다.
+    buffer = bytearray(_content_length(response) or READ_CHUNK_BYTES)
+    size = 0
+    raw = response.raw
+    raw.decode_content = True
+    while True:
+        if size == len(buffer):
+            chunk = raw.read(READ_CHUNK_BYTES)
+            if not chunk:
+                break
+            buffer += chunk
+            sha256.update(chunk)
+            size += len(chunk)
+            continue
+        with memoryview(buffer)[size : size + READ_CHUNK_BYTES] as window:
+            read = raw.readinto(window)
+            if not read:
+                break
+            sha256.update(window[:read])
+        size += read
+    del buffer[size:]
+    return memoryview(buffer)
 
 
 class PdfService:
-    def __init__(self, settings: Settings, session: requests.Session | None = None):
+    def __init__(
+        self,
+        settings: Settings,
+        session: requests.Session | None = None,
+        cache: HttpCache | None = None,
+    ):
         self.settings = settings
+        self.cache = cache
         self.session = session or requests.Session()
         self.session.headers.update({"User-Agent": self.settings.user_agent})
-        self.settings.pdf_dir.mkdir(parents=True, exist_ok=True)
+        self.archive = (
+            PdfArchive(settings.pdf_dir, compress=settings.pdf_compress)
+            if settings.pdf_persist
+            else None
+        )
+        self._attachment_pool = ThreadPoolExecutor(
+            max_workers=ATTACHMENT_WORKERS,
+            thread_name_prefix="scourt-attachment",
+        )
+        self.extractor = ExtractionPool(
+            workers=settings.pdf_workers,
+            timeout_seconds=settings.pdf_timeout_seconds,
+            memory_mb=settings.pdf_memory_mb,
+        )
 
-    def download_and_extract(self, pdf_url: str, notice_id: str) -> PdfResult:
-        output_path = self.settings.pdf_dir / f"{notice_id}.pdf"
-        sha256 = hashlib.sha256()
+    def download_and_extract(
+        self,
+        pdf_url: str,
+        notice_id: str,
+        *,
+        previous: PdfRecord | None = None,
+        text_lookup: Callable[[str], str | None] | None = None,
+        extract: bool = True,
+    ) -> PdfResult:
+        # extract=False 면 해시만 계산한다. extract=True 여도 텍스트는 바로 뽑지 않고
+        # result.pages 로 넘겨, 읽는 쪽이 필요한 페이지까지만 추출되게 한다.
+
+        # 이전에 추출해 둔 텍스트가 있으면(해시만 필요하면 텍스트 없이도) HEAD 로 먼저
+        # 확인하고 본문은 받지 않는다.
+        if previous is not None and (previous.text is not None or not extract):
+            if self.is_unchanged_remote(pdf_url, previous):
+                LOGGER.info("PDF 변경 없음(HEAD): notice_id=%s", notice_id)
+                path, stored_size = self._archived(previous.sha256)
+                return PdfResult(
+                    path=path,
+                    stored_size=stored_size,
+                    sha256=previous.sha256,
+                    text=previous.text or "",
+                    size=previous.size or 0,
+                    etag=previous.etag,
+                    reused=True,
+                    extracted=previous.text is not None,
+                )
+
+        # PDF 본문은 보관소에 있으므로 캐시에는 검증자/해시/추출 텍스트만 둔다.
+        # 304 를 받고 텍스트를 새로 뽑아야 하는데 보관된 사본이 없으면 조건부 요청을 쓰지 않는다.
+        cache_key = HttpCache.key_for(pdf_url) if self.cache is not None else None
+        cached = self.cache.get(cache_key) if self.cache is not None else None
+        if (
+            cached is not None
+            and extract
+            and not isinstance(cached.parsed, str)
+            and (self.archive is None or not self.archive.exists(cached.fingerprint))
+        ):
+            cached = None
+        if (
+            cached is not None
+            and cached.is_fresh()
+            and (isinstance(cached.parsed, str) or not extract)
+        ):
+            text = cached.parsed if isinstance(cached.parsed, str) else None
+            path, stored_size = self._archived(cached.fingerprint)
+            return PdfResult(
+                path=path,
+                stored_size=stored_size,
+                sha256=cached.fingerprint,
+                text=text or "",
+                size=cached.size,
+                etag=cached.etag,
+                reused=True,
+                extracted=text is not None,
+            )
 
+        sha256 = hashlib.sha256()
         with self.session.get(
             pdf_url,
+            headers=cached.conditional_headers() if cached is not None else None,
             timeout=self.settings.timeout_seconds,
             stream=True,
         ) as response:
+            if response.status_code == 304 and cached is not None:
+                LOGGER.debug("PDF 캐시 재검증(304): %s", pdf_url)
+                text = cached.parsed if isinstance(cached.parsed, str) else None
+                path, stored_size = self._archived(cached.fingerprint)
+                result = PdfResult(
+                    path=path,
+                    stored_size=stored_size,
+                    sha256=cached.fingerprint,
+                    text=text or "",
+                    size=cached.size,
+                    etag=cached.etag,
+                    reused=True,
+                    extracted=text is not None,
+                )
+                source = (
+                    self.archive.source(cached.fingerprint)
+                    if text is None and extract and self.archive is not None
+                    else None
+                )
+                if source is not None:
+                    # 압축하지 않은 사본은 mmap 으로 다시 읽는다.
+                    result.pages = self._extract_pages(result, source, cache_key, cached)
+                return result
+
             response.raise_for_status()
-            with output_path.open("wb") as handle:
-                for chunk in response.iter_content(chunk_size=8192):
-                    if not chunk:
-                        continue
-                    handle.write(chunk)
-                    sha256.update(chunk)
+            body = _read_body(response, sha256)
+
+        size = body.nbytes
+        digest = sha256.hexdigest()
+        kind = sniff_kind(body)
+        # sha256 이름이라 다른 글에 같은 첨부가 다시 올라와도 파일은 한 벌만 남는다.
+        # 보관소에는 PDF 만 둔다.
+        stored = (
+            self.archive.put(digest, body)
+            if self.archive is not None and kind == "pdf"
+            else None
+        )
 
-        text = self._extract_text(output_path)
-        return PdfResult(path=output_path, sha256=sha256.hexdigest(), text=text)
+        text = self._known_text(digest, previous, cached, text_lookup)
+        result = PdfResult(
+            path=stored.path if stored else None,
+            stored_size=stored.stored_size if stored else None,
+            sha256=digest,
+            text=text or "",
+            size=size,
+            etag=response.headers.get("ETag"),
+            reused=text is not None,
+            extracted=text is not None,
+            kind=kind,
+        )
 
-    def _extract_text(self, pdf_path: Path, max_pages: int = 8) -> str:
-        texts: list[str] = []
+        entry = None
+        if self.cache is not None:
+            entry = entry_from_response(response, body_fingerprint=digest, size=size)
+            if entry is None:
+                self.cache.delete(cache_key)
+            else:
+                self.cache.set_parsed(cache_key, entry, text)
+        if text is None and extract:
+            # 방금 받은 버퍼를 그대로 파서에 넘긴다(파일을 다시 열지 않는다).
+            result.pages = self._extract_pages(result, body, cache_key, entry)
+        return result
 
-        if pdfplumber is not None:
+    def _extract_pages(
+        self,
+        result: PdfResult,
+        source: PdfSource,
+        cache_key: str | None,
+        entry: CacheEntry | None,
+        max_pages: int = 8,
+    ) -> Generator[str, None, None]:
+        # 읽힌 페이지까지만 텍스트로 남긴다. 같은 읽기 규칙이면 같은 지점에서 멈추므로
+        # 이 텍스트를 재사용해도 결과가 같다. 추출 실패(시간 초과/메모리 초과/워커
+        # 비정상 종료)는 extracted=False 로 두어 저장/캐시하지 않는다.
+        pages: list[str] = []
+        extracted = self._iter_text(result.kind, source, max_pages)
+        failed = False
+        try:
+            for page in extracted:
+                pages.append(page)
+                yield page
+        except ExtractionError as exc:
+            failed = True
+            LOGGER.warning("PDF 텍스트 추출 실패, 상세 본문만 사용합니다: %s", exc)
+        finally:
+            extracted.close()
+            result.pages = None
+            if not failed:
+                result.text = clean_text("\n".join(pages))
+                result.extracted = True
+                if self.cache is not None and entry is not None:
+                    self.cache.set_parsed(cache_key, entry, result.text)
+
+    def _iter_text(
+        self,
+        kind: str,
+        source: PdfSource,
+        max_pages: int,
+        *,
+        nested: bool = False,
+    ) -> Iterator[str]:
+        # 첨부 종류별 추출기. PDF 는 격리된 추출 프로세스에서, HWPX/ZIP 은 이 스레드에서
+        # 읽는다. ZIP 안의 ZIP 은 열지 않는다.
+        if kind == "pdf":
+            yield from self.extractor.iter_pages(source, max_pages)
+            return
+        issues: list[str] = []
+        try:
+            if kind == "hwpx":
+                yield from iter_hwpx_sections(source, issues)
+            elif kind == "zip" and not nested:
+                for name, member in iter_zip_members(source, issues):
+                    member_kind = sniff_kind(member, name)
+                    LOGGER.debug("ZIP 멤버 추출: %s (%s)", name, member_kind)
+                    yield from self._iter_text(member_kind, member, max_pages, nested=True)
+            elif kind == "text":
+                yield decode_text(bytes(source))
+            else:
+                LOGGER.info("텍스트 추출기가 없는 첨부 형식(%s): 해시만 사용합니다.", kind)
+        finally:
+            for issue in issues:
+                LOGGER.warning(issue)
+
+    def download_attachments(
+        self,
+        urls: list[str],
+        notice_id: str,
+        *,
+        previous: PdfRecord | None = None,
+        text_lookup: Callable[[str], str | None] | None = None,
+        extract: bool = True,
+    ) -> list[PdfResult]:
+        # 첫 번째가 대표 첨부(notices.pdf_url)이고 previous 는 그것에만 쓴다. text_lookup 은
+        # sha256 으로 찾으므로 모든 첨부에 쓴다. 나머지 첨부 중 4xx 로 받을 수 없는 것은 건너뛴다(매번 같으므로 해시가 흔들리지 않는다).
+        def fetch(index: int, url: str) -> PdfResult | None:
             try:
-                with pdfplumber.open(pdf_path) as pdf:
-                    for page in pdf.pages[:max_pages]:
-                        page_text = (page.extract_text() or "").strip()
-                        if page_text:
-                            texts.append(page_text)
-            except Exception as exc:  # pragma: no cover - depends on source PDFs
-                LOGGER.warning("pdfplumber 추출 실패 (%s): %s", pdf_path.name, exc)
-
-        if not texts and PdfReader is not None:
+                return self.download_and_extract(
+                    url,
+                    notice_id,
+                    previous=previous if index == 0 else None,
+                    text_lookup=text_lookup,
+                    extract=extract,
+                )
+            except requests.HTTPError as exc:
+                status = exc.response.status_code if exc.response is not None else None
+                if index == 0 or status is None or not 400 <= status < 500:
+                    raise
+                LOGGER.warning("첨부 다운로드 실패(%s), 건너뜁니다: %s", status, url)
+                return None
+
+        if len(urls) <= 1:
+            results = [fetch(index, url) for index, url in enumerate(urls)]
+        else:
+            futures = [
+                self._attachment_pool.submit(fetch, index, url)
+                for index, url in enumerate(urls)
+            ]
+            results = []
             try:
-                reader = PdfReader(str(pdf_path))
-                for page in reader.pages[:max_pages]:
-                    page_text = (page.extract_text() or "").strip()
-                    if page_text:
-                        texts.append(page_text)
-            except Exception as exc:  # pragma: no cover - depends on source PDFs
-                LOGGER.warning("pypdf 추출 실패 (%s): %s", pdf_path.name, exc)
-
-        return _clean("\n".join(texts))
+                for future in futures:
+                    results.append(future.result())
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                for result in results:
+                    if result is not None:
+                        result.close()
+                raise
+        return [result for result in results if result is not None]
+
+    def _archived(self, sha256: str) -> tuple[Path | None, int | None]:
+        path = self.archive.find(sha256) if self.archive is not None else None
+        if path is None:
+            return None, None
+        try:
+            return path, path.stat().st_size
+        except OSError:
+            return None, None
+
+    def is_unchanged_remote(self, pdf_url: str, previous: PdfRecord) -> bool:
+        try:
+            response = self.session.head(
+                pdf_url,
+                timeout=self.settings.timeout_seconds,
+                allow_redirects=True,
+            )
+        except requests.RequestException as exc:
+            LOGGER.debug("PDF HEAD 실패 (%s): %s", pdf_url, exc)
+            return False
+        if response.status_code != 200:
+            return False
+
+        etag = response.headers.get("ETag")
+        if etag or previous.etag:
+            return bool(etag) and etag == previous.etag
+        # ETag 가 양쪽 모두 없을 때만 Content-Length 로 판단한다.
+        try:
+            length = int(response.headers.get("Content-Length", ""))
+        except ValueError:
+            return False
+        return previous.size is not None and length == previous.size
+
+    @staticmethod
+    def _known_text(
+        digest: str,
+        previous: PdfRecord | None,
+        cached: CacheEntry | None,
+        text_lookup: Callable[[str], str | None] | None,
+    ) -> str | None:
+        if (
+            previous is not None
+            and previous.sha256 == digest
+            and previous.text is not None
+        ):
+            return previous.text
+        if (
+            cached is not None
+            and cached.fingerprint == digest
+            and isinstance(cached.parsed, str)
+        ):
+            return cached.parsed
+        if text_lookup is not None:
+            return text_lookup(digest)
+        return None
@@ -2,16 +2,38 @@ from __future__ import annotations
 
 import hashlib
 import logging
-from datetime import datetime
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
+from datetime import datetime, timedelta
+from functools import partial
+from itertools import chain
+from typing import Any, Callable, Iterator
+from urllib.parse import urlparse
 from zoneinfo import ZoneInfo
 
 from .article_writer import ArticleWriter
 from .config import Settings
-from .models import RunStats
+from .http_cache import HttpCache
+from .models import (
+    ArticleDraft,
+    BackfillStats,
+    CompactStats,
+    GcStats,
+    NoticeDetail,
+    NoticeSummary,
+    PdfRecord,
+    PdfResult,
+    RunStats,
+    SnapshotStats,
+)
+from .pdf_archive import PdfArchive
 from .pdf_service import PdfService
 from .scourt_client import ScourtClient
+from .snapshot import StateSnapshots
 from .storage import StateStore
 from .teams import TeamsNotifier
+from .transport import create_concurrency_limiter, create_session
 
 LOGGER = logging.getLogger(__name__)
 
@@ -20,6 +42,15 @@ def _hash_content(text: str) -> str:
     return hashlib.sha256(text.encode("utf-8")).hexdigest()
 
 
+def _attachment_urls(detail: NoticeDetail) -> list[str]:
+    # 첨부를 중복 없이 잇고, 대표 첨부(pdf_url)가 있으면 맨 앞에 둔다.
+    # PDF 없이 HWPX/ZIP/HWP 만 있는 글도 첨부를 받는다.
+    urls = list(dict.fromkeys(detail.attachment_urls))
+    if not detail.pdf_url:
+        return urls
+    return [detail.pdf_url] + [url for url in urls if url != detail.pdf_url]
+
+
 def _notice_id_as_int(notice_id: str) -> int:
     try:
         return int(notice_id)
@@ -27,15 +58,38 @@ def _notice_id_as_int(notice_id: str) -> int:
         return 0
 
 
+@dataclass
+class _PreparedNotice:
+    detail: NoticeDetail
+    article: ArticleDraft
+    pdf_hash: str
+    content_hash: str
+    detail_hash: str
+    attachment_signature: str
+    pdf: PdfResult | None = None
+    attachments: list[PdfResult] = field(default_factory=list)
+
+
 class ScourtPipeline:
     def __init__(self, settings: Settings):
         self.settings = settings
-        self.client = ScourtClient(settings)
-        self.pdf_service = PdfService(settings)
-        self.store = StateStore(settings.db_path)
+        self.http_cache = (
+            HttpCache(settings.http_cache_dir, settings.http_cache_max_mb * 1024 * 1024)
+            if settings.http_cache_max_mb > 0
+            else None
+        )
+        self.session = create_session(settings)
+        # 법원 사이트(목록/상세/PDF) 요청에만 적응형 동시성 한도를 건다.
+        self.limiter = create_concurrency_limiter(settings)
+        scourt_host = urlparse(settings.list_url).hostname
+        if scourt_host:
+            self.session.set_concurrency_limiter(scourt_host, self.limiter)
+        self.client = ScourtClient(settings, self.session, cache=self.http_cache)
+        self.pdf_service = PdfService(settings, self.session, cache=self.http_cache)
+        self.store = StateStore(settings.db_path, compress_text=settings.db_compress)
         self.writer = ArticleWriter(settings)
         self.notifier = (
-            TeamsNotifier(settings.teams_webhook_url)
+            TeamsNotifier(settings.teams_webhook_url, self.session)
             if settings.teams_webhook_url
             else None
         )
@@ -46,33 +100,82 @@ class ScourtPipeline:
         force: bool = False,
         dry_run: bool = False,
         max_pages: int | None = None,
+        workers: int | None = None,
     ) -> RunStats:
         if not dry_run and self.notifier is None:
             raise ValueError("TEAMS_WEBHOOK_URL 이 설정되지 않았습니다.")
 
+        self.limiter.reset_window()
         pages = max_pages or self.settings.max_pages
-        all_notices = []
-        for page_index in range(1, pages + 1):
-            notices = self.client.fetch_news_list(page_index=page_index)
-            LOGGER.info("목록 수집: page=%s, count=%s", page_index, len(notices))
-            all_notices.extend(notices)
+        tz = ZoneInfo(self.settings.timezone)
+        now_iso = datetime.now(tz).isoformat()
+        started = time.monotonic()
+        boards = self.settings.gubuns
+
+        def run_board(gubun: str) -> RunStats:
+            return self._run_board(
+                gubun,
+                force=force,
+                dry_run=dry_run,
+                pages=pages,
+                workers=workers,
+                now_iso=now_iso,
+            )
 
-        deduped = {}
-        for notice in all_notices:
-            deduped.setdefault(notice.notice_id, notice)
+        # 저장/기준선 갱신은 묶어서 커밋하고, 전송 기록(mark_sent)만 즉시 커밋한다.
+        with self.store.unit_of_work():
+            if len(boards) == 1:
+                board_stats = [run_board(boards[0])]
+            else:
+                # 게시판끼리는 동시에 돌고, 같은 세션/연결 풀과 동시성 한도를 공유한다.
+                with ThreadPoolExecutor(
+                    max_workers=len(boards),
+                    thread_name_prefix="scourt-board",
+                ) as executor:
+                    board_stats = list(executor.map(run_board, boards))
+
+        stats = RunStats(started_at=now_iso)
+        for gubun, item in zip(boards, board_stats):
+            stats.add(item)
+            stats.boards[gubun] = item
+        stats.finished_at = datetime.now(tz).isoformat()
+        stats.elapsed_seconds = time.monotonic() - started
+        self.store.record_run(stats, dry_run=dry_run, force=force)
+        return stats
+
+    def _run_board(
+        self,
+        gubun: str,
+        *,
+        force: bool,
+        dry_run: bool,
+        pages: int,
+        workers: int | None,
+        now_iso: str,
+    ) -> RunStats:
+        last_seen_id = self.store.get_last_seen_notice_id(
+            gubun,
+            legacy_fallback=gubun == self.settings.gubun,
+        )
+        started = time.monotonic()
+        deduped = self._collect_notices(
+            gubun,
+            pages,
+            last_seen_id=None if force else last_seen_id,
+        )
 
         ordered = sorted(deduped.values(), key=lambda x: _notice_id_as_int(x.notice_id))
 
         stats = RunStats(scanned=len(ordered))
-        now_iso = datetime.now(ZoneInfo(self.settings.timezone)).isoformat()
-        last_seen_id = self.store.get_last_seen_notice_id()
+        stats.add_stage("list", time.monotonic() - started)
         latest_seen_id = (
             _notice_id_as_int(ordered[-1].notice_id) if ordered else last_seen_id
         )
 
         if ordered and not force and last_seen_id is not None:
             LOGGER.info(
-                "신규 판정 기준: last_seen_notice_id=%s, latest_notice_id=%s",
+                "신규 판정 기준: gubun=%s, last_seen_notice_id=%s, latest_notice_id=%s",
+                gubun,
                 last_seen_id,
                 latest_seen_id,
             )
@@ -84,10 +187,11 @@ class ScourtPipeline:
             and self.settings.bootstrap_skip_send
             and last_seen_id is None
         ):
-            self.store.set_last_seen_notice_id(latest_seen_id, now_iso)
+            self.store.set_last_seen_notice_id(latest_seen_id, now_iso, gubun)
             stats.skipped = len(ordered)
             LOGGER.warning(
-                "초기 기준선 모드: last_seen_notice_id=%s 로 설정하고 이번 실행 전송은 건너뜁니다.",
+                "초기 기준선 모드: gubun=%s, last_seen_notice_id=%s 로 설정하고 이번 실행 전송은 건너뜁니다.",
+                gubun,
                 latest_seen_id,
             )
             return stats
@@ -104,76 +208,565 @@ class ScourtPipeline:
         stats.skipped += max(0, len(ordered) - len(targets))
         if not force:
             LOGGER.info(
-                "대상 건수: total=%s, new=%s, old=%s",
+                "대상 건수: gubun=%s, total=%s, new=%s, old=%s",
+                gubun,
                 len(ordered),
                 len(targets),
                 len(ordered) - len(targets),
             )
 
-        for summary in targets:
-            try:
-                detail = self.client.fetch_notice_detail(summary)
+        worker_count = max(1, workers or self.settings.workers)
+        if worker_count > 1 and len(targets) > 1:
+            LOGGER.info("병렬 처리: workers=%s, targets=%s", worker_count, len(targets))
 
-                pdf_hash = ""
-                pdf_text = ""
-                if detail.pdf_url:
-                    pdf_result = self.pdf_service.download_and_extract(
-                        detail.pdf_url,
-                        summary.notice_id,
-                    )
-                    pdf_hash = pdf_result.sha256
-                    pdf_text = pdf_result.text
-                else:
-                    LOGGER.warning("첨부 PDF 없음: notice_id=%s", summary.notice_id)
-
-                article = self.writer.build(summary, detail, pdf_text)
-                article_text = article.as_text()
-                content_hash = _hash_content(
-                    "\n".join([detail.title, detail.body_text, pdf_hash])
-                )
-                prev = self.store.get_notice(summary.notice_id)
+        # 대상 전체의 이전 상태를 한 번에 읽어 두고 글마다 조회하지 않는다.
+        started = time.monotonic()
+        states = self.store.get_notice_states(notice.notice_id for notice in targets)
+        stats.add_stage("store", time.monotonic() - started)
+        # 전송은 저장이 끝난 뒤 notice_id 순서대로 모아서 한다(건수가 많으면 요약 카드로 묶는다).
+        pending: list[tuple[NoticeSummary, _PreparedNotice]] = []
+        for summary, prepare in self._iter_prepared(
+            targets,
+            worker_count,
+            states,
+            skip_unchanged=not force,
+        ):
+            try:
+                started = time.monotonic()
+                try:
+                    prepared = prepare()
+                finally:
+                    stats.add_stage("prepare", time.monotonic() - started)
+                if prepared is None:
+                    stats.unchanged += 1
+                    self.store.touch_notice_pdfs(summary.notice_id, now_iso)
+                    continue
+                prev = states.get(summary.notice_id)
+                detail = prepared.detail
 
                 unchanged = (
                     prev is not None
-                    and prev.get("content_hash") == content_hash
+                    and prev.get("content_hash") == prepared.content_hash
                     and prev.get("sent_at")
                     and not force
                 )
+                # 내용은 같아도 값싼 신호(상세 해시/첨부 목록/ETag)는 갱신해 두어야
+                # 다음 실행이 첨부를 받기 전에 건너뛸 수 있다.
+                started = time.monotonic()
+                self._store_prepared(summary, prepared, now_iso)
+                stats.add_stage("store", time.monotonic() - started)
                 if unchanged:
                     stats.skipped += 1
                     continue
 
-                self.store.upsert_notice(
-                    notice_id=summary.notice_id,
-                    title=detail.title,
-                    posted_date=summary.posted_date,
-                    detail_url=summary.detail_url,
-                    pdf_url=detail.pdf_url,
-                    pdf_hash=pdf_hash or None,
-                    content_hash=content_hash,
-                    article_text=article_text,
-                    timestamp_iso=now_iso,
-                )
                 stats.processed += 1
 
                 if dry_run:
                     LOGGER.info("[DRY RUN] article generated: %s", detail.title)
                     continue
 
-                assert self.notifier is not None
-                self.notifier.send(article)
-                self.store.mark_sent(summary.notice_id, now_iso)
-                stats.sent += 1
-                LOGGER.info("Teams 전송 완료: %s (%s)", summary.notice_id, detail.title)
+                pending.append((summary, prepared))
 
             except Exception:
                 stats.failed += 1
                 LOGGER.exception("처리 실패: notice_id=%s", summary.notice_id)
 
+        unsent: list[str] = []
+        if pending:
+            started = time.monotonic()
+            try:
+                unsent = self._send_pending(pending, stats, now_iso)
+            finally:
+                stats.add_stage("send", time.monotonic() - started)
+
         if not force and latest_seen_id is not None:
             next_seen = latest_seen_id if last_seen_id is None else max(
                 last_seen_id, latest_seen_id
             )
-            self.store.set_last_seen_notice_id(next_seen, now_iso)
+            if unsent:
+                # 전송에 실패한 글이 다음 실행의 대상에 다시 들도록 기준선을 그 앞에 둔다.
+                # 그 사이의 이미 보낸 글은 값싼 신호 비교로 건너뛴다.
+                next_seen = min(
+                    next_seen,
+                    min(_notice_id_as_int(notice_id) for notice_id in unsent) - 1,
+                )
+                LOGGER.warning(
+                    "전송 실패 글이 있어 기준선을 낮춥니다: gubun=%s, last_seen_notice_id=%s, "
+                    "notice_ids=%s",
+                    gubun,
+                    next_seen,
+                    ",".join(unsent),
+                )
+            self.store.set_last_seen_notice_id(next_seen, now_iso, gubun)
+
+        return stats
+
+    def _send_pending(
+        self,
+        pending: list[tuple[NoticeSummary, _PreparedNotice]],
+        stats: RunStats,
+        now_iso: str,
+    ) -> list[str]:
+        # 전송하지 못한 notice_id 를 돌려준다.
+        assert self.notifier is not None
+        unsent: list[str] = []
+        threshold = self.settings.teams_digest_threshold
+        if not threshold or len(pending) <= threshold:
+            for summary, prepared in pending:
+                try:
+                    self.notifier.send(prepared.article)
+                    self.store.mark_sent(summary.notice_id, now_iso)
+                    stats.sent += 1
+                    LOGGER.info(
+                        "Teams 전송 완료: %s (%s)",
+                        summary.notice_id,
+                        prepared.detail.title,
+                    )
+                except Exception:
+                    stats.failed += 1
+                    unsent.append(summary.notice_id)
+                    LOGGER.exception("전송 실패: notice_id=%s", summary.notice_id)
+            return unsent
+
+        cards = self.notifier.build_digest(
+            [(summary.notice_id, prepared.article) for summary, prepared in pending],
+            max_sections=self.settings.teams_digest_max_sections,
+        )
+        LOGGER.info("Teams 요약 카드 전송: notices=%s, cards=%s", len(pending), len(cards))
+        for card in cards:
+            try:
+                self.notifier.post(card.payload)
+            except Exception:
+                # 이 카드의 글만 전송 실패로 남긴다(_run_board 가 기준선을 낮춰 다시 보낸다).
+                stats.failed += len(card.notice_ids)
+                unsent.extend(card.notice_ids)
+                LOGGER.exception("요약 카드 전송 실패: notice_ids=%s", ",".join(card.notice_ids))
+                continue
+            for notice_id in card.notice_ids:
+                self.store.mark_sent(notice_id, now_iso)
+            stats.sent += len(card.notice_ids)
+            LOGGER.info("Teams 요약 카드 전송 완료: notice_ids=%s", ",".join(card.notice_ids))
+        return unsent
+
+    def backfill(
+        self,
+        *,
+        workers: int | None = None,
+        max_pages: int | None = None,
+        restart: bool = False,
+        gubun: str | None = None,
+    ) -> BackfillStats:
+        # 전송 없이 전체 목록을 저장만 한다. 페이지 단위로 metadata 에 체크포인트를 남겨
+        # 중단되면 다음 실행이 마지막으로 끝까지 처리한 페이지 다음부터 이어간다.
+        worker_count = max(1, workers or self.settings.workers)
+        gubun = gubun or self.settings.gubun
+        checkpoint_key = f"backfill_next_page:{gubun}"
+        now_iso = datetime.now(ZoneInfo(self.settings.timezone)).isoformat()
+        checkpoint = None if restart else self.store.get_meta(checkpoint_key)
+        start_page = int(checkpoint) if checkpoint and checkpoint.isdigit() else 1
+        end_page = start_page + max_pages if max_pages else None
+
+        stats = BackfillStats(start_page=start_page)
+        LOGGER.info(
+            "백필 시작: gubun=%s, start_page=%s, workers=%s",
+            gubun,
+            start_page,
+            worker_count,
+        )
+
+        started = time.monotonic()
+        seen: set[str] = set()
+        checkpoint_blocked = False
+        page_index = start_page
+        # 체크포인트는 같은 트랜잭션에서 해당 페이지의 글보다 뒤에 쓰이므로,
+        # 묶음 커밋 중에 중단돼도 저장되지 않은 페이지를 건너뛰지 않는다.
+        with self.store.unit_of_work(), ThreadPoolExecutor(
+            max_workers=worker_count,
+            thread_name_prefix="scourt-backfill",
+        ) as executor:
+            while end_page is None or page_index < end_page:
+                wave_end = page_index + worker_count
+                if end_page is not None:
+                    wave_end = min(wave_end, end_page)
+                wave = list(range(page_index, wave_end))
+                page_lists = list(
+                    executor.map(
+                        lambda number: self.client.fetch_news_list(
+                            page_index=number,
+                            gubun=gubun,
+                        ),
+                        wave,
+                    )
+                )
 
+                # 페이지별 신규 글을 한꺼번에 작업자에 넘기고, 저장은 페이지 순서대로 한다.
+                wave_jobs: list[tuple[int, list[tuple[NoticeSummary, Future]]]] = []
+                for number, notices in zip(wave, page_lists):
+                    fresh = [notice for notice in notices if notice.notice_id not in seen]
+                    if not fresh:
+                        stats.completed = True
+                        break
+                    seen.update(notice.notice_id for notice in fresh)
+                    existing = self.store.existing_notice_ids(
+                        notice.notice_id for notice in fresh
+                    )
+                    jobs = []
+                    for notice in fresh:
+                        if notice.notice_id in existing:
+                            stats.skipped += 1
+                            continue
+                        jobs.append((notice, executor.submit(self._prepare, notice)))
+                    wave_jobs.append((number, jobs))
+
+                for number, jobs in wave_jobs:
+                    page_failed = False
+                    for summary, future in jobs:
+                        try:
+                            prepared = future.result()
+                            self._store_prepared(summary, prepared, now_iso)
+                            stats.stored += 1
+                        except Exception:
+                            stats.failed += 1
+                            page_failed = True
+                            LOGGER.exception("백필 실패: notice_id=%s", summary.notice_id)
+                    stats.pages += 1
+                    # 실패한 글이 있는 페이지부터는 체크포인트를 올리지 않아 재실행 시 다시 시도한다.
+                    checkpoint_blocked = checkpoint_blocked or page_failed
+                    if not checkpoint_blocked:
+                        self.store.set_meta(checkpoint_key, str(number + 1), now_iso)
+
+                stats.elapsed_seconds = time.monotonic() - started
+                if wave_jobs:
+                    LOGGER.info(
+                        "백필 진행: page=%s, stored=%s, skipped=%s, failed=%s, %.2f건/s",
+                        wave_jobs[-1][0],
+                        stats.stored,
+                        stats.skipped,
+                        stats.failed,
+                        stats.notices_per_second,
+                    )
+                if stats.completed:
+                    break
+                page_index = wave_end
+
+        stats.elapsed_seconds = time.monotonic() - started
         return stats
+
+    def _store_prepared(
+        self,
+        summary: NoticeSummary,
+        prepared: _PreparedNotice,
+        timestamp_iso: str,
+    ) -> None:
+        pdf = prepared.pdf
+        self.store.upsert_notice(
+            notice_id=summary.notice_id,
+            title=prepared.detail.title,
+            posted_date=summary.posted_date,
+            detail_url=summary.detail_url,
+            pdf_url=prepared.detail.pdf_url,
+            pdf_hash=prepared.pdf_hash or None,
+            content_hash=prepared.content_hash,
+            article_text=prepared.article.as_text(),
+            timestamp_iso=timestamp_iso,
+            # 추출에 실패한 텍스트는 저장하지 않아야 다음 실행에서 다시 추출한다.
+            pdf_text=pdf.text if pdf and pdf.extracted else None,
+            pdf_size=pdf.size if pdf else None,
+            pdf_etag=pdf.etag if pdf else None,
+            detail_hash=prepared.detail_hash,
+            attachment_signature=prepared.attachment_signature,
+        )
+        results = [result for result in [pdf, *prepared.attachments] if result is not None]
+        self.store.set_notice_attachments(
+            summary.notice_id, [result.sha256 for result in results]
+        )
+        for result in results:
+            self._record_pdf(result, timestamp_iso)
+            if result.extracted:
+                self.store.record_pdf_text(result.sha256, result.text, timestamp_iso)
+
+    def _record_pdf(self, pdf: PdfResult, timestamp_iso: str) -> None:
+        if pdf.path is None or pdf.stored_size is None:
+            return
+        self.store.record_pdf_file(
+            pdf.sha256,
+            size=pdf.size or None,
+            stored_size=pdf.stored_size,
+            timestamp_iso=timestamp_iso,
+        )
+
+    def gc_pdfs(
+        self,
+        *,
+        max_mb: int | None = None,
+        max_age_days: int | None = None,
+        scan: bool = False,
+        dry_run: bool = False,
+    ) -> GcStats:
+        # 보관소를 용량/기간 한도 안으로 줄인다. pdf_files 색인을 오래 안 쓴 순서로 훑으므로
+        # 파일 수가 많아도 디렉터리를 뒤지지 않는다(scan=True 일 때만 색인 밖 파일을 찾는다).
+        archive = self.pdf_service.archive or PdfArchive(self.settings.pdf_dir)
+        tz = ZoneInfo(self.settings.timezone)
+        now = datetime.now(tz)
+        max_mb = self.settings.pdf_max_mb if max_mb is None else max_mb
+        max_age_days = (
+            self.settings.pdf_max_age_days if max_age_days is None else max_age_days
+        )
+        max_bytes = max_mb * 1024 * 1024
+        cutoff = (now - timedelta(days=max_age_days)).isoformat() if max_age_days else None
+        stats = GcStats()
+
+        for path in archive.legacy_files():
+            stats.legacy_removed += 1
+            stats.freed_bytes += path.stat().st_size
+            if not dry_run:
+                path.unlink(missing_ok=True)
+
+        if scan:
+            indexed = {row["sha256"] for row in self.store.list_pdf_files()}
+            for sha256, stored in archive.scan().items():
+                if sha256 in indexed:
+                    continue
+                stats.indexed += 1
+                if not dry_run:
+                    mtime = datetime.fromtimestamp(stored.path.stat().st_mtime, tz)
+                    self.store.record_pdf_file(
+                        sha256,
+                        size=None,
+                        stored_size=stored.stored_size,
+                        timestamp_iso=mtime.isoformat(),
+                    )
+
+        rows = self.store.list_pdf_files()
+        total = sum(row["stored_size"] for row in rows)
+        removed: list[str] = []
+        for row in rows:
+            stats.scanned += 1
+            expired = cutoff is not None and row["last_used_at"] < cutoff
+            over_budget = max_bytes > 0 and total > max_bytes
+            if not expired and not over_budget:
+                continue
+            if not dry_run:
+                archive.delete(row["sha256"])
+            removed.append(row["sha256"])
+            total -= row["stored_size"]
+            stats.freed_bytes += row["stored_size"]
+
+        if removed and not dry_run:
+            self.store.delete_pdf_files(removed)
+        stats.removed = len(removed)
+        stats.kept = len(rows) - len(removed)
+        stats.kept_bytes = total
+        return stats
+
+    def compact_db(
+        self,
+        *,
+        retention_days: int | None = None,
+        min_free_percent: float = 0.0,
+    ) -> CompactStats:
+        # 본문 압축 형식을 설정에 맞추고 보존 기간이 지난 전송 완료 글의 본문을 비운다.
+        # VACUUM 은 빈 공간이 파일의 min_free_percent% 이상일 때만 한다(0 이면 항상).
+        if retention_days is None:
+            retention_days = self.settings.db_article_retention_days
+        prune_before = None
+        if retention_days:
+            now = datetime.now(ZoneInfo(self.settings.timezone))
+            prune_before = (now - timedelta(days=retention_days)).isoformat()
+        return self.store.compact(
+            prune_before=prune_before,
+            min_free_ratio=min_free_percent / 100,
+        )
+
+    def export_state(
+        self,
+        *,
+        full: bool = False,
+        include_text: bool = False,
+    ) -> SnapshotStats:
+        now_iso = datetime.now(ZoneInfo(self.settings.timezone)).isoformat()
+        return StateSnapshots(self.settings.state_dir).export(
+            self.store,
+            now_iso,
+            full=full,
+            include_text=include_text,
+        )
+
+    def import_state(self) -> SnapshotStats:
+        now_iso = datetime.now(ZoneInfo(self.settings.timezone)).isoformat()
+        return StateSnapshots(self.settings.state_dir).import_into(self.store, now_iso)
+
+    def _collect_notices(
+        self,
+        gubun: str,
+        pages: int,
+        *,
+        last_seen_id: int | None,
+    ) -> dict[str, NoticeSummary]:
+        # 기준선이 있으면 기준선 이하 seqnum이 보이는 페이지에서 멈추고,
+        # 페이지 전체가 신규면 max_pages_cap 까지 더 내려간다.
+        incremental = last_seen_id is not None
+        page_cap = max(pages, self.settings.max_pages_cap) if incremental else pages
+
+        deduped: dict[str, NoticeSummary] = {}
+        for page_index, notices in self.client.iter_news_pages(gubun=gubun):
+            LOGGER.info(
+                "목록 수집: gubun=%s, page=%s, count=%s",
+                gubun,
+                page_index,
+                len(notices),
+            )
+            fresh = [notice for notice in notices if notice.notice_id not in deduped]
+            if not fresh:
+                # 마지막 페이지 이후 같은 목록이 반복되는 경우
+                break
+            for notice in fresh:
+                deduped[notice.notice_id] = notice
+
+            if incremental and any(
+                _notice_id_as_int(notice.notice_id) <= last_seen_id
+                for notice in notices
+            ):
+                break
+            if page_index >= page_cap:
+                if incremental:
+                    LOGGER.warning(
+                        "목록 페이지 한도 도달: gubun=%s, page=%s, "
+                        "last_seen_notice_id=%s 이후 글이 더 있을 수 있습니다.",
+                        gubun,
+                        page_index,
+                        last_seen_id,
+                    )
+                break
+
+        return deduped
+
+    def _prepare(
+        self,
+        summary: NoticeSummary,
+        prev: dict[str, Any] | None = None,
+        *,
+        skip_unchanged: bool = False,
+    ) -> _PreparedNotice | None:
+        # 상세 페이지만 먼저 받아 값싼 신호(제목·본문 해시, 첨부 URL 목록, 대표 첨부의
+        # ETag/크기)를 이전 저장값과 비교한다. skip_unchanged 이고 모두 같으면 첨부
+        # 수집·추출·기사 생성을 하지 않고 None 을 돌려준다. prev 는 get_notice_states 의 행이다.
+        detail = self.client.fetch_notice_detail(summary)
+        urls = _attachment_urls(detail)
+        detail_hash = _hash_content(f"{detail.title}\n{detail.body_text}")
+        attachment_signature = _hash_content("\n".join(urls))
+        previous_pdf = self._previous_pdf(prev, detail.pdf_url) if detail.pdf_url else None
+
+        if (
+            skip_unchanged
+            and prev is not None
+            and prev.get("sent_at")
+            and prev.get("detail_hash") == detail_hash
+            and prev.get("attachment_signature") == attachment_signature
+            and (
+                not detail.pdf_url
+                or previous_pdf is not None
+                and self.pdf_service.is_unchanged_remote(detail.pdf_url, previous_pdf)
+            )
+        ):
+            LOGGER.info("변경 없음(상세/첨부 신호): notice_id=%s", summary.notice_id)
+            return None
+
+        if previous_pdf is not None and prev.get("has_pdf_text"):
+            # 이전 추출 텍스트는 실제로 첨부를 다시 볼 때만 읽는다.
+            previous_pdf = replace(
+                previous_pdf,
+                text=self.store.get_pdf_text(previous_pdf.sha256),
+            )
+
+        results: list[PdfResult] = []
+        if urls:
+            # 상세 본문으로 기사가 만들어지면 첨부는 해시만 계산하고 텍스트는 뽑지 않는다.
+            results = self.pdf_service.download_attachments(
+                urls,
+                summary.notice_id,
+                previous=previous_pdf,
+                text_lookup=self.store.get_pdf_text,
+                extract=self.writer.needs_pdf_text(detail),
+            )
+        else:
+            LOGGER.warning("첨부 없음: notice_id=%s", summary.notice_id)
+
+        pdf_result = results[0] if results else None
+        extra = results[1:]
+        pdf_hash = pdf_result.sha256 if pdf_result else ""
+        try:
+            article = self.writer.build(
+                summary,
+                detail,
+                chain.from_iterable(result.iter_pages() for result in results),
+            )
+        finally:
+            for result in results:
+                result.close()
+        # 첨부가 하나뿐이면 예전과 같은 해시가 나오도록 추가 첨부 해시만 뒤에 붙인다.
+        content_hash = _hash_content(
+            "\n".join(
+                [detail.title, detail.body_text, pdf_hash]
+                + [result.sha256 for result in extra]
+            )
+        )
+        return _PreparedNotice(
+            detail=detail,
+            article=article,
+            pdf_hash=pdf_hash,
+            content_hash=content_hash,
+            detail_hash=detail_hash,
+            attachment_signature=attachment_signature,
+            pdf=pdf_result,
+            attachments=extra,
+        )
+
+    @staticmethod
+    def _previous_pdf(prev: dict[str, Any] | None, pdf_url: str) -> PdfRecord | None:
+        if not prev or not prev.get("pdf_hash") or prev.get("pdf_url") != pdf_url:
+            return None
+        return PdfRecord(
+            sha256=prev["pdf_hash"],
+            text=None,
+            size=prev.get("pdf_size"),
+            etag=prev.get("pdf_etag"),
+        )
+
+    def _iter_prepared(
+        self,
+        targets: list[NoticeSummary],
+        workers: int,
+        states: dict[str, dict[str, Any]],
+        *,
+        skip_unchanged: bool = False,
+    ) -> Iterator[tuple[NoticeSummary, Callable[[], _PreparedNotice | None]]]:
+        # 상세/PDF 수집만 병렬로 돌리고, 결과는 항상 targets 순서(notice_id 오름차순)로 돌려준다.
+        if workers <= 1 or len(targets) <= 1:
+            for summary in targets:
+                yield summary, partial(
+                    self._prepare,
+                    summary,
+                    states.get(summary.notice_id),
+                    skip_unchanged=skip_unchanged,
+                )
+            return
+
+        executor = ThreadPoolExecutor(
+            max_workers=min(workers, len(targets)),
+            thread_name_prefix="scourt-worker",
+        )
+        try:
+            futures = [
+                executor.submit(
+                    self._prepare,
+                    summary,
+                    states.get(summary.notice_id),
+                    skip_unchanged=skip_unchanged,
+                )
+                for summary in targets
+            ]
+            for summary, future in zip(targets, futures):
+                yield summary, future.result
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
@@ -2,12 +2,15 @@ from __future__ import annotations
 
 import html as html_lib
 import logging
+from dataclasses import asdict, dataclass
+from typing import Any, Iterator
 from urllib.parse import parse_qs, urljoin, urlparse
 
 import requests
-from bs4 import BeautifulSoup
 
 from .config import Settings
+from .html_parser import HtmlParserBackend, get_parser_backend
+from .http_cache import CacheEntry, HttpCache, entry_from_response, fingerprint
 from .models import NoticeDetail, NoticeSummary
 
 LOGGER = logging.getLogger(__name__)
@@ -27,9 +30,35 @@ def _extract_seqnum(url: str) -> str | None:
     return None
 
 
+def _decode(body: bytes) -> str:
+    return body.decode("euc-kr", errors="replace")
+
+
+@dataclass
+class _Page:
+    html: str
+    unchanged: bool = False
+    cache_key: str | None = None
+    entry: CacheEntry | None = None
+
+    @property
+    def cached_parse(self) -> Any:
+        if self.unchanged and self.entry is not None:
+            return self.entry.parsed
+        return None
+
+
 class ScourtClient:
-    def __init__(self, settings: Settings, session: requests.Session | None = None):
+    def __init__(
+        self,
+        settings: Settings,
+        session: requests.Session | None = None,
+        cache: HttpCache | None = None,
+        parser: HtmlParserBackend | None = None,
+    ):
         self.settings = settings
+        self.cache = cache
+        self.parser = parser or get_parser_backend(settings.html_parser)
         self.session = session or requests.Session()
         self.session.headers.update(
             {
@@ -38,19 +67,69 @@ class ScourtClient:
             }
         )
 
-    def _get_html(self, url: str, params: dict[str, str] | None = None) -> str:
+    def _get_page(self, url: str, params: dict[str, str] | None = None) -> _Page:
+        if self.cache is None:
+            response = self.session.get(
+                url,
+                params=params,
+                timeout=self.settings.timeout_seconds,
+            )
+            response.raise_for_status()
+            return _Page(html=_decode(response.content))
+
+        key = HttpCache.key_for(url, params)
+        cached = self.cache.get(key)
+        cached_body = self.cache.read_body(key) if cached is not None else None
+        if cached is not None and cached_body is not None and cached.is_fresh():
+            return _Page(_decode(cached_body), True, key, cached)
+
         response = self.session.get(
             url,
             params=params,
+            headers=cached.conditional_headers() if cached_body is not None else None,
             timeout=self.settings.timeout_seconds,
         )
+        if response.status_code == 304 and cached is not None and cached_body is not None:
+            LOGGER.debug("HTTP 캐시 재검증(304): %s", url)
+            return _Page(_decode(cached_body), True, key, cached)
         response.raise_for_status()
-        return response.content.decode("euc-kr", errors="replace")
 
-    def fetch_news_list(self, page_index: int = 1) -> list[NoticeSummary]:
-        params = {"gubun": self.settings.gubun, "pageIndex": str(page_index)}
-        html = self._get_html(self.settings.list_url, params=params)
-        soup = BeautifulSoup(html, "html.parser")
+        body = response.content
+        digest = fingerprint(body)
+        entry = entry_from_response(response, body_fingerprint=digest, size=len(body))
+        if entry is None:
+            self.cache.delete(key)
+            return _Page(html=_decode(body))
+
+        # 검증자를 지원하지 않는 응답도 본문 지문이 같으면 변경 없음으로 본다.
+        unchanged = (
+            cached is not None
+            and cached_body is not None
+            and cached.fingerprint == digest
+        )
+        if unchanged:
+            entry.parsed = cached.parsed
+        self.cache.put(key, entry, None if unchanged else body)
+        return _Page(_decode(body), unchanged, key, entry)
+
+    def _remember_parse(self, page: _Page, parsed: Any) -> None:
+        if self.cache is None or page.cache_key is None or page.entry is None:
+            return
+        self.cache.set_parsed(page.cache_key, page.entry, parsed)
+
+    def fetch_news_list(
+        self,
+        page_index: int = 1,
+        gubun: str | None = None,
+    ) -> list[NoticeSummary]:
+        params = {"gubun": gubun or self.settings.gubun, "pageIndex": str(page_index)}
+        page = self._get_page(self.settings.list_url, params=params)
+        if page.cached_parse is not None:
+            try:
+                return [NoticeSummary(**item) for item in page.cached_parse]
+            except TypeError:
+                pass
+        soup = self.parser.parse_list(page.html)
 
         notices: list[NoticeSummary] = []
         for row in soup.select("table.tableHor tbody tr"):
@@ -80,11 +159,31 @@ class ScourtClient:
                 )
             )
 
+        self._remember_parse(page, [asdict(notice) for notice in notices])
         return notices
 
+    def iter_news_pages(
+        self,
+        start_page: int = 1,
+        gubun: str | None = None,
+    ) -> Iterator[tuple[int, list[NoticeSummary]]]:
+        # 호출 측이 멈출 때까지 한 페이지씩 요청한다. 빈 페이지가 나오면 목록 끝으로 본다.
+        page_index = max(1, start_page)
+        while True:
+            notices = self.fetch_news_list(page_index=page_index, gubun=gubun)
+            if not notices:
+                return
+            yield page_index, notices
+            page_index += 1
+
     def fetch_notice_detail(self, summary: NoticeSummary) -> NoticeDetail:
-        html = self._get_html(summary.detail_url)
-        soup = BeautifulSoup(html, "html.parser")
+        page = self._get_page(summary.detail_url)
+        if page.cached_parse is not None:
+            try:
+                return NoticeDetail(**page.cached_parse)
+            except TypeError:
+                pass
+        soup = self.parser.parse_detail(page.html)
 
         title = summary.title
         for row in soup.select("table.tableVer tr"):
@@ -115,7 +214,7 @@ class ScourtClient:
                 pdf_url = attachment_url
                 break
 
-        return NoticeDetail(
+        detail = NoticeDetail(
             notice_id=summary.notice_id,
             title=title,
             body_text=body_text,
@@ -123,3 +222,5 @@ class ScourtClient:
             attachment_urls=attachment_urls,
             pdf_url=pdf_url,
         )
+        self._remember_parse(page, asdict(detail))
+        return detail
@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Iterator
+
+from .models import SnapshotStats
+from .storage import StateStore
+
+FORMAT_VERSION = 1
+MANIFEST_NAME = "manifest.json"
+# 스냅숏을 어디까지 넣었는지 상태 DB 에 남겨 다음 import 가 건너뛰게 한다.
+IMPORTED_SEQ_KEY = "state_snapshot_seq"
+
+
+class StateSnapshots:
+    # <root>/manifest.json 과 <root>/snapshot-<seq>.jsonl.gz 로 이루어진 증분 스냅숏.
+    # 파일은 추가만 하고, manifest 가 순서와 sha256, 다음 증분의 기준 시각(until)을 가진다.
+    # 한 줄에 레코드 하나: {"type": "notice", ...notices 열} 또는 {"type": "meta", ...}
+    def __init__(self, root: Path):
+        self.root = root
+
+    @property
+    def manifest_path(self) -> Path:
+        return self.root / MANIFEST_NAME
+
+    def load_manifest(self) -> dict[str, Any]:
+        if not self.manifest_path.exists():
+            return {"format": FORMAT_VERSION, "snapshots": []}
+        manifest = json.loads(self.manifest_path.read_text(encoding="utf-8"))
+        if manifest.get("format") != FORMAT_VERSION:
+            raise ValueError(f"지원하지 않는 스냅숏 형식입니다: {manifest.get('format')}")
+        return manifest
+
+    def export(
+        self,
+        store: StateStore,
+        timestamp_iso: str,
+        *,
+        full: bool = False,
+        include_text: bool = False,
+    ) -> SnapshotStats:
+        # 마지막 스냅숏 이후 바뀐 글/메타데이터만 새 파일로 쓴다. full 이면 처음부터 다시 쓴다.
+        manifest = {"format": FORMAT_VERSION, "snapshots": []} if full else self.load_manifest()
+        snapshots = manifest["snapshots"]
+        since = snapshots[-1]["until"] if snapshots else None
+        seq = snapshots[-1]["seq"] + 1 if snapshots else 1
+
+        stats = SnapshotStats()
+        until = since or ""
+        lines: list[bytes] = []
+        for record in store.iter_notice_changes(since, include_text=include_text):
+            lines.append(_encode_record("notice", record))
+            until = max(until, record["updated_at"])
+            stats.notices += 1
+        for record in store.meta_changes(since):
+            if record["key"] == IMPORTED_SEQ_KEY:
+                # import 진행 상태는 DB 마다 다르므로 옮기지 않는다.
+                continue
+            lines.append(_encode_record("meta", record))
+            until = max(until, record["updated_at"])
+            stats.metas += 1
+        if not lines and not full:
+            return stats
+
+        self.root.mkdir(parents=True, exist_ok=True)
+        header = json.dumps(
+            {"format": FORMAT_VERSION, "seq": seq, "since": since, "created_at": timestamp_iso},
+            ensure_ascii=False,
+        ).encode("utf-8")
+        data = gzip.compress(b"\n".join([header, *lines]) + b"\n", compresslevel=9, mtime=0)
+        name = f"snapshot-{seq:06d}.jsonl.gz"
+        _atomic_write(self.root / name, data)
+        snapshots.append(
+            {
+                "seq": seq,
+                "file": name,
+                "sha256": hashlib.sha256(data).hexdigest(),
+                "records": stats.notices + stats.metas,
+                "since": since,
+                "until": until or timestamp_iso,
+                "created_at": timestamp_iso,
+            }
+        )
+        # 파일을 다 쓴 뒤에 manifest 를 바꾸므로 중간에 멈춰도 이전 manifest 는 온전하다.
+        _atomic_write(
+            self.manifest_path,
+            json.dumps(manifest, ensure_ascii=False, indent=1).encode("utf-8"),
+        )
+        if full:
+            keep = {name, MANIFEST_NAME}
+            for path in self.root.glob("snapshot-*.jsonl.gz"):
+                if path.name not in keep:
+                    path.unlink(missing_ok=True)
+        stats.files = 1
+        stats.bytes = len(data)
+        return stats
+
+    def import_into(self, store: StateStore, timestamp_iso: str) -> SnapshotStats:
+        # manifest 순서대로 체크섬을 확인하고 넣는다. 이미 넣은 seq 는 건너뛴다.
+        manifest = self.load_manifest()
+        imported = store.get_meta(IMPORTED_SEQ_KEY)
+        imported_seq = int(imported) if imported and imported.isdigit() else 0
+        stats = SnapshotStats()
+        for entry in manifest["snapshots"]:
+            if entry["seq"] <= imported_seq:
+                stats.skipped_files += 1
+                continue
+            data = (self.root / entry["file"]).read_bytes()
+            digest = hashlib.sha256(data).hexdigest()
+            if digest != entry["sha256"]:
+                raise ValueError(
+                    f"스냅숏 체크섬 불일치: {entry['file']} ({digest} != {entry['sha256']})"
+                )
+            notices: list[dict[str, Any]] = []
+            metas: list[dict[str, Any]] = []
+            for kind, record in _iter_records(data):
+                (notices if kind == "notice" else metas).append(record)
+            store.apply_snapshot(notices, metas)
+            store.set_meta(IMPORTED_SEQ_KEY, str(entry["seq"]), timestamp_iso)
+            stats.files += 1
+            stats.notices += len(notices)
+            stats.metas += len(metas)
+            stats.bytes += len(data)
+        return stats
+
+
+def _encode_record(kind: str, record: dict[str, Any]) -> bytes:
+    line = json.dumps({"type": kind, **record}, ensure_ascii=False, separators=(",", ":"))
+    return line.encode("utf-8")
+
+
+def _iter_records(data: bytes) -> Iterator[tuple[str, dict[str, Any]]]:
+    lines = gzip.decompress(data).splitlines()
+    header = json.loads(lines[0])
+    if header.get("format") != FORMAT_VERSION:
+        raise ValueError(f"지원하지 않는 스냅숏 형식입니다: {header.get('format')}")
+    for line in lines[1:]:
+        if not line:
+            continue
+        record = json.loads(line)
+        yield record.pop("type"), record
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
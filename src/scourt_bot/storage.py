@@ -1,63 +1,287 @@
 from __future__ import annotations
 
+import json
+import logging
 import sqlite3
+import threading
+import zlib
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable, Iterator
+
+from .models import CompactStats, DbSizeReport, RunStats, SearchHit
+
+LOGGER = logging.getLogger(__name__)
+
+# unit_of_work 안에서 이만큼 쓰면 중간 커밋한다.
+DEFAULT_BATCH_SIZE = 200
+
+# IN (...) 한 번에 넣는 id 수. 오래된 SQLite 의 변수 한도(999)보다 작게 잡는다.
+LOOKUP_CHUNK_SIZE = 500
+
+# 중복/변경 판정에 쓰는 열만 읽는다. article_text 와 pdf_text 본문은 읽지 않는다.
+NOTICE_STATE_COLUMNS = (
+    "notice_id",
+    "pdf_url",
+    "pdf_hash",
+    "pdf_size",
+    "pdf_etag",
+    "content_hash",
+    "detail_hash",
+    "attachment_signature",
+    "sent_at",
+    "pdf_text IS NOT NULL AS has_pdf_text",
+)
+
+# 상태 스냅숏에 싣는 notices 열. 본문(article_text/pdf_text)은 include_text 일 때만 더한다.
+SNAPSHOT_COLUMNS = (
+    "notice_id",
+    "title",
+    "posted_date",
+    "detail_url",
+    "pdf_url",
+    "pdf_hash",
+    "pdf_size",
+    "pdf_etag",
+    "content_hash",
+    "detail_hash",
+    "attachment_signature",
+    "sent_at",
+    "created_at",
+    "updated_at",
+)
+
+# trigram 토크나이저는 3글자 이상만 색인에서 찾는다. 더 짧은 검색어(두 글자 한국어
+# 단어가 흔하다)는 색인으로 후보를 좁힌 뒤 LIKE 로 거른다.
+FTS_MIN_TERM_LENGTH = 3
+SNIPPET_TOKENS = 40
+SNIPPET_CHARS = 80
+
+# 압축 모드에서 이보다 짧은 본문은 그대로 둔다(압축해도 거의 줄지 않는다).
+COMPRESS_MIN_BYTES = 256
+COMPRESS_LEVEL = 6
+
+# notices_text 뷰(압축을 푼 본문)를 외부 내용 테이블로 쓰는 FTS5 색인. 뷰는 연결마다
+# 등록하는 scourt_text() 를 쓰므로 트리거 대신 StateStore 가 쓰기와 같은 트랜잭션에서
+# 색인을 고친다(_write_many 의 reindex). 그래서 sqlite3 CLI 같은 다른 연결도 notices 에
+# 쓸 수 있지만, 그렇게 바꾼 글은 scourt-bot reindex 전까지 검색 결과와 어긋난다.
+# notices 의 rowid 에 묶여 있으므로 VACUUM 뒤에도 다시 만든다.
+FTS_SCHEMA = """
+    CREATE VIRTUAL TABLE notices_fts USING fts5(
+        title,
+        article_text,
+        pdf_text,
+        content='notices_text',
+        content_rowid='rowid',
+        tokenize='trigram'
+    )
+"""
+
+# 색인 갱신: 바꾸기 전 값으로 지우고('delete') 바꾼 뒤 값으로 다시 넣는다.
+FTS_DELETE_SQL = """
+    INSERT INTO notices_fts (notices_fts, rowid, title, article_text, pdf_text)
+    SELECT 'delete', rowid, title, article_text, pdf_text FROM notices_text
+    WHERE rowid IN (SELECT rowid FROM notices WHERE notice_id IN ({placeholders}))
+"""
+FTS_INSERT_SQL = """
+    INSERT INTO notices_fts (rowid, title, article_text, pdf_text)
+    SELECT rowid, title, article_text, pdf_text FROM notices_text
+    WHERE rowid IN (SELECT rowid FROM notices WHERE notice_id IN ({placeholders}))
+"""
+
+PRAGMAS = (
+    # WAL 은 읽기와 쓰기가 서로 막지 않고, synchronous=NORMAL 이면 커밋마다 fsync 하지
+    # 않는다(체크포인트 때만). 프로세스가 죽어도 커밋된 내용은 남는다.
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-16000",
+)
 
 
 class StateStore:
-    def __init__(self, db_path: Path):
+    # 스토어마다 연결 하나를 계속 쓴다. 파이프라인 작업자 스레드가 함께 쓰므로
+    # 모든 접근은 self._lock 으로 직렬화한다.
+    def __init__(self, db_path: Path, *, compress_text: bool = False):
         self.db_path = db_path
+        # 켜면 article_text/pdf_text 를 zlib BLOB 으로 쓴다. 읽을 때는 형식과 상관없이 푼다.
+        self.compress_text = compress_text
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.RLock()
+        self._depth = 0
+        self._pending = 0
+        self._batch_size = DEFAULT_BATCH_SIZE
+        self.fts_enabled = False
+        self._conn = self._connect()
         self._initialize()
 
     def _connect(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(str(self.db_path))
+        conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
         conn.row_factory = sqlite3.Row
+        conn.create_function("scourt_text", 1, _decode_text, deterministic=True)
+        for pragma in PRAGMAS:
+            conn.execute(pragma)
         return conn
 
+    def close(self) -> None:
+        # WAL 을 본 파일에 합쳐 두어야 DB 파일 하나만 복사해도(Actions 캐시 등) 최신 상태다.
+        with self._lock:
+            self._conn.commit()
+            self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            self._conn.close()
+
+    @contextmanager
+    def unit_of_work(self, batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator[None]:
+        # 안에서 일어난 쓰기를 batch_size 개씩 묶어 커밋하고, 빠져나갈 때 남은 것을 커밋한다.
+        # 중첩되면 가장 바깥 블록이 끝날 때 커밋한다. mark_sent 는 묶지 않고 바로 커밋한다.
+        with self._lock:
+            self._depth += 1
+            if self._depth == 1:
+                self._batch_size = max(1, batch_size)
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._depth -= 1
+                if self._depth == 0:
+                    self._commit()
+
+    def _commit(self) -> None:
+        self._conn.commit()
+        self._pending = 0
+
+    def _write(self, sql: str, params: Iterable[Any] = (), *, durable: bool = False) -> None:
+        with self._lock:
+            self._conn.execute(sql, tuple(params))
+            self._pending += 1
+            if durable or self._depth == 0 or self._pending >= self._batch_size:
+                self._commit()
+
+    def _write_many(
+        self,
+        sql: str,
+        rows: list[tuple[Any, ...]],
+        *,
+        reindex: Iterable[str] = (),
+    ) -> None:
+        # reindex 는 이 쓰기로 제목/본문이 바뀔 수 있는 notice_id 로, 검색 색인을 함께 고친다.
+        reindex = list(reindex) if self.fts_enabled else []
+        with self._lock:
+            self._reindex(FTS_DELETE_SQL, reindex)
+            self._conn.executemany(sql, rows)
+            self._reindex(FTS_INSERT_SQL, reindex)
+            self._pending += len(rows)
+            if self._depth == 0 or self._pending >= self._batch_size:
+                self._commit()
+
+    def _reindex(self, template: str, notice_ids: list[str]) -> None:
+        for chunk in _chunks(notice_ids):
+            self._conn.execute(
+                template.format(placeholders=", ".join("?" * len(chunk))),
+                chunk,
+            )
+
+    def _fetch_one(self, sql: str, params: Iterable[Any] = ()) -> sqlite3.Row | None:
+        with self._lock:
+            return self._conn.execute(sql, tuple(params)).fetchone()
+
+    def _fetch_all(self, sql: str, params: Iterable[Any] = ()) -> list[sqlite3.Row]:
+        with self._lock:
+            return self._conn.execute(sql, tuple(params)).fetchall()
+
     def _initialize(self) -> None:
-        with self._connect() as conn:
-            conn.execute(
-                """
-                CREATE TABLE IF NOT EXISTS notices (
-                    notice_id TEXT PRIMARY KEY,
-                    title TEXT NOT NULL,
-                    posted_date TEXT NOT NULL,
-                    detail_url TEXT NOT NULL,
-                    pdf_url TEXT,
-                    pdf_hash TEXT,
-                    content_hash TEXT NOT NULL,
-                    article_text TEXT NOT NULL,
-                    sent_at TEXT,
-                    created_at TEXT NOT NULL,
-                    updated_at TEXT NOT NULL
-                )
-                """
+        # PRAGMA user_version 이 적용된 마이그레이션 수다. 버전 도입 전 DB 는 0 이고,
+        # 첫 마이그레이션이 IF NOT EXISTS/열 추가로 예전 스키마를 그대로 이어받는다.
+        with self._lock:
+            conn = self._conn
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            for target, migrate in enumerate(MIGRATIONS, start=1):
+                if version >= target:
+                    continue
+                conn.execute("BEGIN")
+                try:
+                    migrate(conn)
+                    conn.execute(f"PRAGMA user_version = {target}")
+                    conn.commit()
+                except Exception:
+                    conn.rollback()
+                    raise
+                LOGGER.info("상태 DB 마이그레이션: %s -> %s (%s)", version, target, migrate.__name__)
+                version = target
+            self.fts_enabled = _ensure_fts(conn)
+            conn.commit()
+
+    def get_notice(self, notice_id: str) -> dict[str, Any] | None:
+        row = self._fetch_one("SELECT * FROM notices WHERE notice_id = ?", (notice_id,))
+        if row is None:
+            return None
+        notice = dict(row)
+        notice["article_text"] = _decode_text(notice["article_text"])
+        notice["pdf_text"] = _decode_text(notice["pdf_text"])
+        return notice
+
+    def get_notice_states(self, notice_ids: Iterable[str]) -> dict[str, dict[str, Any]]:
+        # 실행 대상 전체의 해시/전송 여부를 한 번에 읽는다. 없는 id 는 결과에 없다.
+        columns = ", ".join(NOTICE_STATE_COLUMNS)
+        states: dict[str, dict[str, Any]] = {}
+        for chunk in _chunks(notice_ids):
+            rows = self._fetch_all(
+                f"SELECT {columns} FROM notices "
+                f"WHERE notice_id IN ({', '.join('?' * len(chunk))})",
+                chunk,
             )
-            conn.execute(
-                """
-                CREATE TABLE IF NOT EXISTS metadata (
-                    key TEXT PRIMARY KEY,
-                    value TEXT NOT NULL,
-                    updated_at TEXT NOT NULL
-                )
+            for row in rows:
+                state = dict(row)
+                state["has_pdf_text"] = bool(state["has_pdf_text"])
+                states[row["notice_id"]] = state
+        return states
+
+    def existing_notice_ids(self, notice_ids: Iterable[str]) -> set[str]:
+        existing: set[str] = set()
+        for chunk in _chunks(notice_ids):
+            rows = self._fetch_all(
+                "SELECT notice_id FROM notices "
+                f"WHERE notice_id IN ({', '.join('?' * len(chunk))})",
+                chunk,
+            )
+            existing.update(row["notice_id"] for row in rows)
+        return existing
+
+    def get_pdf_text(self, pdf_hash: str) -> str | None:
+        # 같은 첨부가 다른 notice_id 로(또는 다른 순서로) 다시 올라와도 sha256 으로 추출
+        # 텍스트를 재사용한다. attachment_texts 도입 전에 저장된 대표 첨부는 notices 에서 찾는다.
+        row = self._fetch_one(
+            "SELECT text FROM attachment_texts WHERE sha256 = ?",
+            (pdf_hash,),
+        )
+        if row is None:
+            row = self._fetch_one(
                 """
+                SELECT pdf_text AS text FROM notices
+                WHERE pdf_hash = ? AND pdf_text IS NOT NULL
+                LIMIT 1
+                """,
+                (pdf_hash,),
             )
-            conn.commit()
+        return _decode_text(row["text"]) if row else None
 
-    def get_notice(self, notice_id: str) -> dict[str, Any] | None:
-        with self._connect() as conn:
-            row = conn.execute(
-                "SELECT * FROM notices WHERE notice_id = ?",
-                (notice_id,),
-            ).fetchone()
-            return dict(row) if row else None
+    def record_pdf_text(self, sha256: str, text: str, timestamp_iso: str) -> None:
+        # 첨부(대표/추가 모두)에서 읽은 페이지까지의 텍스트. 추출에 실패한 텍스트는 넣지 않는다.
+        self._write(
+            """
+            INSERT INTO attachment_texts (sha256, text, updated_at)
+            VALUES (?, ?, ?)
+            ON CONFLICT(sha256) DO UPDATE SET
+                text = excluded.text,
+                updated_at = excluded.updated_at
+            """,
+            (sha256, _encode_text(text, self.compress_text), timestamp_iso),
+        )
 
     def is_empty(self) -> bool:
-        with self._connect() as conn:
-            row = conn.execute("SELECT COUNT(1) AS cnt FROM notices").fetchone()
-            return int(row["cnt"]) == 0
+        row = self._fetch_one("SELECT 1 FROM notices LIMIT 1")
+        return row is None
 
     def upsert_notice(
         self,
@@ -71,33 +295,52 @@ class StateStore:
         content_hash: str,
         article_text: str,
         timestamp_iso: str,
+        pdf_text: str | None = None,
+        pdf_size: int | None = None,
+        pdf_etag: str | None = None,
+        detail_hash: str | None = None,
+        attachment_signature: str | None = None,
     ) -> None:
-        with self._connect() as conn:
-            conn.execute(
-                """
-                INSERT INTO notices (
-                    notice_id,
-                    title,
-                    posted_date,
-                    detail_url,
-                    pdf_url,
-                    pdf_hash,
-                    content_hash,
-                    article_text,
-                    created_at,
-                    updated_at
-                )
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ON CONFLICT(notice_id) DO UPDATE SET
-                    title = excluded.title,
-                    posted_date = excluded.posted_date,
-                    detail_url = excluded.detail_url,
-                    pdf_url = excluded.pdf_url,
-                    pdf_hash = excluded.pdf_hash,
-                    content_hash = excluded.content_hash,
-                    article_text = excluded.article_text,
-                    updated_at = excluded.updated_at
-                """,
+        self._write_many(
+            """
+            INSERT INTO notices (
+                notice_id,
+                title,
+                posted_date,
+                detail_url,
+                pdf_url,
+                pdf_hash,
+                content_hash,
+                article_text,
+                pdf_text,
+                pdf_size,
+                pdf_etag,
+                detail_hash,
+                attachment_signature,
+                created_at,
+                updated_at
+            )
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(notice_id) DO UPDATE SET
+                title = excluded.title,
+                posted_date = excluded.posted_date,
+                detail_url = excluded.detail_url,
+                pdf_url = excluded.pdf_url,
+                pdf_hash = excluded.pdf_hash,
+                content_hash = excluded.content_hash,
+                article_text = excluded.article_text,
+                pdf_text = CASE
+                    WHEN excluded.pdf_text IS NULL AND excluded.pdf_hash IS notices.pdf_hash
+                    THEN notices.pdf_text
+                    ELSE excluded.pdf_text
+                END,
+                pdf_size = excluded.pdf_size,
+                pdf_etag = excluded.pdf_etag,
+                detail_hash = excluded.detail_hash,
+                attachment_signature = excluded.attachment_signature,
+                updated_at = excluded.updated_at
+            """,
+            [
                 (
                     notice_id,
                     title,
@@ -106,49 +349,475 @@ class StateStore:
                     pdf_url,
                     pdf_hash,
                     content_hash,
-                    article_text,
+                    _encode_text(article_text, self.compress_text),
+                    _encode_text(pdf_text, self.compress_text),
+                    pdf_size,
+                    pdf_etag,
+                    detail_hash,
+                    attachment_signature,
                     timestamp_iso,
                     timestamp_iso,
+                )
+            ],
+            reindex=[notice_id],
+        )
+
+    def mark_sent(self, notice_id: str, timestamp_iso: str) -> None:
+        # 전송 기록은 unit_of_work 안이라도 바로 커밋해 중단 뒤 재전송되지 않게 한다.
+        self._write(
+            """
+            UPDATE notices
+            SET sent_at = ?, updated_at = ?
+            WHERE notice_id = ?
+            """,
+            (timestamp_iso, timestamp_iso, notice_id),
+            durable=True,
+        )
+
+    def record_pdf_file(
+        self,
+        sha256: str,
+        *,
+        size: int | None,
+        stored_size: int,
+        timestamp_iso: str,
+    ) -> None:
+        # PDF 보관소 색인. notice 와는 notice_attachments(대표 첨부는 notices.pdf_hash 도)로
+        # 이어지고, last_used_at 은 gc 의 LRU 기준이다.
+        self._write(
+            """
+            INSERT INTO pdf_files (sha256, size, stored_size, created_at, last_used_at)
+            VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT(sha256) DO UPDATE SET
+                size = COALESCE(excluded.size, pdf_files.size),
+                stored_size = excluded.stored_size,
+                last_used_at = MAX(pdf_files.last_used_at, excluded.last_used_at)
+            """,
+            (sha256, size, stored_size, timestamp_iso, timestamp_iso),
+        )
+
+    def set_notice_attachments(self, notice_id: str, sha256s: Iterable[str]) -> None:
+        # 글의 첨부 전체(대표 첨부 포함)의 sha256. 첨부를 다시 받지 않고 건너뛴 글도
+        # 이 목록으로 보관 사본을 모두 사용 중으로 표시한다.
+        rows = [(notice_id, sha256) for sha256 in dict.fromkeys(sha256s)]
+        with self.unit_of_work():
+            self._write("DELETE FROM notice_attachments WHERE notice_id = ?", (notice_id,))
+            if rows:
+                self._write_many(
+                    "INSERT INTO notice_attachments (notice_id, sha256) VALUES (?, ?)",
+                    rows,
+                )
+
+    def touch_notice_pdfs(self, notice_id: str, timestamp_iso: str) -> None:
+        # 건너뛴 글의 보관 사본을 쓰는 중으로 본다(gc 기간 기준). 첨부 목록이 없는 예전 글은
+        # notices.pdf_hash 로 찾는다.
+        self._write(
+            """
+            UPDATE pdf_files
+            SET last_used_at = MAX(last_used_at, ?)
+            WHERE sha256 IN (
+                SELECT sha256 FROM notice_attachments WHERE notice_id = ?
+                UNION
+                SELECT pdf_hash FROM notices WHERE notice_id = ?
+            )
+            """,
+            (timestamp_iso, notice_id, notice_id),
+        )
+
+    def list_pdf_files(self) -> list[dict[str, Any]]:
+        # 오래 안 쓴 순서(LRU)
+        rows = self._fetch_all(
+            """
+            SELECT sha256, size, stored_size, last_used_at
+            FROM pdf_files
+            ORDER BY last_used_at, sha256
+            """
+        )
+        return [dict(row) for row in rows]
+
+    def delete_pdf_files(self, sha256s: list[str]) -> None:
+        self._write_many(
+            "DELETE FROM pdf_files WHERE sha256 = ?",
+            [(sha256,) for sha256 in sha256s],
+        )
+
+    def search(self, query: str, limit: int = 20) -> list[SearchHit]:
+        # 제목/기사/PDF 텍스트 전문 검색. 공백으로 나눈 검색어를 모두 포함하는 글을
+        # bm25 순(제목 가중치가 가장 크다)으로 돌려준다. pdf_text 는 상세 본문이 비어
+        # PDF 로 기사를 만든 글에만 있고, 그것도 요약에 필요한 앞쪽 페이지까지다.
+        terms = list(dict.fromkeys(query.split()))
+        if not terms:
+            return []
+        long_terms = [term for term in terms if len(term) >= FTS_MIN_TERM_LENGTH]
+        if self.fts_enabled and long_terms:
+            like_sql, like_params = _like_clause(
+                [term for term in terms if len(term) < FTS_MIN_TERM_LENGTH]
+            )
+            match = " ".join('"' + term.replace('"', '""') + '"' for term in long_terms)
+            rows = self._fetch_all(
+                f"""
+                SELECT
+                    n.notice_id,
+                    n.title,
+                    n.posted_date,
+                    n.detail_url,
+                    snippet(notices_fts, -1, '[', ']', '…', {SNIPPET_TOKENS}) AS snippet,
+                    bm25(notices_fts, 10.0, 2.0, 1.0) AS rank
+                FROM notices_fts
+                JOIN notices AS n ON n.rowid = notices_fts.rowid
+                WHERE notices_fts MATCH ?{" AND " + like_sql if like_sql else ""}
+                ORDER BY rank
+                LIMIT ?
+                """,
+                [match, *like_params, limit],
+            )
+            return [SearchHit(**dict(row)) for row in rows]
+
+        like_sql, like_params = _like_clause(terms)
+        rows = self._fetch_all(
+            f"""
+            SELECT n.notice_id, n.title, n.posted_date, n.detail_url, n.article_text, n.pdf_text
+            FROM notices AS n
+            WHERE {like_sql}
+            ORDER BY n.posted_date DESC, n.notice_id DESC
+            LIMIT ?
+            """,
+            [*like_params, limit],
+        )
+        return [
+            SearchHit(
+                notice_id=row["notice_id"],
+                title=row["title"],
+                posted_date=row["posted_date"],
+                detail_url=row["detail_url"],
+                snippet=_like_snippet(
+                    [
+                        row["title"],
+                        _decode_text(row["article_text"]),
+                        _decode_text(row["pdf_text"]) or "",
+                    ],
+                    terms,
                 ),
             )
-            conn.commit()
+            for row in rows
+        ]
 
-    def mark_sent(self, notice_id: str, timestamp_iso: str) -> None:
-        with self._connect() as conn:
-            conn.execute(
+    def rebuild_search_index(self) -> int:
+        # notices 전체로 색인을 다시 만든다. 색인 도입 전 DB, VACUUM 뒤, 색인이 어긋났을 때 쓴다.
+        with self._lock:
+            if not self.fts_enabled:
+                raise RuntimeError("이 SQLite 는 FTS5 trigram 토크나이저를 지원하지 않습니다.")
+            self._conn.execute("INSERT INTO notices_fts (notices_fts) VALUES ('rebuild')")
+            self._commit()
+            row = self._conn.execute("SELECT COUNT(1) AS cnt FROM notices").fetchone()
+            return int(row["cnt"])
+
+    def list_unsent_notices(self, limit: int = 50) -> list[dict[str, Any]]:
+        # 저장됐지만 아직 전송 기록이 없는 글(dry-run, 전송 실패 등), 최근 게시 순
+        rows = self._fetch_all(
+            """
+            SELECT notice_id, title, posted_date, detail_url, updated_at
+            FROM notices
+            WHERE sent_at IS NULL
+            ORDER BY posted_date DESC, notice_id DESC
+            LIMIT ?
+            """,
+            (limit,),
+        )
+        return [dict(row) for row in rows]
+
+    def record_run(self, stats: RunStats, *, dry_run: bool, force: bool) -> None:
+        self._write(
+            """
+            INSERT INTO runs (
+                started_at,
+                finished_at,
+                elapsed_seconds,
+                dry_run,
+                force,
+                boards,
+                scanned,
+                processed,
+                sent,
+                skipped,
+                failed,
+                unchanged,
+                stage_seconds
+            )
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            (
+                stats.started_at,
+                stats.finished_at,
+                stats.elapsed_seconds,
+                int(dry_run),
+                int(force),
+                ",".join(stats.boards),
+                stats.scanned,
+                stats.processed,
+                stats.sent,
+                stats.skipped,
+                stats.failed,
+                stats.unchanged,
+                json.dumps(stats.stage_seconds, sort_keys=True),
+            ),
+        )
+
+    def recent_runs(self, limit: int = 30) -> list[dict[str, Any]]:
+        # 최근 실행부터
+        rows = self._fetch_all(
+            "SELECT * FROM runs ORDER BY started_at DESC, run_id DESC LIMIT ?",
+            (limit,),
+        )
+        runs = []
+        for row in rows:
+            run = dict(row)
+            run["stage_seconds"] = json.loads(run["stage_seconds"])
+            runs.append(run)
+        return runs
+
+    def compact(
+        self,
+        *,
+        prune_before: str | None = None,
+        min_free_ratio: float = 0.0,
+    ) -> CompactStats:
+        # 본문 저장 형식을 compress_text 에 맞추고, prune_before 이전에 전송된 글의 기사/PDF
+        # 본문과 그 전에 쓴 첨부 텍스트(attachment_texts)를 비운다. 해시와 제목은 남으므로 중복 판정과 제목 검색은 그대로다.
+        # VACUUM(과 그 뒤의 색인 재구성)은 빈 페이지가 파일의 min_free_ratio 이상일 때만 한다.
+        with self._lock:
+            if self._depth:
+                raise RuntimeError("unit_of_work 안에서는 compact 할 수 없습니다.")
+            stats = CompactStats(before_bytes=self.size_report().total_bytes)
+            if prune_before is not None:
+                rows = self._conn.execute(
+                    """
+                    SELECT notice_id FROM notices
+                    WHERE sent_at IS NOT NULL
+                      AND sent_at < ?
+                      AND (article_text != '' OR pdf_text IS NOT NULL)
+                    """,
+                    (prune_before,),
+                ).fetchall()
+                pruned = [row["notice_id"] for row in rows]
+                self._write_many(
+                    "UPDATE notices SET article_text = '', pdf_text = NULL WHERE notice_id = ?",
+                    [(notice_id,) for notice_id in pruned],
+                    reindex=pruned,
+                )
+                stats.pruned = len(pruned)
+                self._write(
+                    "DELETE FROM attachment_texts WHERE updated_at < ?",
+                    (prune_before,),
+                )
+            stats.recoded = self._recode_texts()
+            self._commit()
+            report = self.size_report()
+            if report.file_bytes and report.free_bytes >= min_free_ratio * report.file_bytes:
+                self._conn.execute("VACUUM")
+                if self.fts_enabled:
+                    # VACUUM 은 notices 의 rowid 를 바꿀 수 있다.
+                    self._conn.execute(
+                        "INSERT INTO notices_fts (notices_fts) VALUES ('rebuild')"
+                    )
+                    self._commit()
+                stats.vacuumed = True
+            self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            stats.after_bytes = self.size_report().total_bytes
+            return stats
+
+    def _recode_texts(self) -> int:
+        # 본문 전체를 메모리에 올리지 않도록 rowid 순으로 나눠 읽는다.
+        recoded = 0
+        last_rowid = 0
+        while True:
+            rows = self._conn.execute(
                 """
-                UPDATE notices
-                SET sent_at = ?, updated_at = ?
-                WHERE notice_id = ?
+                SELECT rowid, article_text, pdf_text FROM notices
+                WHERE rowid > ?
+                ORDER BY rowid
+                LIMIT ?
                 """,
-                (timestamp_iso, timestamp_iso, notice_id),
-            )
-            conn.commit()
+                (last_rowid, LOOKUP_CHUNK_SIZE),
+            ).fetchall()
+            if not rows:
+                return recoded
+            for row in rows:
+                values = [
+                    _encode_text(_decode_text(row[column]), self.compress_text)
+                    for column in ("article_text", "pdf_text")
+                ]
+                if values == [row["article_text"], row["pdf_text"]]:
+                    continue
+                self._conn.execute(
+                    "UPDATE notices SET article_text = ?, pdf_text = ? WHERE rowid = ?",
+                    (*values, row["rowid"]),
+                )
+                recoded += 1
+            last_rowid = rows[-1]["rowid"]
 
-    def get_meta(self, key: str) -> str | None:
-        with self._connect() as conn:
+    def size_report(self) -> DbSizeReport:
+        with self._lock:
+            conn = self._conn
+            page_size = conn.execute("PRAGMA page_size").fetchone()[0]
+            free_pages = conn.execute("PRAGMA freelist_count").fetchone()[0]
             row = conn.execute(
-                "SELECT value FROM metadata WHERE key = ?",
-                (key,),
+                """
+                SELECT
+                    COUNT(1) AS notices,
+                    SUM(typeof(article_text) = 'blob') + SUM(typeof(pdf_text) = 'blob')
+                        AS compressed,
+                    SUM(article_text = '') AS pruned,
+                    SUM(length(CAST(article_text AS BLOB)))
+                        + COALESCE(SUM(length(CAST(pdf_text AS BLOB))), 0) AS text_bytes
+                FROM notices
+                """
             ).fetchone()
-            return row["value"] if row else None
+            try:
+                tables = {
+                    item["name"]: int(item["size"])
+                    for item in conn.execute(
+                        "SELECT name, SUM(pgsize) AS size FROM dbstat GROUP BY name "
+                        "ORDER BY size DESC"
+                    )
+                }
+            except sqlite3.OperationalError:
+                # dbstat 없이 빌드된 SQLite
+                tables = {}
+        wal_path = self.db_path.with_name(self.db_path.name + "-wal")
+        return DbSizeReport(
+            file_bytes=self.db_path.stat().st_size,
+            wal_bytes=wal_path.stat().st_size if wal_path.exists() else 0,
+            free_bytes=free_pages * page_size,
+            notices=int(row["notices"]),
+            compressed_texts=int(row["compressed"] or 0),
+            pruned=int(row["pruned"] or 0),
+            text_bytes=int(row["text_bytes"] or 0),
+            tables=tables,
+        )
 
-    def set_meta(self, key: str, value: str, timestamp_iso: str) -> None:
-        with self._connect() as conn:
-            conn.execute(
-                """
-                INSERT INTO metadata (key, value, updated_at)
-                VALUES (?, ?, ?)
-                ON CONFLICT(key) DO UPDATE SET
-                    value = excluded.value,
-                    updated_at = excluded.updated_at
-                """,
-                (key, value, timestamp_iso),
+    def iter_notice_changes(
+        self,
+        since: str | None,
+        *,
+        include_text: bool = False,
+    ) -> Iterator[dict[str, Any]]:
+        # updated_at > since 인 글을 (updated_at, notice_id) 순으로 나눠 읽는다.
+        # 실행 하나가 같은 시각(실행 시작 시각)으로 쓰므로 실행이 끝난 뒤 내보내면 빠지는 글이 없다.
+        columns = ", ".join(
+            SNAPSHOT_COLUMNS + (("article_text", "pdf_text") if include_text else ())
+        )
+        select = f"SELECT {columns} FROM notices"
+        rows = self._fetch_all(
+            f"{select} WHERE updated_at > ? ORDER BY updated_at, notice_id LIMIT ?",
+            (since or "", LOOKUP_CHUNK_SIZE),
+        )
+        while rows:
+            for row in rows:
+                record = dict(row)
+                if include_text:
+                    record["article_text"] = _decode_text(record["article_text"])
+                    record["pdf_text"] = _decode_text(record["pdf_text"])
+                yield record
+            rows = self._fetch_all(
+                f"{select} WHERE (updated_at, notice_id) > (?, ?) "
+                "ORDER BY updated_at, notice_id LIMIT ?",
+                (rows[-1]["updated_at"], rows[-1]["notice_id"], LOOKUP_CHUNK_SIZE),
             )
-            conn.commit()
 
-    def get_last_seen_notice_id(self) -> int | None:
-        raw = self.get_meta("last_seen_notice_id")
+    def meta_changes(self, since: str | None) -> list[dict[str, Any]]:
+        rows = self._fetch_all(
+            "SELECT key, value, updated_at FROM metadata WHERE updated_at > ? ORDER BY key",
+            (since or "",),
+        )
+        return [dict(row) for row in rows]
+
+    def apply_snapshot(
+        self,
+        notices: Iterable[dict[str, Any]],
+        metas: Iterable[dict[str, Any]],
+    ) -> int:
+        # 스냅숏 레코드를 덮어쓴다. 이미 더 새 값(updated_at)이 있으면 그대로 두므로
+        # 같은 스냅숏을 여러 번 넣어도 결과가 같다. 본문이 없는 레코드는 기존 본문을 남긴다.
+        notice_rows = [
+            tuple(record.get(column) for column in SNAPSHOT_COLUMNS)
+            + (
+                _encode_text(record.get("article_text") or "", self.compress_text),
+                _encode_text(record.get("pdf_text"), self.compress_text),
+            )
+            for record in notices
+        ]
+        meta_rows = [(meta["key"], meta["value"], meta["updated_at"]) for meta in metas]
+        columns = ", ".join(SNAPSHOT_COLUMNS + ("article_text", "pdf_text"))
+        placeholders = ", ".join("?" * (len(SNAPSHOT_COLUMNS) + 2))
+        updates = ",\n".join(
+            f"{column} = excluded.{column}"
+            for column in SNAPSHOT_COLUMNS
+            if column not in ("notice_id", "created_at")
+        )
+        with self.unit_of_work():
+            if notice_rows:
+                self._write_many(
+                    f"""
+                    INSERT INTO notices ({columns})
+                    VALUES ({placeholders})
+                    ON CONFLICT(notice_id) DO UPDATE SET
+                        {updates},
+                        article_text = CASE
+                            WHEN excluded.article_text = '' THEN notices.article_text
+                            ELSE excluded.article_text
+                        END,
+                        pdf_text = CASE
+                            WHEN excluded.pdf_text IS NULL
+                                AND excluded.pdf_hash IS notices.pdf_hash
+                            THEN notices.pdf_text
+                            ELSE excluded.pdf_text
+                        END
+                    WHERE excluded.updated_at >= notices.updated_at
+                    """,
+                    notice_rows,
+                    reindex=[row[0] for row in notice_rows],
+                )
+            if meta_rows:
+                self._write_many(
+                    """
+                    INSERT INTO metadata (key, value, updated_at)
+                    VALUES (?, ?, ?)
+                    ON CONFLICT(key) DO UPDATE SET
+                        value = excluded.value,
+                        updated_at = excluded.updated_at
+                    WHERE excluded.updated_at >= metadata.updated_at
+                    """,
+                    meta_rows,
+                )
+        return len(notice_rows) + len(meta_rows)
+
+    def get_meta(self, key: str) -> str | None:
+        row = self._fetch_one("SELECT value FROM metadata WHERE key = ?", (key,))
+        return row["value"] if row else None
+
+    def set_meta(self, key: str, value: str, timestamp_iso: str) -> None:
+        self._write(
+            """
+            INSERT INTO metadata (key, value, updated_at)
+            VALUES (?, ?, ?)
+            ON CONFLICT(key) DO UPDATE SET
+                value = excluded.value,
+                updated_at = excluded.updated_at
+            """,
+            (key, value, timestamp_iso),
+        )
+
+    def get_last_seen_notice_id(
+        self,
+        gubun: str | None = None,
+        *,
+        legacy_fallback: bool = True,
+    ) -> int | None:
+        raw = self.get_meta(_last_seen_key(gubun))
+        if raw is None and gubun is not None and legacy_fallback:
+            # 게시판별 키 도입 이전 DB 의 단일 기준선을 기본 게시판 값으로 이어받는다.
+            raw = self.get_meta(_last_seen_key(None))
         if raw is None:
             return None
         try:
@@ -156,5 +825,265 @@ class StateStore:
         except ValueError:
             return None
 
-    def set_last_seen_notice_id(self, notice_id: int, timestamp_iso: str) -> None:
-        self.set_meta("last_seen_notice_id", str(notice_id), timestamp_iso)
+    def set_last_seen_notice_id(
+        self,
+        notice_id: int,
+        timestamp_iso: str,
+        gubun: str | None = None,
+    ) -> None:
+        self.set_meta(_last_seen_key(gubun), str(notice_id), timestamp_iso)
+
+
+def _migrate_base_schema(conn: sqlite3.Connection) -> None:
+    # 버전 도입 전의 스키마. 예전 DB 에는 빠진 열만 더한다.
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS notices (
+            notice_id TEXT PRIMARY KEY,
+            title TEXT NOT NULL,
+            posted_date TEXT NOT NULL,
+            detail_url TEXT NOT NULL,
+            pdf_url TEXT,
+            pdf_hash TEXT,
+            content_hash TEXT NOT NULL,
+            article_text TEXT NOT NULL,
+            sent_at TEXT,
+            created_at TEXT NOT NULL,
+            updated_at TEXT NOT NULL
+        )
+        """
+    )
+    _ensure_columns(
+        conn,
+        "notices",
+        {
+            "pdf_text": "TEXT",
+            "pdf_size": "INTEGER",
+            "pdf_etag": "TEXT",
+            "detail_hash": "TEXT",
+            "attachment_signature": "TEXT",
+        },
+    )
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_notices_pdf_hash ON notices (pdf_hash)")
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS pdf_files (
+            sha256 TEXT PRIMARY KEY,
+            size INTEGER,
+            stored_size INTEGER NOT NULL,
+            created_at TEXT NOT NULL,
+            last_used_at TEXT NOT NULL
+        )
+        """
+    )
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_pdf_files_last_used ON pdf_files (last_used_at)"
+    )
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS metadata (
+            key TEXT PRIMARY KEY,
+            value TEXT NOT NULL,
+            updated_at TEXT NOT NULL
+        )
+        """
+    )
+
+
+def _migrate_reporting_indexes(conn: sqlite3.Connection) -> None:
+    # "미전송 글", "최근 게시/갱신 글" 같은 운영 조회가 전체를 훑지 않도록 한다.
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_notices_posted_date ON notices (posted_date)"
+    )
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_notices_sent_at ON notices (sent_at)")
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_notices_updated_at ON notices (updated_at)"
+    )
+
+
+def _migrate_runs_table(conn: sqlite3.Connection) -> None:
+    # run_once 한 번이 한 행이다. 단계별 소요 시간은 {"list": 초, ...} JSON 이다.
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS runs (
+            run_id INTEGER PRIMARY KEY AUTOINCREMENT,
+            started_at TEXT NOT NULL,
+            finished_at TEXT NOT NULL,
+            elapsed_seconds REAL NOT NULL,
+            dry_run INTEGER NOT NULL,
+            force INTEGER NOT NULL,
+            boards TEXT NOT NULL,
+            scanned INTEGER NOT NULL,
+            processed INTEGER NOT NULL,
+            sent INTEGER NOT NULL,
+            skipped INTEGER NOT NULL,
+            failed INTEGER NOT NULL,
+            unchanged INTEGER NOT NULL,
+            stage_seconds TEXT NOT NULL
+        )
+        """
+    )
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_runs_started_at ON runs (started_at)")
+
+
+def _migrate_fts_text_view(conn: sqlite3.Connection) -> None:
+    # 압축된 본문도 색인할 수 있게 FTS 가 notices 대신 압축을 푼 뷰를 읽도록 바꾼다.
+    # 색인은 _ensure_fts 가 새 스키마로 다시 만든다.
+    for trigger in ("notices_fts_insert", "notices_fts_delete", "notices_fts_update"):
+        conn.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+    conn.execute("DROP TABLE IF EXISTS notices_fts")
+    conn.execute(
+        """
+        CREATE VIEW IF NOT EXISTS notices_text AS
+        SELECT
+            rowid AS rowid,
+            title,
+            scourt_text(article_text) AS article_text,
+            scourt_text(pdf_text) AS pdf_text
+        FROM notices
+        """
+    )
+
+
+def _migrate_drop_fts_triggers(conn: sqlite3.Connection) -> None:
+    # scourt_text() 를 부르는 트리거가 있으면 그 함수를 등록하지 않은 연결(sqlite3 CLI,
+    # 벤치마크 등)은 notices 에 쓸 수 없다. 색인은 이제 StateStore 가 직접 고친다.
+    for trigger in ("notices_fts_insert", "notices_fts_delete", "notices_fts_update"):
+        conn.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+
+
+def _migrate_notice_attachments(conn: sqlite3.Connection) -> None:
+    # 글마다 첨부 전체의 sha256 을 둔다. 예전 글은 대표 첨부만 알고 있으므로 그것으로 채운다.
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS notice_attachments (
+            notice_id TEXT NOT NULL,
+            sha256 TEXT NOT NULL,
+            PRIMARY KEY (notice_id, sha256)
+        ) WITHOUT ROWID
+        """
+    )
+    conn.execute(
+        """
+        INSERT OR IGNORE INTO notice_attachments (notice_id, sha256)
+        SELECT notice_id, pdf_hash FROM notices WHERE pdf_hash IS NOT NULL
+        """
+    )
+
+
+def _migrate_attachment_texts(conn: sqlite3.Connection) -> None:
+    # 추출 텍스트를 글이 아니라 첨부 내용(sha256)에 묶는다. 대표 첨부 텍스트는 그대로 옮긴다.
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS attachment_texts (
+            sha256 TEXT PRIMARY KEY,
+            text TEXT NOT NULL,
+            updated_at TEXT NOT NULL
+        )
+        """
+    )
+    conn.execute(
+        """
+        INSERT OR IGNORE INTO attachment_texts (sha256, text, updated_at)
+        SELECT pdf_hash, pdf_text, updated_at FROM notices
+        WHERE pdf_hash IS NOT NULL AND pdf_text IS NOT NULL
+        """
+    )
+
+
+# 순서대로 한 번씩만 적용된다. 이미 배포된 항목은 고치지 말고 뒤에 추가한다.
+MIGRATIONS = (
+    _migrate_base_schema,
+    _migrate_reporting_indexes,
+    _migrate_runs_table,
+    _migrate_fts_text_view,
+    _migrate_drop_fts_triggers,
+    _migrate_notice_attachments,
+    _migrate_attachment_texts,
+)
+
+
+def _encode_text(text: str | None, compress: bool) -> str | bytes | None:
+    if text is None or not compress:
+        return text
+    data = text.encode("utf-8")
+    if len(data) < COMPRESS_MIN_BYTES:
+        return text
+    return zlib.compress(data, COMPRESS_LEVEL)
+
+
+def _decode_text(value: str | bytes | None) -> str | None:
+    # 압축본은 BLOB, 평문은 TEXT 로 저장되므로 형식 표시 없이 타입으로 가른다.
+    if isinstance(value, bytes):
+        return zlib.decompress(value).decode("utf-8")
+    return value
+
+
+def _ensure_columns(
+    conn: sqlite3.Connection,
+    table: str,
+    columns: dict[str, str],
+) -> None:
+    existing = {row["name"] for row in conn.execute(f"PRAGMA table_info({table})")}
+    for name, column_type in columns.items():
+        if name not in existing:
+            conn.execute(f"ALTER TABLE {table} ADD COLUMN {name} {column_type}")
+
+
+def _ensure_fts(conn: sqlite3.Connection) -> bool:
+    exists = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'notices_fts'"
+    ).fetchone()
+    if not exists:
+        try:
+            conn.execute(FTS_SCHEMA)
+        except sqlite3.OperationalError as exc:
+            # FTS5 나 trigram(SQLite 3.34+) 이 없는 빌드에서는 LIKE 검색으로 대신한다.
+            LOGGER.warning("전문 검색 색인을 만들 수 없어 LIKE 검색을 씁니다: %s", exc)
+            return False
+        # 색인 도입 전에 쌓인 글도 바로 찾을 수 있게 처음 한 번 채운다.
+        conn.execute("INSERT INTO notices_fts (notices_fts) VALUES ('rebuild')")
+    return True
+
+
+def _like_clause(terms: list[str]) -> tuple[str, list[str]]:
+    # 검색어마다 제목/기사/PDF 텍스트 중 하나에 들어 있어야 한다.
+    clause = (
+        "(n.title LIKE ? ESCAPE '\\' OR scourt_text(n.article_text) LIKE ? ESCAPE '\\' "
+        "OR scourt_text(n.pdf_text) LIKE ? ESCAPE '\\')"
+    )
+    sql = " AND ".join(clause for _ in terms)
+    params = [pattern for term in terms for pattern in [_like_pattern(term)] * 3]
+    return sql, params
+
+
+def _like_pattern(term: str) -> str:
+    escaped = term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+def _like_snippet(texts: list[str], terms: list[str]) -> str:
+    for text in texts:
+        for term in terms:
+            index = text.find(term)
+            if index < 0:
+                continue
+            start = max(0, index - SNIPPET_CHARS // 2)
+            end = min(len(text), index + len(term) + SNIPPET_CHARS // 2)
+            excerpt = text[start:end].replace("\n", " ")
+            for word in terms:
+                excerpt = excerpt.replace(word, f"[{word}]")
+            return ("…" if start else "") + excerpt + ("…" if end < len(text) else "")
+    return ""
+
+
+def _chunks(notice_ids: Iterable[str]) -> Iterator[list[str]]:
+    unique = list(dict.fromkeys(notice_ids))
+    for start in range(0, len(unique), LOOKUP_CHUNK_SIZE):
+        yield unique[start : start + LOOKUP_CHUNK_SIZE]
+
+
+def _last_seen_key(gubun: str | None) -> str:
+    if gubun is None:
+        return "last_seen_notice_id"
+    return f"last_seen_notice_id:{gubun}"
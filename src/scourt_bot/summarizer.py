@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import logging
+import math
+import time
+from collections import Counter
+from typing import Sequence
+
+LOGGER = logging.getLogger(__name__)
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional at runtime
+    np = None
+
+# 한국어는 띄어쓰기가 들쭉날쭉하고 PDF 추출 과정에서 공백이 깨지기도 하므로
+# 공백을 뺀 글자 2·3-gram 을 단어 대신 쓴다.
+NGRAM_SIZES = (2, 3)
+TEXTRANK_DAMPING = 0.85
+TEXTRANK_MAX_ITERATIONS = 30
+TEXTRANK_TOLERANCE = 1e-6
+# 중심성 상위 limit * CANDIDATE_FACTOR 문장만 MMR 후보로 둔다.
+CANDIDATE_FACTOR = 8
+# MMR: 관련도와 이미 고른 문장과의 유사도 사이 가중치
+MMR_LAMBDA = 0.7
+# 관련도 = 중심성(TextRank)과 키워드 점수의 가중합
+PRIOR_WEIGHT = 0.3
+# 이미 고른 문장과 이 이상 비슷하면 사실상 중복으로 보고 고르지 않는다.
+NEAR_DUPLICATE = 0.9
+
+
+def resolve_engine(name: str = "auto") -> str:
+    normalized = (name or "auto").strip().lower()
+    if normalized in {"auto", "tfidf"}:
+        if np is not None:
+            return "tfidf"
+        if normalized == "tfidf":
+            LOGGER.warning("numpy 미설치: 요약은 키워드 점수 방식으로 대체합니다.")
+        return "heuristic"
+    if normalized != "heuristic":
+        LOGGER.warning("알 수 없는 요약 엔진(%s): 키워드 점수 방식을 사용합니다.", name)
+    return "heuristic"
+
+
+def _char_ngrams(sentence: str) -> Counter:
+    text = "".join(sentence.split())
+    return Counter(
+        text[index : index + size]
+        for size in NGRAM_SIZES
+        for index in range(len(text) - size + 1)
+    )
+
+
+class _TermMatrix:
+    # 문장 x n-gram TF-IDF 희소 행렬(COO). 행마다 L2 정규화되어 있어 행끼리 내적이 곧
+    # 코사인 유사도다. scipy 없이 bincount 로 행렬-벡터 곱을 한다.
+    def __init__(self, sentences: Sequence[str]):
+        vocabulary: dict[str, int] = {}
+        rows: list[int] = []
+        cols: list[int] = []
+        counts: list[int] = []
+        for row, sentence in enumerate(sentences):
+            grams = _char_ngrams(sentence)
+            rows.extend([row] * len(grams))
+            cols.extend(vocabulary.setdefault(gram, len(vocabulary)) for gram in grams)
+            counts.extend(grams.values())
+
+        self.shape = (len(sentences), len(vocabulary))
+        self.rows = np.asarray(rows, dtype=np.int64)
+        self.cols = np.asarray(cols, dtype=np.int64)
+        document_frequency = np.bincount(self.cols, minlength=self.shape[1])
+        idf = np.log((1 + self.shape[0]) / (1 + document_frequency)) + 1.0
+        data = (1.0 + np.log(np.asarray(counts, dtype=np.float64))) * idf[self.cols]
+        norms = np.sqrt(np.bincount(self.rows, weights=data * data, minlength=self.shape[0]))
+        norms[norms == 0] = 1.0
+        self.data = data / norms[self.rows]
+
+    def dot(self, vector: "np.ndarray") -> "np.ndarray":
+        # X @ vector
+        return np.bincount(
+            self.rows,
+            weights=self.data * vector[self.cols],
+            minlength=self.shape[0],
+        )
+
+    def tdot(self, vector: "np.ndarray") -> "np.ndarray":
+        # X.T @ vector
+        return np.bincount(
+            self.cols,
+            weights=self.data * vector[self.rows],
+            minlength=self.shape[1],
+        )
+
+    def similarity(self, indices: "np.ndarray") -> "np.ndarray":
+        # 고른 행들끼리의 코사인 유사도 행렬. 쓰이는 열만 모아 조밀 행렬로 곱한다.
+        position = np.full(self.shape[0], -1, dtype=np.int64)
+        position[indices] = np.arange(len(indices))
+        mask = position[self.rows] >= 0
+        used, local_cols = np.unique(self.cols[mask], return_inverse=True)
+        dense = np.zeros((len(indices), len(used)))
+        dense[position[self.rows[mask]], local_cols] = self.data[mask]
+        return dense @ dense.T
+
+
+def _textrank(matrix: _TermMatrix, deadline: float) -> "np.ndarray | None":
+    # 유사도 그래프 S = X X^T - I 의 PageRank. n x n 행렬을 만들지 않고 X(X^T v) 로 곱한다.
+    count = matrix.shape[0]
+    degree = matrix.dot(matrix.tdot(np.ones(count))) - 1.0
+    degree[degree <= 1e-12] = 1.0
+    rank = np.full(count, 1.0 / count)
+    for _ in range(TEXTRANK_MAX_ITERATIONS):
+        if time.monotonic() > deadline:
+            return None
+        walk = rank / degree
+        updated = (1 - TEXTRANK_DAMPING) / count + TEXTRANK_DAMPING * (
+            matrix.dot(matrix.tdot(walk)) - walk
+        )
+        converged = float(np.abs(updated - rank).sum()) < TEXTRANK_TOLERANCE
+        rank = updated
+        if converged:
+            break
+    return rank
+
+
+def rank_sentences(
+    sentences: Sequence[str],
+    priors: Sequence[float],
+    limit: int,
+    *,
+    deadline: float,
+) -> list[int] | None:
+    # 요약에 쓸 문장 번호를 중요한 순서로 돌려준다. numpy 가 없거나 deadline 을
+    # 넘기면 None 을 돌려주고, 호출한 쪽이 키워드 점수 방식으로 고른다.
+    if np is None or limit <= 0 or not sentences:
+        return None
+    matrix = _TermMatrix(sentences)
+    if time.monotonic() > deadline:
+        return None
+    centrality = _textrank(matrix, deadline)
+    if centrality is None:
+        return None
+
+    prior = np.asarray(priors, dtype=np.float64)
+    relevance = (1 - PRIOR_WEIGHT) * centrality / max(float(centrality.max()), 1e-12)
+    relevance += PRIOR_WEIGHT * prior / max(float(prior.max()), 1e-12)
+
+    pool_size = min(len(sentences), limit * CANDIDATE_FACTOR)
+    pool = np.argsort(-relevance, kind="stable")[:pool_size]
+    similarity = matrix.similarity(pool)
+    pool_relevance = relevance[pool]
+
+    selected: list[int] = []
+    closest = np.zeros(pool_size)
+    available = np.ones(pool_size, dtype=bool)
+    while len(selected) < limit:
+        if time.monotonic() > deadline:
+            return None
+        available &= closest < NEAR_DUPLICATE
+        if not available.any():
+            break
+        score = MMR_LAMBDA * pool_relevance - (1 - MMR_LAMBDA) * closest
+        score[~available] = -math.inf
+        best = int(np.argmax(score))
+        selected.append(int(pool[best]))
+        available[best] = False
+        closest = np.maximum(closest, similarity[best])
+    return selected
@@ -1,14 +1,30 @@
 from __future__ import annotations
 
+import json
+from dataclasses import dataclass, field
+from typing import Any
+
 import requests
 
 from .models import ArticleDraft
 
+# Incoming Webhook 한 건의 최대 크기는 28KB 다. 카드 틀과 여유분을 빼고 맞춘다.
+MAX_PAYLOAD_BYTES = 27 * 1024
+DIGEST_MAX_SECTIONS = 10
+TRUNCATED_MARK = "\n…(이하 생략)"
+
+
+@dataclass
+class DigestCard:
+    payload: dict[str, Any]
+    # 이 카드가 전한 글. 카드 전송이 성공하면 이 글들만 전송 완료로 기록한다.
+    notice_ids: list[str] = field(default_factory=list)
+
 
 class TeamsNotifier:
-    def __init__(self, webhook_url: str):
+    def __init__(self, webhook_url: str, session: requests.Session | None = None):
         self.webhook_url = webhook_url
-        self.session = requests.Session()
+        self.session = session or requests.Session()
 
     def send(self, article: ArticleDraft) -> None:
         payload = {
@@ -24,21 +40,111 @@ class TeamsNotifier:
                     "markdown": True,
                 }
             ],
-            "potentialAction": [
-                {
-                    "@type": "OpenUri",
-                    "name": "보도자료 상세 보기",
-                    "targets": [{"os": "default", "uri": article.detail_url}],
-                }
-            ],
+            "potentialAction": _link_actions(article),
         }
-        if article.pdf_url:
-            payload["potentialAction"].append(
-                {
-                    "@type": "OpenUri",
-                    "name": "첨부 PDF 열기",
-                    "targets": [{"os": "default", "uri": article.pdf_url}],
-                }
-            )
-        response = self.session.post(self.webhook_url, json=payload, timeout=15)
+        self.post(payload)
+
+    def build_digest(
+        self,
+        items: list[tuple[str, ArticleDraft]],
+        *,
+        max_sections: int = DIGEST_MAX_SECTIONS,
+        max_bytes: int = MAX_PAYLOAD_BYTES,
+    ) -> list[DigestCard]:
+        # (notice_id, 기사) 를 순서대로 카드에 섹션으로 담는다. 섹션 수나 크기 한도를 넘기면
+        # 다음 카드로 넘기고, 섹션 하나만으로도 넘치면 본문을 줄인다.
+        cards: list[DigestCard] = []
+        card: DigestCard | None = None
+        for notice_id, article in items:
+            section = _digest_section(article)
+            if card is not None and len(card.notice_ids) < max_sections:
+                card.payload["sections"].append(section)
+                if _payload_size(card.payload) <= max_bytes:
+                    card.notice_ids.append(notice_id)
+                    continue
+                card.payload["sections"].pop()
+            card = DigestCard(payload=_digest_payload(), notice_ids=[notice_id])
+            card.payload["sections"].append(section)
+            _fit_section(card.payload, section, max_bytes)
+            cards.append(card)
+
+        for index, item in enumerate(cards, start=1):
+            title = f"대법원 판결 보도자료 브리핑 ({len(item.notice_ids)}건"
+            title += f", {index}/{len(cards)})" if len(cards) > 1 else ")"
+            item.payload["title"] = title
+            item.payload["summary"] = title
+        return cards
+
+    def post(self, payload: dict[str, Any]) -> None:
+        # 한글이 \uXXXX 로 부풀지 않게 UTF-8 그대로 보낸다(크기 한도 계산과 같은 기준).
+        # 429/Retry-After 재시도는 세션(PoliteSession)이 한다.
+        response = self.session.post(
+            self.webhook_url,
+            data=_encode(payload),
+            headers={"Content-Type": "application/json; charset=utf-8"},
+            timeout=15,
+        )
         response.raise_for_status()
+        # 예전 커넥터는 스로틀링을 200 과 "HTTP error 429" 본문으로 알려 준다.
+        if "HTTP error 429" in response.text:
+            raise requests.HTTPError("Teams webhook 전송 제한(429)", response=response)
+
+
+def _link_actions(article: ArticleDraft) -> list[dict[str, Any]]:
+    actions = [
+        {
+            "@type": "OpenUri",
+            "name": "보도자료 상세 보기",
+            "targets": [{"os": "default", "uri": article.detail_url}],
+        }
+    ]
+    if article.pdf_url:
+        actions.append(
+            {
+                "@type": "OpenUri",
+                "name": "첨부 PDF 열기",
+                "targets": [{"os": "default", "uri": article.pdf_url}],
+            }
+        )
+    return actions
+
+
+def _digest_payload() -> dict[str, Any]:
+    return {
+        "@type": "MessageCard",
+        "@context": "https://schema.org/extensions",
+        "summary": "",
+        "themeColor": "005A9C",
+        "title": "",
+        "sections": [],
+    }
+
+
+def _digest_section(article: ArticleDraft) -> dict[str, Any]:
+    return {
+        "activityTitle": f"**{article.headline}**",
+        "activitySubtitle": article.posted_date,
+        "text": article.body,
+        "markdown": True,
+        "potentialAction": _link_actions(article),
+    }
+
+
+def _fit_section(payload: dict[str, Any], section: dict[str, Any], max_bytes: int) -> None:
+    overflow = _payload_size(payload) - max_bytes
+    if overflow <= 0:
+        return
+    data = section["text"].encode("utf-8")
+    keep = max(0, len(data) - overflow - len(TRUNCATED_MARK.encode("utf-8")))
+    # 잘린 마지막 글자(UTF-8 일부 바이트)는 버린다.
+    text = data[:keep].decode("utf-8", errors="ignore")
+    section["text"] = text.rstrip() + TRUNCATED_MARK
+
+
+def _encode(payload: dict[str, Any]) -> bytes:
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _payload_size(payload: dict[str, Any]) -> int:
+    # 제목은 카드를 다 나눈 뒤 붙이므로 그 몫(약 80바이트)을 미리 더한다.
+    return len(_encode(payload)) + 80
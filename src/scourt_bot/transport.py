@@ -0,0 +1,349 @@
+from __future__ import annotations
+
+import logging
+import math
+import random
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .config import Settings
+
+LOGGER = logging.getLogger(__name__)
+
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+MAX_RETRY_AFTER_SECONDS = 120.0
+
+
+class TokenBucket:
+    def __init__(self, rate_per_second: float, burst: int):
+        self.rate = rate_per_second
+        self.capacity = float(max(1, burst))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity,
+                    self._tokens + (now - self._updated) * self.rate,
+                )
+                self._updated = now
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return waited
+                delay = (1.0 - self._tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+
+class HostRateLimiter:
+    def __init__(self, rate_per_second: float, burst: int):
+        self.rate_per_second = rate_per_second
+        self.burst = burst
+        self._buckets: dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, host: str) -> float:
+        if self.rate_per_second <= 0:
+            return 0.0
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                bucket = TokenBucket(self.rate_per_second, self.burst)
+                self._buckets[host] = bucket
+        return bucket.acquire()
+
+
+@dataclass
+class ConcurrencySnapshot:
+    limit: int
+    peak_in_flight: int
+    requests: int
+    errors: int
+    throttled: int
+    latency_p50_ms: float
+    latency_p95_ms: float
+
+
+class AdaptiveConcurrencyLimiter:
+    # AIMD: 정상 응답마다 limit 을 1/limit 씩 늘리고, 429/5xx/연결 오류나
+    # 기준 대비 느린 응답이 오면 절반으로 줄인다(쿨다운 동안 한 번만).
+    def __init__(
+        self,
+        *,
+        initial_limit: int,
+        max_limit: int,
+        min_limit: int = 1,
+        slow_factor: float = 3.0,
+        slow_floor_seconds: float = 2.0,
+        decrease_factor: float = 0.5,
+    ):
+        self.min_limit = max(1, min_limit)
+        self.max_limit = max(self.min_limit, max_limit)
+        self.slow_factor = slow_factor
+        self.slow_floor_seconds = slow_floor_seconds
+        self.decrease_factor = decrease_factor
+        self._limit = float(min(self.max_limit, max(self.min_limit, initial_limit)))
+        self._in_flight = 0
+        self._baseline: float | None = None
+        self._last_decrease = 0.0
+        self._cond = threading.Condition()
+        self._reset_window_locked()
+
+    @property
+    def limit(self) -> int:
+        return max(self.min_limit, int(self._limit))
+
+    def _reset_window_locked(self) -> None:
+        self._latencies: deque[float] = deque(maxlen=1024)
+        self._requests = 0
+        self._errors = 0
+        self._throttled = 0
+        self._peak_in_flight = 0
+
+    def reset_window(self) -> None:
+        with self._cond:
+            self._reset_window_locked()
+
+    def acquire(self) -> None:
+        with self._cond:
+            while self._in_flight >= self.limit:
+                self._cond.wait()
+            self._in_flight += 1
+            self._peak_in_flight = max(self._peak_in_flight, self._in_flight)
+
+    def release(self, latency: float, *, status: int | None, error: bool = False) -> None:
+        with self._cond:
+            self._in_flight = max(0, self._in_flight - 1)
+            self._requests += 1
+            self._latencies.append(latency)
+
+            throttled = status == 429
+            failed = error or throttled or (status is not None and status >= 500)
+            if throttled:
+                self._throttled += 1
+            if failed:
+                self._errors += 1
+
+            slow_threshold = max(
+                self.slow_floor_seconds,
+                (self._baseline or latency) * self.slow_factor,
+            )
+            if failed or latency > slow_threshold:
+                self._decrease_locked(latency)
+            else:
+                self._limit = min(float(self.max_limit), self._limit + 1.0 / self._limit)
+                # 기준 지연은 정상 응답만으로 천천히 따라간다.
+                self._baseline = (
+                    latency
+                    if self._baseline is None
+                    else self._baseline * 0.9 + latency * 0.1
+                )
+            self._cond.notify_all()
+
+    def _decrease_locked(self, latency: float) -> None:
+        now = time.monotonic()
+        cooldown = max(latency, self._baseline or 0.0, 0.5)
+        if now - self._last_decrease < cooldown:
+            return
+        self._last_decrease = now
+        previous = self.limit
+        self._limit = max(float(self.min_limit), self._limit * self.decrease_factor)
+        if self.limit != previous:
+            LOGGER.info("동시 요청 한도 축소: %s -> %s", previous, self.limit)
+
+    def cancel(self) -> None:
+        with self._cond:
+            self._in_flight = max(0, self._in_flight - 1)
+            self._cond.notify_all()
+
+    def snapshot(self) -> ConcurrencySnapshot:
+        with self._cond:
+            latencies = sorted(self._latencies)
+            return ConcurrencySnapshot(
+                limit=self.limit,
+                peak_in_flight=self._peak_in_flight,
+                requests=self._requests,
+                errors=self._errors,
+                throttled=self._throttled,
+                latency_p50_ms=_percentile(latencies, 0.50) * 1000,
+                latency_p95_ms=_percentile(latencies, 0.95) * 1000,
+            )
+
+
+def _percentile(sorted_values: list[float], fraction: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = math.ceil(fraction * len(sorted_values)) - 1
+    return sorted_values[min(len(sorted_values) - 1, max(0, index))]
+
+
+def _retry_after_seconds(response: requests.Response) -> float | None:
+    raw = response.headers.get("Retry-After")
+    if not raw:
+        return None
+    raw = raw.strip()
+    try:
+        seconds = float(raw)
+    except ValueError:
+        try:
+            retry_at = parsedate_to_datetime(raw)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        seconds = (retry_at - datetime.now(timezone.utc)).total_seconds()
+    return min(max(0.0, seconds), MAX_RETRY_AFTER_SECONDS)
+
+
+class PoliteSession(requests.Session):
+    def __init__(
+        self,
+        *,
+        retries: int,
+        backoff_seconds: float,
+        backoff_max_seconds: float,
+        rate_limiter: HostRateLimiter,
+        pool_size: int,
+    ):
+        super().__init__()
+        self.retries = max(0, retries)
+        self.backoff_seconds = backoff_seconds
+        self.backoff_max_seconds = backoff_max_seconds
+        self.rate_limiter = rate_limiter
+        self.concurrency_limiters: dict[str, AdaptiveConcurrencyLimiter] = {}
+        adapter = HTTPAdapter(
+            pool_connections=pool_size,
+            pool_maxsize=pool_size,
+            max_retries=0,
+        )
+        self.mount("https://", adapter)
+        self.mount("http://", adapter)
+
+    def _backoff(self, attempt: int) -> float:
+        # full jitter: [0, min(max, base * 2^attempt)]
+        ceiling = min(self.backoff_max_seconds, self.backoff_seconds * (2**attempt))
+        return random.uniform(0, ceiling)
+
+    def set_concurrency_limiter(
+        self, host: str, limiter: AdaptiveConcurrencyLimiter
+    ) -> None:
+        self.concurrency_limiters[host] = limiter
+
+    def request(self, method, url, *args, **kwargs):  # type: ignore[override]
+        method_upper = str(method).upper()
+        idempotent = method_upper in IDEMPOTENT_METHODS
+        host = urlparse(url).hostname or ""
+        limiter = self.concurrency_limiters.get(host)
+
+        attempt = 0
+        while True:
+            self.rate_limiter.acquire(host)
+            if limiter is not None:
+                limiter.acquire()
+            started = time.monotonic()
+            try:
+                response = super().request(method, url, *args, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as exc:
+                if limiter is not None:
+                    limiter.release(time.monotonic() - started, status=None, error=True)
+                # POST 는 요청이 서버에 닿지 않은 연결 실패만 재시도한다.
+                retryable = idempotent or isinstance(exc, requests.ConnectTimeout)
+                if attempt >= self.retries or not retryable:
+                    raise
+                delay = self._backoff(attempt)
+                LOGGER.warning(
+                    "HTTP 재시도 %s/%s (%s %s): %s, %.1fs 후",
+                    attempt + 1,
+                    self.retries,
+                    method_upper,
+                    host,
+                    exc.__class__.__name__,
+                    delay,
+                )
+            except BaseException:
+                if limiter is not None:
+                    limiter.cancel()
+                raise
+            else:
+                status = response.status_code
+                retryable = status in RETRY_STATUSES and (idempotent or status == 429)
+                if limiter is not None:
+                    if kwargs.get("stream") and not retryable:
+                        # 스트리밍 응답은 본문을 다 받고 닫을 때까지 슬롯을 잡고 있되,
+                        # 지연은 헤더 수신까지로 잰다(큰 PDF 가 혼잡 신호로 잡히지 않게).
+                        _release_on_close(response, limiter, time.monotonic() - started)
+                    else:
+                        limiter.release(time.monotonic() - started, status=status)
+                if attempt >= self.retries or not retryable:
+                    return response
+                retry_after = _retry_after_seconds(response)
+                delay = retry_after if retry_after is not None else self._backoff(attempt)
+                LOGGER.warning(
+                    "HTTP 재시도 %s/%s (%s %s): status=%s, %.1fs 후",
+                    attempt + 1,
+                    self.retries,
+                    method_upper,
+                    host,
+                    status,
+                    delay,
+                )
+                response.close()
+
+            time.sleep(delay)
+            attempt += 1
+
+
+def _release_on_close(
+    response: requests.Response,
+    limiter: AdaptiveConcurrencyLimiter,
+    latency: float,
+) -> None:
+    close = response.close
+    released = False
+
+    def close_and_release() -> None:
+        nonlocal released
+        try:
+            close()
+        finally:
+            if not released:
+                released = True
+                limiter.release(latency, status=response.status_code)
+
+    response.close = close_and_release  # type: ignore[method-assign]
+
+
+def create_session(settings: Settings, *, pool_size: int | None = None) -> PoliteSession:
+    session = PoliteSession(
+        retries=settings.http_retries,
+        backoff_seconds=settings.http_backoff_seconds,
+        backoff_max_seconds=max(settings.http_backoff_seconds, 30.0),
+        rate_limiter=HostRateLimiter(
+            settings.http_rate_per_second,
+            burst=max(1, int(settings.http_rate_per_second)),
+        ),
+        pool_size=pool_size or max(16, settings.workers * 2),
+    )
+    session.headers.update({"User-Agent": settings.user_agent})
+    return session
+
+
+def create_concurrency_limiter(settings: Settings) -> AdaptiveConcurrencyLimiter:
+    return AdaptiveConcurrencyLimiter(
+        initial_limit=min(2, settings.max_concurrency),
+        max_limit=settings.max_concurrency,
+    )
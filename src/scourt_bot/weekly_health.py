@@ -10,11 +10,10 @@ from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from typing import Any
 from urllib.parse import quote
-
-import requests
 from zoneinfo import ZoneInfo
 
 from .config import Settings
+from .transport import create_session
 
 API_BASE = "https://api.github.com"
 SUMMARY_RE = re.compile(
@@ -54,7 +53,7 @@ class WeeklyHealthReporter:
         self.workflow_ref = workflow_ref
         self.github_token = github_token
         self.webhook_url = webhook_url
-        self.session = requests.Session()
+        self.session = create_session(settings)
         self.session.headers.update(
             {
                 "Accept": "application/vnd.github+json",
@@ -63,6 +62,8 @@ class WeeklyHealthReporter:
                 "User-Agent": "scourt-weekly-health/0.1",
             }
         )
+        # GitHub 토큰 헤더가 웹훅으로 새지 않도록 세션을 분리한다.
+        self.webhook_session = create_session(settings)
         self.kst = ZoneInfo(self.settings.timezone)
 
     def fetch_report(self) -> dict[str, Any]:
@@ -173,7 +174,7 @@ class WeeklyHealthReporter:
             print(json.dumps(payload, ensure_ascii=False, indent=2))
             return
 
-        response = requests.post(self.webhook_url, json=payload, timeout=20)
+        response = self.webhook_session.post(self.webhook_url, json=payload, timeout=20)
         response.raise_for_status()
 
     def _fetch_runs(self) -> list[dict[str, Any]]:
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import pytest
+
+benchmark = pytest.importorskip("scourt_bot.benchmark")
+
+from scourt_bot.article_writer import KEYWORDS, NOISE_TOKENS, SentenceMatcher  # noqa: E402
+
+
+def test_matcher_counts_keywords_hidden_by_earlier_match():
+    matcher = SentenceMatcher(KEYWORDS, NOISE_TOKENS)
+    # "파기각" 에서 정규식은 "파기"만 매칭하므로 "기각"은 따로 확인해야 한다.
+    assert matcher.scan("원심판결을 파기각하였다") == (3, False)
+    assert matcher.scan("공보관실 전화 문의") == (0, True)
+
+
+def test_matcher_matches_substring_scan():
+    # 두 방식의 판정이 하나라도 다르면 benchmark_writer 가 AssertionError 를 낸다.
+    rates = benchmark.benchmark_writer(benchmark.synthetic_judgment(5, seed=1), repeat=1)
+    assert rates["sentences"] > 0
+
+
+def test_rank_key_points_stops_reading_at_sentence_cap(monkeypatch):
+    from scourt_bot import article_writer
+
+    monkeypatch.setattr(article_writer, "SUMMARY_MAX_SENTENCES", 30)
+    # 순위 계산이 예산을 넘겨도(None) 읽은 범위는 문장 수로만 정해진다.
+    monkeypatch.setattr(article_writer, "rank_sentences", lambda *args, **kwargs: None)
+    page = " ".join(f"대법원은 {index}번째 사건의 상고를 기각하였다." for index in range(20))
+    read: list[int] = []
+
+    def pages():
+        for index in range(10):
+            read.append(index)
+            yield page
+
+    matcher = SentenceMatcher(KEYWORDS, NOISE_TOKENS)
+    points = article_writer._rank_key_points(matcher, pages(), 3, budget_seconds=0.0)
+    assert len(points) == 3
+    assert read == [0, 1]
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("bs4")
+pytest.importorskip("lxml")
+scourt_client = pytest.importorskip("scourt_bot.scourt_client")
+
+from scourt_bot.html_parser import HtmlParserBackend, LxmlParserBackend  # noqa: E402
+from scourt_bot.models import NoticeSummary  # noqa: E402
+
+FIXTURES = Path(__file__).parent / "fixtures"
+LIST_URL = "https://www.scourt.go.kr/portal/news/NewsListAction.work"
+
+
+class _FakeSession:
+    # URL 과 상관없이 fixture 본문(사이트와 같은 EUC-KR)을 돌려준다.
+    def __init__(self, html: str):
+        self.headers: dict[str, str] = {}
+        self.content = html.encode("euc-kr")
+
+    def get(self, url, params=None, timeout=None):
+        return SimpleNamespace(content=self.content, raise_for_status=lambda: None)
+
+
+def _client(backend: HtmlParserBackend, fixture: str):
+    settings = SimpleNamespace(
+        html_parser=backend.name,
+        user_agent="scourt-bot-test",
+        gubun="6",
+        list_url=LIST_URL,
+        timeout_seconds=5,
+    )
+    session = _FakeSession((FIXTURES / fixture).read_text(encoding="utf-8"))
+    return scourt_client.ScourtClient(settings, session, parser=backend)
+
+
+def _parse_list(backend: HtmlParserBackend) -> list[NoticeSummary]:
+    return _client(backend, "news_list.html").fetch_news_list()
+
+
+def _parse_detail(backend: HtmlParserBackend, summary: NoticeSummary):
+    return _client(backend, "news_detail.html").fetch_notice_detail(summary)
+
+
+@pytest.mark.parametrize(
+    "parse",
+    [
+        pytest.param(lambda backend: _parse_list(backend), id="list"),
+        pytest.param(
+            lambda backend: _parse_detail(backend, _parse_list(HtmlParserBackend())[0]),
+            id="detail",
+        ),
+    ],
+)
+def test_lxml_backend_matches_html_parser(parse):
+    expected = parse(HtmlParserBackend())
+    assert expected
+    assert parse(LxmlParserBackend()) == expected
+
+
+def test_fixture_parse_result():
+    notices = _parse_list(HtmlParserBackend())
+    assert [(notice.notice_id, notice.title) for notice in notices] == [
+        ("9812", "대법원 2024다12345 통상임금 사건 보도자료"),
+        ("9807", "대법원 전원합의체 판결 선고"),
+    ]
+
+    detail = _parse_detail(HtmlParserBackend(), notices[0])
+    assert detail.title == "대법원 2024다12345 통상임금 사건 보도자료"
+    assert detail.pdf_url is not None and detail.pdf_url.endswith("seqnum=9812")
+    assert ".pdf" in detail.pdf_url
+    assert len(detail.attachment_urls) == 2
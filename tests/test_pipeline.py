@@ -0,0 +1,286 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from scourt_bot.models import ArticleDraft, NoticeDetail, NoticeSummary
+from scourt_bot.pdf_archive import PdfArchive
+from scourt_bot.storage import StateStore
+
+pipeline = pytest.importorskip("scourt_bot.pipeline")
+
+NOW = "2026-03-01T00:00:00+09:00"
+EARLIER = "2026-01-01T00:00:00+09:00"
+
+
+def _detail(attachment_urls: list[str], pdf_url: str | None) -> NoticeDetail:
+    return NoticeDetail(
+        notice_id="1",
+        title="보도자료",
+        body_text="",
+        detail_url="https://example.invalid/detail/1",
+        attachment_urls=attachment_urls,
+        pdf_url=pdf_url,
+    )
+
+
+def test_attachment_urls_without_pdf():
+    detail = _detail(
+        [
+            "https://example.invalid/a.hwpx",
+            "https://example.invalid/b.zip",
+            "https://example.invalid/a.hwpx",
+        ],
+        pdf_url=None,
+    )
+    assert pipeline._attachment_urls(detail) == [
+        "https://example.invalid/a.hwpx",
+        "https://example.invalid/b.zip",
+    ]
+
+
+def test_attachment_urls_puts_pdf_first():
+    detail = _detail(
+        [
+            "https://example.invalid/a.hwpx",
+            "https://example.invalid/c.pdf",
+            "https://example.invalid/b.zip",
+        ],
+        pdf_url="https://example.invalid/c.pdf",
+    )
+    assert pipeline._attachment_urls(detail) == [
+        "https://example.invalid/c.pdf",
+        "https://example.invalid/a.hwpx",
+        "https://example.invalid/b.zip",
+    ]
+
+
+def _summary(notice_id: str) -> NoticeSummary:
+    return NoticeSummary(
+        notice_id=notice_id,
+        number=notice_id,
+        title=f"보도자료 {notice_id}",
+        posted_date="2026-01-01",
+        detail_url=f"https://example.invalid/detail/{notice_id}",
+    )
+
+
+class _FakeClient:
+    # 게시판별 목록 페이지(최신 글이 앞)를 돌려주고 요청한 페이지를 기록한다.
+    def __init__(self, boards: dict[str, list[list[str]]]):
+        self.boards = boards
+        self.fetched: list[tuple[str, int]] = []
+
+    def iter_news_pages(self, gubun: str):
+        for index, page in enumerate(self.boards.get(gubun, []), start=1):
+            self.fetched.append((gubun, index))
+            yield index, [_summary(notice_id) for notice_id in page]
+
+
+class _FakeNotifier:
+    def __init__(self, failing: set[str] = frozenset()):
+        self.failing = set(failing)
+        self.sent: list[str] = []
+
+    def send(self, article: ArticleDraft) -> None:
+        notice_id = article.detail_url.rsplit("/", 1)[-1]
+        if notice_id in self.failing:
+            raise RuntimeError(f"전송 실패: {notice_id}")
+        self.sent.append(notice_id)
+
+
+def _prepare(summary, prev=None, *, skip_unchanged=False):
+    # 상세/첨부 수집 대신 고정 기사를 만든다. 이미 보낸 글은 '변경 없음'으로 본다.
+    if skip_unchanged and prev is not None and prev.get("sent_at"):
+        return None
+    detail = NoticeDetail(
+        notice_id=summary.notice_id,
+        title=summary.title,
+        body_text="본문",
+        detail_url=summary.detail_url,
+        attachment_urls=[],
+        pdf_url=None,
+    )
+    article = ArticleDraft(
+        headline=summary.title,
+        body="본문",
+        posted_date=summary.posted_date,
+        detail_url=summary.detail_url,
+        pdf_url=None,
+        collected_at=NOW,
+    )
+    return pipeline._PreparedNotice(
+        detail=detail,
+        article=article,
+        pdf_hash="",
+        content_hash=summary.notice_id,
+        detail_hash=summary.notice_id,
+        attachment_signature="",
+    )
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = StateStore(tmp_path / "state.db")
+    yield store
+    store.close()
+
+
+def _pipeline(store: StateStore, client: _FakeClient, notifier: _FakeNotifier | None = None):
+    # 네트워크 없이 _run_board/_collect_notices 의 기준선 처리만 본다.
+    scourt = pipeline.ScourtPipeline.__new__(pipeline.ScourtPipeline)
+    scourt.settings = SimpleNamespace(
+        gubun="6",
+        bootstrap_skip_send=True,
+        workers=1,
+        max_pages_cap=5,
+        teams_digest_threshold=0,
+        teams_digest_max_sections=10,
+    )
+    scourt.store = store
+    scourt.client = client
+    scourt.notifier = notifier or _FakeNotifier()
+    scourt._prepare = _prepare
+    return scourt
+
+
+def _run_board(scourt, gubun: str = "6", now_iso: str = NOW):
+    return scourt._run_board(
+        gubun,
+        force=False,
+        dry_run=False,
+        pages=1,
+        workers=1,
+        now_iso=now_iso,
+    )
+
+
+def test_bootstrap_sets_watermark_without_sending(store):
+    notifier = _FakeNotifier()
+    scourt = _pipeline(store, _FakeClient({"6": [["103", "102", "101"]]}), notifier)
+
+    stats = _run_board(scourt)
+
+    assert stats.skipped == 3
+    assert notifier.sent == []
+    assert store.get_last_seen_notice_id("6") == 103
+
+
+def test_paging_stops_at_watermark_page(store):
+    store.set_last_seen_notice_id(102, EARLIER, "6")
+    client = _FakeClient({"6": [["105", "104"], ["103", "102"], ["101", "100"]]})
+    notifier = _FakeNotifier()
+    scourt = _pipeline(store, client, notifier)
+
+    stats = _run_board(scourt)
+
+    assert client.fetched == [("6", 1), ("6", 2)]
+    assert notifier.sent == ["103", "104", "105"]
+    assert stats.sent == 3
+    assert store.get_last_seen_notice_id("6") == 105
+
+
+def test_failed_send_keeps_watermark_below_unsent_notice(store):
+    store.set_last_seen_notice_id(100, EARLIER, "6")
+    client = _FakeClient({"6": [["103", "102", "101", "100"]]})
+    notifier = _FakeNotifier(failing={"102"})
+    scourt = _pipeline(store, client, notifier)
+
+    stats = _run_board(scourt)
+    assert (stats.sent, stats.failed) == (2, 1)
+    assert notifier.sent == ["101", "103"]
+    assert store.get_last_seen_notice_id("6") == 101
+    assert [notice["notice_id"] for notice in store.list_unsent_notices()] == ["102"]
+
+    # 다음 실행은 실패한 글만 다시 보내고, 이미 보낸 103 은 '변경 없음'으로 건너뛴다.
+    notifier.failing.clear()
+    stats = _run_board(scourt)
+    assert (stats.sent, stats.failed, stats.unchanged) == (1, 0, 1)
+    assert notifier.sent == ["101", "103", "102"]
+    assert store.get_last_seen_notice_id("6") == 103
+    assert store.list_unsent_notices() == []
+
+
+def test_legacy_watermark_only_applies_to_default_board(store):
+    # 게시판별 키 도입 전 DB: 단일 키만 있다.
+    store.set_last_seen_notice_id(102, EARLIER)
+    client = _FakeClient({"6": [["104", "103", "102"]], "7": [["502", "501"]]})
+    notifier = _FakeNotifier()
+    scourt = _pipeline(store, client, notifier)
+
+    stats = _run_board(scourt, "6")
+    assert notifier.sent == ["103", "104"]
+    assert stats.skipped == 1
+    assert store.get_last_seen_notice_id("6") == 104
+
+    # 다른 게시판은 옛 기준선을 이어받지 않고 초기 기준선 모드로 시작한다.
+    stats = _run_board(scourt, "7")
+    assert notifier.sent == ["103", "104"]
+    assert stats.skipped == 2
+    assert store.get_last_seen_notice_id("7", legacy_fallback=False) == 502
+    assert store.get_last_seen_notice_id(None) == 102
+
+
+def test_unchanged_notice_touches_archived_pdf(store):
+    store.upsert_notice(
+        notice_id="101",
+        title="보도자료",
+        posted_date="2026-01-01",
+        detail_url="https://example.invalid/detail/101",
+        pdf_url="https://example.invalid/101.pdf",
+        pdf_hash="a" * 64,
+        content_hash="h",
+        article_text="본문",
+        timestamp_iso=EARLIER,
+    )
+    store.mark_sent("101", EARLIER)
+    store.record_pdf_file("a" * 64, size=10, stored_size=8, timestamp_iso=EARLIER)
+    store.set_last_seen_notice_id(100, EARLIER, "6")
+
+    scourt = _pipeline(store, _FakeClient({"6": [["101"]]}))
+    stats = _run_board(scourt)
+
+    assert stats.unchanged == 1
+    assert store.list_pdf_files()[0]["last_used_at"] == NOW
+
+
+def test_gc_keeps_every_attachment_of_unchanged_notice(store, tmp_path):
+    now = datetime.now(ZoneInfo("Asia/Seoul"))
+    stale = (now - timedelta(days=30)).isoformat()
+    archive = PdfArchive(tmp_path / "pdfs")
+    hashes = ["a" * 64, "b" * 64]
+    store.upsert_notice(
+        notice_id="101",
+        title="보도자료",
+        posted_date="2026-01-01",
+        detail_url="https://example.invalid/detail/101",
+        pdf_url="https://example.invalid/101.pdf",
+        pdf_hash=hashes[0],
+        content_hash="h",
+        article_text="본문",
+        timestamp_iso=stale,
+    )
+    store.set_notice_attachments("101", hashes)
+    store.mark_sent("101", stale)
+    for sha256 in hashes:
+        stored = archive.put(sha256, b"%PDF-1.4 " + sha256.encode())
+        store.record_pdf_file(
+            sha256, size=stored.size, stored_size=stored.stored_size, timestamp_iso=stale
+        )
+    store.set_last_seen_notice_id(100, stale, "6")
+
+    scourt = _pipeline(store, _FakeClient({"6": [["101"]]}))
+    scourt.settings.timezone = "Asia/Seoul"
+    scourt.settings.pdf_dir = archive.root
+    scourt.pdf_service = SimpleNamespace(archive=archive)
+    assert scourt.gc_pdfs(max_mb=0, max_age_days=7, dry_run=True).removed == 2
+
+    stats = _run_board(scourt, now_iso=now.isoformat())
+    assert stats.unchanged == 1
+
+    gc = scourt.gc_pdfs(max_mb=0, max_age_days=7)
+    assert (gc.removed, gc.kept) == (0, 2)
+    assert all(archive.exists(sha256) for sha256 in hashes)
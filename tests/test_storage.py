@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from scourt_bot.storage import StateStore
+
+TIMESTAMP = "2026-01-01T00:00:00+09:00"
+
+
+def _upsert(store: StateStore, notice_id: str, article_text: str, **kwargs) -> None:
+    store.upsert_notice(
+        notice_id=notice_id,
+        title=kwargs.pop("title", f"보도자료 {notice_id}"),
+        posted_date="2026-01-01",
+        detail_url=f"https://example.invalid/{notice_id}",
+        pdf_url=None,
+        pdf_hash=None,
+        content_hash=notice_id,
+        article_text=article_text,
+        timestamp_iso=kwargs.pop("timestamp_iso", TIMESTAMP),
+        **kwargs,
+    )
+
+
+def _open_store(path: Path) -> StateStore:
+    store = StateStore(path, compress_text=True)
+    if not store.fts_enabled:
+        store.close()
+        pytest.skip("FTS5 trigram 을 지원하지 않는 SQLite")
+    return store
+
+
+@pytest.fixture
+def store(tmp_path: Path):
+    store = _open_store(tmp_path / "state.db")
+    yield store
+    store.close()
+
+
+def test_raw_connection_can_write_notices(tmp_path: Path):
+    store = _open_store(tmp_path / "state.db")
+    _upsert(store, "1", "통상임금 고정성 " * 40)
+    store.close()
+
+    # scourt_text() 를 등록하지 않은 연결(sqlite3 CLI, 벤치마크)도 notices 에 쓸 수 있어야 한다.
+    with sqlite3.connect(str(tmp_path / "state.db")) as conn:
+        conn.execute(
+            """
+            INSERT INTO notices (
+                notice_id, title, posted_date, detail_url, content_hash,
+                article_text, created_at, updated_at
+            )
+            VALUES ('2', '외부 입력 보도자료', '2026-01-02', 'u', 'h', '손해배상 책임', ?, ?)
+            """,
+            (TIMESTAMP, TIMESTAMP),
+        )
+        conn.execute(
+            "UPDATE notices SET sent_at = ?, title = '고친 제목' WHERE notice_id = '1'",
+            (TIMESTAMP,),
+        )
+        conn.execute("DELETE FROM notices WHERE notice_id = '2'")
+        conn.execute(
+            """
+            INSERT INTO notices (
+                notice_id, title, posted_date, detail_url, content_hash,
+                article_text, created_at, updated_at
+            )
+            VALUES ('3', '외부 입력 보도자료', '2026-01-03', 'u', 'h', '손해배상 책임', ?, ?)
+            """,
+            (TIMESTAMP, TIMESTAMP),
+        )
+    conn.close()
+
+    reopened = _open_store(tmp_path / "state.db")
+    try:
+        reopened.rebuild_search_index()
+        assert [hit.notice_id for hit in reopened.search("손해배상")] == ["3"]
+        assert [hit.notice_id for hit in reopened.search("고친 제목")] == ["1"]
+        assert [hit.notice_id for hit in reopened.search("통상임금")] == ["1"]
+    finally:
+        reopened.close()
+
+
+def test_upsert_keeps_search_index_in_sync(store: StateStore):
+    _upsert(store, "1", "통상임금 고정성 " * 40)
+    assert [hit.notice_id for hit in store.search("고정성")] == ["1"]
+
+    _upsert(store, "1", "해고무효 확인 " * 40, timestamp_iso="2026-01-02T00:00:00+09:00")
+    assert store.search("고정성") == []
+    assert [hit.notice_id for hit in store.search("해고무효")] == ["1"]
+
+    with store.unit_of_work():
+        _upsert(store, "2", "해고무효 " * 40)
+    assert {hit.notice_id for hit in store.search("해고무효")} == {"1", "2"}
+
+
+def test_compact_prunes_index_and_skips_vacuum_below_threshold(store: StateStore):
+    _upsert(store, "1", "통상임금 고정성 " * 40)
+    store.mark_sent("1", TIMESTAMP)
+
+    stats = store.compact(prune_before="2026-02-01", min_free_ratio=1.0)
+    assert stats.pruned == 1
+    assert not stats.vacuumed
+    # 본문을 비운 글은 제목으로만 찾는다.
+    assert store.search("고정성") == []
+    assert [hit.notice_id for hit in store.search("보도자료")] == ["1"]
+
+    assert store.compact().vacuumed
+    assert [hit.notice_id for hit in store.search("보도자료")] == ["1"]
+
+
+def test_list_unsent_notices(tmp_path: Path):
+    store = StateStore(tmp_path / "state.db")
+    try:
+        for notice_id, posted_date in (("1", "01-01"), ("2", "01-03"), ("3", "01-02")):
+            store.upsert_notice(
+                notice_id=notice_id,
+                title=f"보도자료 {notice_id}",
+                posted_date=f"2026-{posted_date}",
+                detail_url=f"https://example.invalid/{notice_id}",
+                pdf_url=None,
+                pdf_hash=None,
+                content_hash=notice_id,
+                article_text="본문",
+                timestamp_iso=TIMESTAMP,
+            )
+        store.mark_sent("2", TIMESTAMP)
+
+        unsent = store.list_unsent_notices()
+        assert [notice["notice_id"] for notice in unsent] == ["3", "1"]
+        assert [notice["notice_id"] for notice in store.list_unsent_notices(limit=1)] == ["3"]
+    finally:
+        store.close()
+
+
+def test_touch_notice_pdfs_only_moves_forward(tmp_path: Path):
+    store = StateStore(tmp_path / "state.db")
+    try:
+        _upsert(store, "1", "본문")
+        store.set_notice_attachments("1", ["a" * 64, "b" * 64])
+        for sha256 in ("a" * 64, "b" * 64, "c" * 64):
+            store.record_pdf_file(sha256, size=10, stored_size=8, timestamp_iso="2026-01-02")
+        store.touch_notice_pdfs("1", "2026-03-01")
+        store.touch_notice_pdfs("1", "2026-02-01")
+        assert [(row["sha256"], row["last_used_at"]) for row in store.list_pdf_files()] == [
+            ("c" * 64, "2026-01-02"),
+            ("a" * 64, "2026-03-01"),
+            ("b" * 64, "2026-03-01"),
+        ]
+    finally:
+        store.close()
+
+
+def test_pdf_text_is_keyed_by_attachment_hash(store: StateStore):
+    store.upsert_notice(
+        notice_id="1",
+        title="보도자료 1",
+        posted_date="2026-01-01",
+        detail_url="https://example.invalid/1",
+        pdf_url="https://example.invalid/1.pdf",
+        pdf_hash="a" * 64,
+        content_hash="1",
+        article_text="본문",
+        pdf_text="대표 첨부 " * 40,
+        timestamp_iso=TIMESTAMP,
+    )
+    store.record_pdf_text("b" * 64, "추가 첨부 " * 40, TIMESTAMP)
+
+    # 추가 첨부 텍스트도 sha256 으로 찾고, 예전 대표 첨부 텍스트는 notices 에서 찾는다.
+    assert store.get_pdf_text("b" * 64) == "추가 첨부 " * 40
+    assert store.get_pdf_text("a" * 64) == "대표 첨부 " * 40
+    assert store.get_pdf_text("c" * 64) is None
+
+    store.compact(prune_before="2026-02-01", min_free_ratio=1.0)
+    assert store.get_pdf_text("b" * 64) is None